@@ -0,0 +1,133 @@
+"""
+Benchmark: build the ``laps`` silver table with the vectorized and the row-by-row builders.
+
+Generates race-sized synthetic ``TimingData`` (20 drivers, 57 laps, several
+speed trap, position, gap and pit updates per sector), checks that both
+builders return the same table and prints the best of ``--repeat`` runs.
+
+    python benchmarks/laps_table.py [--drivers 20] [--laps 57] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+import pandas as pd
+
+from livef1.config import configure
+from livef1.data_processing.silver_functions import generate_laps_table
+
+TIMING_COLS = [
+    "NumberOfLaps", "LastLapTime_Value", "InPit", "PitOut",
+    "Sectors_0_Value", "Sectors_1_Value", "Sectors_2_Value",
+    "Sectors_0_PreviousValue", "Sectors_1_PreviousValue", "Sectors_2_PreviousValue",
+    "Speeds_I1_Value", "Speeds_I2_Value", "Speeds_FL_Value", "Speeds_ST_Value",
+    "Position", "GapToLeader", "IntervalToPositionAhead_Value", "RacingNumber", "Stopped", "_deleted",
+]
+
+
+def synthetic_timing(n_drivers, n_laps, seed=0):
+    """Timing updates of a race, as they appear in the parsed TimingData topic."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for driver in range(1, n_drivers + 1):
+        drv = str(driver)
+        t = 60 + rng.uniform(0, 5)
+        for lap in range(n_laps):
+            sectors = rng.uniform(25, 35, 3).round(3)
+            for k in range(3):
+                for _ in range(rng.integers(3, 8)):
+                    row = {"DriverNo": drv, "t": t + rng.uniform(0, sectors[k])}
+                    field = rng.integers(0, 3)
+                    if field == 0:
+                        row[f"Speeds_{rng.choice(['I1', 'I2', 'FL', 'ST'])}_Value"] = str(rng.integers(200, 330))
+                    elif field == 1:
+                        row["Position"] = str(rng.integers(1, n_drivers + 1))
+                    else:
+                        row["GapToLeader"] = f"+{rng.uniform(0, 30):.3f}"
+                        row["IntervalToPositionAhead_Value"] = f"+{rng.uniform(0, 3):.3f}"
+                    rows.append(row)
+                if k == 0 and lap in (n_laps // 3, 2 * n_laps // 3) and driver % 2:
+                    rows.append({"DriverNo": drv, "t": t + 1, "InPit": True})
+                    rows.append({"DriverNo": drv, "t": t + 20, "PitOut": True})
+                t += sectors[k]
+                row = {"DriverNo": drv, "t": t, f"Sectors_{k}_Value": f"{sectors[k]:.3f}"}
+                if k == 2:
+                    row["LastLapTime_Value"] = f"1:{sectors.sum() - 60:06.3f}"
+                    row["NumberOfLaps"] = lap + 1
+                rows.append(row)
+    df = pd.DataFrame(sorted(rows, key=lambda row: row["t"]))
+    df["timestamp"] = pd.to_timedelta(df.pop("t"), unit="s")
+    df["SessionKey"] = 9465
+    for col in TIMING_COLS:
+        if col not in df:
+            df[col] = np.nan
+    return df
+
+
+def laps_inputs(n_drivers):
+    session = MagicMock()
+    session.type = "Race"
+    session.first_datetime = pd.Timestamp("2024-03-02 15:00:00")
+    session.session_start_datetime = session.first_datetime
+    session.drivers = {}
+    session.topic_names_info = {}
+    df_rcm = pd.DataFrame({"Category": ["Flag"], "Message": ["GREEN LIGHT - PIT EXIT OPEN"]})
+    df_tyre = pd.DataFrame({
+        "timestamp": ["00:01:00"] * n_drivers,
+        "DriverNo": [str(d) for d in range(1, n_drivers + 1)],
+        "Compound": ["MEDIUM"] * n_drivers,
+        "New": [True] * n_drivers,
+        "TotalLaps": [0] * n_drivers,
+    })
+    df_track = pd.DataFrame({"timestamp": pd.to_timedelta(["00:00:10", "00:30:00"]), "Status": ["1", "2"], "Message": ["AllClear", "Yellow"]})
+    return session, df_rcm, df_tyre, df_track
+
+
+def run(df_exp, inputs, vectorized, repeat):
+    session, df_rcm, df_tyre, df_track = inputs
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        configure(vectorized_laps=vectorized)
+    try:
+        best, laps = None, None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            laps = generate_laps_table(session, df_exp.copy(), df_rcm, df_tyre.copy(), df_track)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, laps
+    finally:
+        configure(vectorized_laps=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--drivers", type=int, default=20)
+    parser.add_argument("--laps", type=int, default=57)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df_exp = synthetic_timing(args.drivers, args.laps)
+    inputs = laps_inputs(args.drivers)
+    print(f"TimingData rows: {len(df_exp)} ({args.drivers} drivers, {args.laps} laps)")
+
+    vectorized, laps = run(df_exp, inputs, True, args.repeat)
+    row_by_row, expected = run(df_exp, inputs, False, args.repeat)
+
+    def normalized(df):
+        return df.astype(object).where(df.notna(), None)
+
+    pd.testing.assert_frame_equal(normalized(laps), normalized(expected))
+    print(f"laps rows: {len(laps)}, tables are identical")
+    print(f"row-by-row: {row_by_row:.3f} s")
+    print(f"vectorized: {vectorized:.3f} s ({row_by_row / vectorized:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,7 @@ from .data_processing import (
 from .utils.helper import *
 from .adapters.livetimingf1_adapter import LivetimingF1adapters
 from .config import configure
+from .utils.cache import clear_metadata_cache
 from .utils.logger import set_log_level
 
 import warnings
@@ -33,6 +34,7 @@ __version__ = "1.2.7"
 
 __all__ = [
     'configure',
+    'clear_metadata_cache',
     'set_log_level',
     'get_season',
     'get_meeting',
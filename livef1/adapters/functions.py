@@ -1,9 +1,12 @@
 # Standard Library Imports
+import copy
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 from pandas import to_datetime
 
 # Internal Project Imports
 from .livetimingf1_adapter import livetimingF1_request
+from ..utils.cache import metadata_cache
 from ..utils.exceptions import livef1Exception
 from ..utils.helper import relocate_tz
 from .jolpicaf1_adapter import jolpica_client
@@ -147,13 +150,44 @@ def _norm_schedule_str(value: object | None) -> str:
     return str(value).strip().casefold()
 
 
+def _fetch_ok(result) -> bool:
+    return result[1]
+
+
 def fetch_jolpica_season_races_list(season_identifier: int) -> tuple[list, bool]:
-    """Return ``(races, success)`` from Jolpica ``get_races`` only."""
-    try:
-        races = jolpica_client.query().season(season_identifier).get_races().data.races
-        return (list(races) if races is not None else []), True
-    except Exception:
-        return [], False
+    """Return ``(races, success)`` from Jolpica ``get_races`` only. Successful results are cached."""
+    def fetch():
+        try:
+            races = jolpica_client.query().season(season_identifier).get_races().data.races
+            return (list(races) if races is not None else []), True
+        except Exception:
+            return [], False
+
+    return metadata_cache.get_or_fetch(("jolpica_races", season_identifier), fetch, cache_if=_fetch_ok)
+
+
+def fetch_jolpica_seasons() -> list:
+    """Return the Jolpica season list (``get_seasons``), cached."""
+    return metadata_cache.get_or_fetch(
+        ("jolpica_seasons",), lambda: list(jolpica_client.get_seasons(limit=100).data.seasons)
+    )
+
+
+def fetch_jolpica_season_data(season_identifier: int, query: str):
+    """
+    Return the ``data`` of a Jolpica season query, cached.
+
+    Parameters
+    ----------
+    season_identifier : :class:`int`
+        The season year.
+    query : :class:`str`
+        Name of the query method, e.g. ``"get_drivers"`` or ``"get_driver_standings"``.
+    """
+    return metadata_cache.get_or_fetch(
+        ("jolpica", season_identifier, query),
+        lambda: getattr(jolpica_client.query().season(season_identifier), query)(limit=100).data,
+    )
 
 
 def jolpica_season_races_fetch_ok(season_identifier: int) -> bool:
@@ -274,7 +308,10 @@ def jolpica_session_available_on_race(
     """
     if race is None:
         return False
-    d = _jolpica_race_dict(race)
+    return _jolpica_session_in_keys(_jolpica_race_dict(race), session_name, session_type, session_number)
+
+
+def _jolpica_session_in_keys(d, session_name, session_type, session_number) -> bool:
     sn = _norm_schedule_str(session_name)
     st = _norm_schedule_str(session_type)
     num = session_number
@@ -309,20 +346,142 @@ def jolpica_session_available_on_race(
     return False
 
 
+_ANY_NUMBER = object()
+
+
+class AvailabilityIndex:
+    """
+    Normalized lookup tables for the availability checks of one season.
+
+    The Livetiming season index and the Jolpica race list are indexed once by
+    normalized meeting name, and the sessions of each Livetiming meeting by
+    normalized name and by type and number. Each check is then a few
+    dictionary lookups instead of a scan of the season payload. Results match
+    :func:`livetiming_meeting_in_season_index`,
+    :func:`livetiming_session_in_season_index`, :func:`jolpica_meeting_in_races`,
+    :func:`jolpica_find_race_for_meeting` and
+    :func:`jolpica_session_available_on_race`.
+
+    Parameters
+    ----------
+    livetiming_payload : dict, optional
+        Livetiming season ``Index.json`` payload.
+    races : list, optional
+        Jolpica races of the season.
+    """
+
+    def __init__(self, livetiming_payload: dict | None = None, races: list | None = None):
+        self._meetings = {}     # meeting name -> (session names, {session type: session numbers})
+        self._races = {}        # race name -> race
+        self._race_keys = {}    # race name -> keys of the race dict, built on first use
+
+        meetings = livetiming_payload.get("Meetings") if isinstance(livetiming_payload, dict) else None
+        if isinstance(meetings, dict):
+            meetings = meetings.values()
+        for meeting in meetings or []:
+            name = _norm_schedule_str(meeting.get("Name"))
+            if not name or name in self._meetings:
+                continue
+            names, types = set(), {}
+            for sess in meeting.get("Sessions") or []:
+                names.add(_norm_schedule_str(sess.get("Name")))
+                numbers = types.setdefault(_norm_schedule_str(sess.get("Type")), set())
+                numbers.add(sess["Number"] if "Number" in sess else _ANY_NUMBER)
+            names.discard("")
+            types.pop("", None)
+            self._meetings[name] = (names, types)
+
+        for race in races or []:
+            name = _norm_schedule_str(getattr(race, "race_name", None))
+            if name:
+                self._races.setdefault(name, race)
+
+    def livetiming_meeting(self, meeting_name: str) -> bool:
+        """True if the Livetiming season index lists the meeting."""
+        return _norm_schedule_str(meeting_name) in self._meetings
+
+    def livetiming_session(
+        self,
+        meeting_name: str,
+        session_name: str | None,
+        session_type: str | None,
+        session_number: int | None,
+    ) -> bool:
+        """True if the Livetiming season index lists the session under the meeting."""
+        meeting = self._meetings.get(_norm_schedule_str(meeting_name))
+        if meeting is None:
+            return False
+        names, types = meeting
+        if _norm_schedule_str(session_name) in names:
+            return True
+        numbers = types.get(_norm_schedule_str(session_type))
+        if not numbers:
+            return False
+        try:
+            return _ANY_NUMBER in numbers or session_number in numbers
+        except TypeError:  # unhashable session number
+            return False
+
+    def jolpica_meeting(self, meeting_name: str) -> bool:
+        """True if a Jolpica race has the meeting's name."""
+        return _norm_schedule_str(meeting_name) in self._races
+
+    def jolpica_race(self, meeting_name: str) -> object | None:
+        """Return the Jolpica race of the meeting, or None."""
+        return self._races.get(_norm_schedule_str(meeting_name))
+
+    def jolpica_session(
+        self,
+        meeting_name: str,
+        session_name: str | None,
+        session_type: str | None,
+        session_number: int | None,
+    ) -> bool:
+        """True if Jolpica has the session on the meeting's race."""
+        name = _norm_schedule_str(meeting_name)
+        if name not in self._races:
+            return False
+        keys = self._race_keys.get(name)
+        if keys is None:
+            keys = self._race_keys[name] = frozenset(_jolpica_race_dict(self._races[name]))
+        return _jolpica_session_in_keys(keys, session_name, session_type, session_number)
+
+
+def season_availability_index(season) -> AvailabilityIndex:
+    """
+    Return the :class:`AvailabilityIndex` of a season object.
+
+    Uses ``season.availability_index`` when the season built one, otherwise
+    indexes its ``livetiming_data`` and ``jolpica_data``.
+    """
+    index = getattr(season, "availability_index", None)
+    if isinstance(index, AvailabilityIndex):
+        return index
+    return AvailabilityIndex(getattr(season, "livetiming_data", None), getattr(season, "jolpica_data", None))
+
+
 def fetch_livetiming_season_index(season_identifier: int) -> tuple[dict, bool]:
     """
     Fetch Livetiming season ``Index.json`` for a calendar year.
 
+    Successful results are kept in memory for the ``metadata_ttl`` setting.
+
     Returns
     -------
     tuple[dict, bool]
         ``(payload, success)``. On failure, ``payload`` is ``{}`` and ``success`` is False.
     """
-    try:
-        data = livetimingF1_request(urljoin(str(season_identifier) + "/", "Index.json"))
-        return data, True
-    except Exception:
-        return {}, False
+    def fetch():
+        try:
+            # The season index grows during the season, so it is never cached on disk.
+            data = livetimingF1_request(
+                urljoin(str(season_identifier) + "/", "Index.json"), use_cache=False
+            )
+            return data, True
+        except Exception:
+            return {}, False
+
+    return metadata_cache.get_or_fetch(("livetiming_season_index", season_identifier), fetch, cache_if=_fetch_ok)
 
 
 def fetch_jolpica_season_meetings(season_identifier: int) -> tuple[list, bool, object | None]:
@@ -335,22 +494,25 @@ def fetch_jolpica_season_meetings(season_identifier: int) -> tuple[list, bool, o
         ``(races, success, season_row)`` where ``season_row`` is the matching season
         metadata (for wiki URL) or ``None``.
     """
-    races, races_ok = fetch_jolpica_season_races_list(season_identifier)
-    if not races_ok:
-        return [], False, None
-    try:
-        seasons_data_jolpica = next(
-            (
-                season
-                for season in jolpica_client.get_seasons(limit=100).data.seasons
-                if int(season.season) == season_identifier
-            ),
-            None,
-        )
-        is_jolpica_available = bool(seasons_data_jolpica)
-        return races, is_jolpica_available, seasons_data_jolpica
-    except Exception:
-        return races, False, None
+    # The seasons list does not depend on the races, fetch both at once.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="livef1-season") as pool:
+        seasons = pool.submit(fetch_jolpica_seasons)
+        races, races_ok = fetch_jolpica_season_races_list(season_identifier)
+        if not races_ok:
+            return [], False, None
+        try:
+            seasons_data_jolpica = next(
+                (
+                    season
+                    for season in seasons.result()
+                    if int(season.season) == season_identifier
+                ),
+                None,
+            )
+            is_jolpica_available = bool(seasons_data_jolpica)
+            return races, is_jolpica_available, seasons_data_jolpica
+        except Exception:
+            return races, False, None
 
 
 def fetch_livetiming_session_index(full_path: str) -> tuple[dict, bool]:
@@ -383,16 +545,20 @@ def download_season_data(season_identifier: int):
         The filtered dataset containing the requested season data.
     """
 
-    season_data_livetiming, is_livetiming_available = fetch_livetiming_season_index(season_identifier)
-    season_races, is_jolpica_available, seasons_data_jolpica = fetch_jolpica_season_meetings(
-        season_identifier
-    )
+    # Livetiming and Jolpica are independent, query them at the same time.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="livef1-season") as pool:
+        livetiming = pool.submit(fetch_livetiming_season_index, season_identifier)
+        season_races, is_jolpica_available, seasons_data_jolpica = fetch_jolpica_season_meetings(
+            season_identifier
+        )
+        season_data_livetiming, is_livetiming_available = livetiming.result()
 
     if not is_jolpica_available and not is_livetiming_available:
         raise livef1Exception("No data available for the season.")
 
     if is_livetiming_available:
-        meetings_livetiming = season_data_livetiming["Meetings"]
+        # merge_meetings() edits the meetings, which are shared with the metadata cache.
+        meetings_livetiming = copy.deepcopy(season_data_livetiming["Meetings"])
     else: meetings_livetiming = {}
     if is_jolpica_available: meetings_jolpica = season_races
     else: meetings_jolpica = {}
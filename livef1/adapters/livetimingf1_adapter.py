@@ -1,4 +1,5 @@
 # Standard Library Imports
+import hashlib
 import json
 import urllib
 
@@ -7,10 +8,15 @@ import requests
 from typing import List, Dict
 
 # Internal Project Imports
+from ..config import get_setting
 from ..utils.constants import *
 from ..utils.logger import logger
+from ..utils.cache import get_cache, is_offline
+from ..utils.http import http_get
 from ..utils.exceptions import (
     AdapterError,
+    CacheMissError,
+    DataDecodingError,
     InvalidEndpointError,
     ParsingError
 )
@@ -18,9 +24,16 @@ from ..utils.exceptions import (
 __all__ = [
     "LivetimingF1adapters",
     "livetimingF1_request",
-    "livetimingF1_getdata"
+    "livetimingF1_getdata",
+    "livetimingF1_iterdata",
+    "livetimingF1_source_digest"
 ]
 
+# SHA-256 digest of the last body retrieved for each URL, from the network
+# or the download cache. Bronze tables are fingerprinted from it (see
+# :func:`livetimingF1_source_digest`).
+_body_digests = {}
+
 
 class LivetimingF1adapters:
     """
@@ -38,40 +51,116 @@ class LivetimingF1adapters:
         """
         self.url = urllib.parse.urljoin(BASE_URL, STATIC_ENDPOINT)  # Base URL for F1 Livetiming API
 
-    def get(self, endpoint: str, header: Dict = None):
+    def get(self, endpoint: str, header: Dict = None, use_cache: bool = True):
         """
         Sends a GET request to the specified endpoint.
 
+        If the download cache is enabled (see :func:`livef1.configure`), the
+        response is served from the cache when present and stored in it
+        otherwise. In offline mode, anything not served from the cache raises
+        :class:`~livef1.utils.exceptions.CacheMissError` without a request.
+
         Parameters
         ----------
             endpoint : :class:`str`
                 The specific API endpoint to append to the base URL.
             header : :class:`dict`
                 HTTP headers to send with the request (default is None).
+            use_cache : :class:`bool`
+                Whether the download cache may be used for this request. Set it
+                to False for files that change over time, such as season
+                indexes (default is True).
         
         Returns
         ----------
         - str: The response content decoded as a UTF-8 string.
         """
+        req_url = urllib.parse.urljoin(self.url, endpoint)  # Build the full request URL
+        cache = get_cache() if use_cache else None
+
+        if cache is not None:
+            content = cache.get(req_url)
+            if content is not None:
+                _body_digests[req_url] = hashlib.sha256(content).hexdigest()
+                return self._decode(content)
+        if is_offline():
+            raise CacheMissError(f"Offline mode: '{req_url}' is not in the download cache.")
+
+        response = self._send(req_url, endpoint, header)
+        try:
+            res_text = self._decode(response.content)
+            if cache is not None:
+                cache.put(req_url, response.content)
+            _body_digests[req_url] = hashlib.sha256(response.content).hexdigest()
+            return res_text
+        except DataDecodingError:
+            raise
+        except Exception as e:
+            logger.critical(f"Unexpected error for URL {req_url}: {e}", exc_info=True)
+            raise AdapterError(f"An unexpected error occurred: {e}") from e
+
+    def iter_lines(self, endpoint: str, header: Dict = None, use_cache: bool = True, chunk_size: int = None):
+        """
+        Sends a GET request to the specified endpoint and yields the body line by line.
+
+        The body is read in chunks of ``chunk_size`` bytes, so only the current
+        chunk and the line being assembled are held in memory. Lines are split
+        on ``\\r\\n`` as in Livetiming ``.jsonStream`` files, and the UTF-8
+        byte order mark is dropped. The download cache is read from and written
+        to like in :meth:`get`.
+
+        Parameters
+        ----------
+            endpoint : :class:`str`
+                The specific API endpoint to append to the base URL.
+            header : :class:`dict`
+                HTTP headers to send with the request (default is None).
+            use_cache : :class:`bool`
+                Whether the download cache may be used for this request (default is True).
+            chunk_size : :class:`int`
+                Number of bytes read at a time. Defaults to the ``stream_chunk_size`` setting.
+
+        Yields
+        ----------
+        - bytes: One line of the response, without its line terminator.
+        """
+        req_url = urllib.parse.urljoin(self.url, endpoint)
+        chunk_size = chunk_size or get_setting("stream_chunk_size")
+        cache = get_cache() if use_cache else None
 
+        if cache is not None:
+            handle = cache.open(req_url)
+            if handle is not None:
+                with handle:
+                    yield from self._split_lines(self._digest(iter(lambda: handle.read(chunk_size), b""), req_url))
+                return
+        if is_offline():
+            raise CacheMissError(f"Offline mode: '{req_url}' is not in the download cache.")
+
+        response = self._send(req_url, endpoint, header, stream=True)
+        with response:
+            chunks = self._digest(response.iter_content(chunk_size=chunk_size), req_url)
+            if cache is None:
+                yield from self._split_lines(chunks, req_url)
+                return
+            with cache.writer(req_url) as write:
+                for line in self._split_lines(self._tee(chunks, write), req_url):
+                    yield line
+
+    def _send(self, req_url: str, endpoint: str, header: Dict = None, **kwargs):
+        """
+        Sends the GET request and maps transport errors to LiveF1 exceptions.
+        """
         try:
-            req_url = urllib.parse.urljoin(self.url, endpoint)  # Build the full request URL
             logger.debug(f"Sending GET request to URL: {req_url}")
-            response = requests.get(
-                url=req_url,
+            response = http_get(
+                req_url,
                 headers=header,
-                timeout=300  # Timeout added for robustness
+                timeout=300,  # Timeout added for robustness
+                **kwargs
             )
             response.raise_for_status()
-
-            # Decode response
-            try:
-                res_text = response.content.decode('utf-8-sig')
-            except UnicodeDecodeError as decode_err:
-                logger.error(f"Failed to decode response: {decode_err}", exc_info=True)
-                raise DataDecodingError(f"Failed to decode response: {decode_err}") from decode_err
-
-            return res_text
+            return response
         except requests.exceptions.Timeout as timeout_err:
             logger.error(f"Request timed out for URL: {req_url}", exc_info=True)
             raise TimeoutError(f"Request timed out: {timeout_err}") from timeout_err
@@ -89,7 +178,56 @@ class LivetimingF1adapters:
             logger.critical(f"Unexpected error for URL {req_url}: {e}", exc_info=True)
             raise AdapterError(f"An unexpected error occurred: {e}") from e
 
-def livetimingF1_request(url):
+    @staticmethod
+    def _digest(chunks, req_url: str):
+        """
+        Passes chunks through and records the body digest once they are exhausted.
+        """
+        digest = hashlib.sha256()
+        for chunk in chunks:
+            digest.update(chunk)
+            yield chunk
+        _body_digests[req_url] = digest.hexdigest()
+
+    @staticmethod
+    def _tee(chunks, write):
+        for chunk in chunks:
+            write(chunk)
+            yield chunk
+
+    @staticmethod
+    def _split_lines(chunks, req_url: str = None):
+        """
+        Reassembles ``\\r\\n`` separated lines from a sequence of byte chunks.
+        """
+        pending = b""
+        first = True
+        try:
+            for chunk in chunks:
+                if first and chunk:
+                    chunk = chunk[3:] if chunk.startswith(b"\xef\xbb\xbf") else chunk
+                    first = False
+                lines = (pending + chunk).split(b"\r\n")
+                pending = lines.pop()
+                yield from lines
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Download interrupted for URL {req_url}: {e}", exc_info=True)
+            raise AdapterError(f"Download interrupted: {e}") from e
+        if pending:
+            yield pending
+
+    @staticmethod
+    def _decode(content: bytes):
+        """
+        Decodes a raw response body as UTF-8, dropping the byte order mark.
+        """
+        try:
+            return content.decode('utf-8-sig')
+        except UnicodeDecodeError as decode_err:
+            logger.error(f"Failed to decode response: {decode_err}", exc_info=True)
+            raise DataDecodingError(f"Failed to decode response: {decode_err}") from decode_err
+
+def livetimingF1_request(url, use_cache: bool = True):
     """
     Wrapper function to perform a GET request to the Livetiming F1 API.
 
@@ -97,6 +235,8 @@ def livetimingF1_request(url):
     ----------
         url : :class:`str`
             The full URL to request.
+        use_cache : :class:`bool`
+            Whether the download cache may be used (default is True).
 
     Returns
     ----------
@@ -104,15 +244,67 @@ def livetimingF1_request(url):
             Parsed JSON response from the API.
     """
     adapters = LivetimingF1adapters()  # Initialize the adapter class
-    response = adapters.get(url)  # Perform the GET request
+    response = adapters.get(url, use_cache=use_cache)  # Perform the GET request
     try:
         data = json.loads(response)  # Parse the JSON response
-    except:
+    except json.JSONDecodeError as parse_err:
         logger.error("Error parsing request .", exc_info=True)
         raise ParsingError(f"Error parsing request: {parse_err}") from parse_err
     return data
 
-def livetimingF1_getdata(url, stream):
+def livetimingF1_source_digest(url):
+    """
+    Returns the SHA-256 digest of the last body retrieved for a URL in this process.
+
+    Both network responses and download cache hits are recorded. A streamed
+    body is recorded once it has been read to the end.
+
+    Parameters
+    ----------
+        url : :class:`str`
+            The full URL, as passed to :func:`livetimingF1_getdata`.
+
+    Returns
+    ----------
+        str or None
+            Hex digest of the body, or None if the URL has not been retrieved.
+    """
+    req_url = urllib.parse.urljoin(LivetimingF1adapters().url, url)
+    return _body_digests.get(req_url)
+
+def livetimingF1_iterdata(url, chunk_size: int = None):
+    """
+    Incrementally retrieves a Livetiming ``.jsonStream`` file as ``(timestamp, record)`` pairs.
+
+    The response body is read in chunks and each line is decoded as soon as it
+    is complete, so memory use depends on the chunk size rather than the size
+    of the file.
+
+    Parameters
+    ----------
+        url : :class:`str`
+            The full URL to request.
+        chunk_size : :class:`int`
+            Number of bytes read at a time. Defaults to the ``stream_chunk_size`` setting.
+
+    Yields
+    ----------
+        tuple
+            The 12 character timestamp key of a record and its parsed JSON value.
+    """
+    adapters = LivetimingF1adapters()
+    tl = 12  # Record key length (first 12 characters are the key)
+    for line in adapters.iter_lines(endpoint=url, chunk_size=chunk_size):
+        if not line:
+            continue
+        try:
+            record = line.decode("utf-8")
+            yield record[:tl], json.loads(record[tl:])
+        except (UnicodeDecodeError, json.JSONDecodeError) as parse_err:
+            logger.error("Error parsing streamed data.", exc_info=True)
+            raise ParsingError(f"Error parsing streamed data: {parse_err}") from parse_err
+
+def livetimingF1_getdata(url, stream, incremental: bool = False):
     """
     Retrieves data from the Livetiming F1 API, either as a stream of records or a static response.
 
@@ -123,12 +315,19 @@ def livetimingF1_getdata(url, stream):
         stream : :class:`bool`
             If True, treats the response as a stream of newline-separated records.
             If False, treats it as a static JSON response.
+        incremental : :class:`bool`
+            If True and ``stream`` is True, return a generator from
+            :func:`livetimingF1_iterdata` that downloads and decodes records
+            while it is consumed, instead of a list (default is False).
 
     Returns
     ----------
         dict
             A dictionary containing parsed data. If streaming, each line is parsed and split.
     """
+    if stream and incremental:
+        return livetimingF1_iterdata(url)
+
     adapters = LivetimingF1adapters()  # Initialize the adapter class
     res_text = adapters.get(endpoint=url)  # Perform the GET request
 
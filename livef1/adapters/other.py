@@ -1,13 +1,14 @@
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 from string import digits
 
+from ..utils.http import http_get
+
 
 def _parse_tables_from_wikipedia(url):
     
-    response = requests.get(url)
+    response = http_get(url)
     soup = BeautifulSoup(response.content, 'html.parser')
 
     # Store parsed tables with associated titles
@@ -82,7 +83,7 @@ def parse_schedule_from_f1com(season: int) -> pd.DataFrame:
     SEASON_URL = BASE_URL + f'/en/racing/{season}'
 
     """Given a race weekend URL, return a dict of session names → datetime."""
-    resp = requests.get(SEASON_URL)
+    resp = http_get(SEASON_URL)
     soup = BeautifulSoup(resp.content, 'html.parser')
 
     meetings = []
@@ -95,7 +96,7 @@ def parse_schedule_from_f1com(season: int) -> pd.DataFrame:
         title_obj = meeting_obj.find(class_="CountryFlag-module_flag__Y-X37")
         country_name = title_obj.findAll("title")[0].text.replace("Flag of ", "").strip()
 
-        sub_resp = requests.get(meeting_url)
+        sub_resp = http_get(meeting_url)
         sub_soup = BeautifulSoup(sub_resp.content, 'html.parser')
         short_name = sub_soup.title.text.split(" - ")[0].split("Grand Prix")[0].strip()
 
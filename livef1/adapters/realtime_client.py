@@ -2,13 +2,18 @@ import asyncio
 import concurrent
 import requests
 import inspect
+import os
 import random
 
 import time
 import json
 from urllib.parse import urljoin
 
+from ..config import get_setting
 from ..data_processing.etl import function_map
+from .realtime_queue import OVERFLOW_POLICIES, RealtimeQueue
+from .realtime_replay import FrameRecorder, ReplayTransport, load_frames
+from .realtime_sink import FileSink
 from .signalr_aio._connection import Connection
 from ..utils.logger import logger
 from ..utils.constants import (
@@ -22,6 +27,8 @@ from ..utils.exceptions import (
     ParsingError
 )
 
+_UNSET = object()
+
 class RealF1Client:
     """
     A client for managing real-time Formula 1 data streaming.
@@ -40,19 +47,68 @@ class RealF1Client:
         Mode for opening the log file.
     _test : bool
         Indicates if the client is in test mode.
-    _log_file : file object
-        Log file object for writing messages (used in test mode).
+    _log_sink : :class:`~livef1.adapters.realtime_sink.FileSink`
+        Background writer of the log file, opened when the client starts and
+        closed when it stops. Its ``metrics()`` report the records waiting and
+        the flush lag.
     _handlers : dict
         Mapping of methods to their respective handlers.
+    _templates : dict
+        Mapping of methods to the :class:`MessageHandlerTemplate` holding
+        their pending batches.
+    ingest_queue : :class:`~livef1.adapters.realtime_queue.RealtimeQueue`
+        Bounded queue between the websocket and the handlers. Its
+        ``metrics()`` report the queue depth, drops and callback errors.
+    recorder : :class:`~livef1.adapters.realtime_replay.FrameRecorder` or None
+        Recording of the frames received by the current or last run, if
+        ``record_file`` is given.
+    reconnects : int
+        Number of times the websocket was reopened after dropping or going
+        stale.
 
     Parameters
     ----------
     topics : str or list
         Topic(s) to subscribe to for live updates.
     log_file_name : str, optional
-        Name of the log file (default is None).
+        Name of the log file (default is None). Every record received is
+        written to it as a line of JSON, ``{"topic": ..., "record": ...}``,
+        by a background thread. Names ending in ``.gz`` are gzip compressed.
     log_file_mode : str, optional
-        Mode for opening the log file (default is "w").
+        Mode for opening the log file on the first run (default is "w").
+        Later runs of the same client append to it.
+    log_max_bytes : int, optional
+        Rotate the log file once it holds this many bytes, keeping the
+        previous files as ``<log_file_name>.1``, ``.2``, ... (default is None,
+        no rotation).
+    queue_size : int, optional
+        Maximum number of received messages waiting for the handlers.
+        Defaults to the ``realtime_queue_size`` setting.
+    overflow : str, optional
+        What to do with a message when the queue is full: ``"block"``,
+        ``"drop-oldest"`` or ``"coalesce"`` (see
+        :class:`~livef1.adapters.realtime_queue.RealtimeQueue`). Defaults to
+        the ``realtime_overflow`` setting.
+    workers : int, optional
+        Number of tasks running the handlers. Messages of one topic are
+        always handled in order. Defaults to the ``realtime_workers`` setting.
+    stale_timeout : float or None, optional
+        Seconds without any frame (including keep-alives) after which the
+        stream is considered stale and the websocket is reopened. None
+        disables the check. Defaults to the ``realtime_stale_timeout`` setting.
+    record_file : str, optional
+        Append every raw frame received, with its receive time, to this file
+        (see :class:`~livef1.adapters.realtime_replay.FrameRecorder`) so the
+        session can be played back later with :meth:`replay`.
+
+    Notes
+    -----
+    A dropped websocket is reopened with a jittered exponential backoff
+    (``realtime_reconnect_backoff`` and ``realtime_reconnect_max_backoff``
+    settings) and ``topics`` are subscribed again. The server answers each
+    subscription with a snapshot of the topics ("R" message), which reaches
+    the callbacks like after the first connection, so they can resume from
+    the current state.
 
     """
     def __init__(
@@ -60,6 +116,12 @@ class RealF1Client:
         topics,
         log_file_name = None,
         log_file_mode = "w",
+        queue_size = None,
+        overflow = None,
+        workers = None,
+        stale_timeout = _UNSET,
+        record_file = None,
+        log_max_bytes = None,
         ):
 
         self._connection_url = urljoin(BASE_URL, SIGNALR_ENDPOINT)
@@ -72,19 +134,40 @@ class RealF1Client:
         elif isinstance(topics, list): self.topics = topics
         else: raise ArgumentError("You need to give list of topics you want to subscribe")
         
+        overflow = overflow if overflow is not None else get_setting("realtime_overflow")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ArgumentError(f"Invalid overflow policy '{overflow}'. Must be one of {list(OVERFLOW_POLICIES)}.")
+
         self._log_file_name = log_file_name
         self._log_file_mode = log_file_mode
         self._handlers = {}
+        self._templates = {}
+        self._loop = None
+        self._connection = None
+        self._hub = None
+        self._hub_subscribed = False
+        self._t_last_message = None
+        self.stale_timeout = stale_timeout if stale_timeout is not _UNSET else get_setting("realtime_stale_timeout")
+        self.reconnects = 0
+        self._record_file = record_file
+        self._log_max_bytes = log_max_bytes
+        self.recorder = None
+        self._log_sink = None
+        self._latencies = None
+        self.ingest_queue = RealtimeQueue(
+            self._dispatch,
+            maxsize=queue_size if queue_size is not None else get_setting("realtime_queue_size"),
+            overflow=overflow,
+            workers=workers if workers is not None else get_setting("realtime_workers"),
+        )
 
         if self._log_file_name:
-            self._log_file = open(self._log_file_name, self._log_file_mode)
             @self.callback("default logger")
             async def print_callback(
                 records
                 ):
                 for topic, data in records.items():
-                    for record in data:
-                        await self._file_logger(f"{topic} > {record}")
+                    self._log_sink.write_many({"topic": topic, "record": record} for record in data)
 
     def _create_session(self):
         """
@@ -99,40 +182,51 @@ class RealF1Client:
         session.headers = self.headers
         return session
     
-    async def _on_message(self, msg):
+    async def _receive(self, **frame):
         """
-        Handle incoming messages asynchronously.
+        Queue a SignalR frame received by the transport.
+
+        Frames carrying several topic updates ("M") are split into one
+        message per update, and snapshot responses ("R") into one message
+        per topic. Both are keyed by topic, so a topic's snapshot is handled
+        before the updates received after it. Other frames (heartbeats,
+        invocation results) are ignored.
 
         Parameters
         ----------
-        msg : dict
-            The incoming message to process.
+        frame : dict
+            The decoded frame.
         """
         self._t_last_message = time.time()
-        loop = asyncio.get_running_loop()
-        try:
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                await loop.run_in_executor(
-                    pool, print, str(msg)
-                )
-        except Exception as e:
-            raise RealF1Error(e)
+        if self.recorder is not None:
+            self.recorder.write(frame, self._t_last_message)
+        if frame.get("M"):
+            for message in frame["M"]:
+                arguments = message.get("A") or [None]
+                await self._enqueue({"M": [message]}, arguments[0])
+        elif isinstance(frame.get("R"), dict):
+            for topic, data in frame["R"].items():
+                await self._enqueue({"R": {topic: data}}, topic)
+
+    async def _enqueue(self, message, key):
+        """Put a message on the ingestion queue from the transport's event loop."""
+        message = (time.perf_counter(), message)
+        if self._loop is None or self._loop is asyncio.get_running_loop():
+            await self.ingest_queue.put(message, key)
+        else:
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(self.ingest_queue.put(message, key), self._loop)
+            )
 
-    async def _file_logger(self, msg):
-        """
-        Log incoming messages to a file.
+    async def _dispatch(self, item):
+        """Pass a queued message to every registered handler, in registration order."""
+        received, message = item
+        for handler in list(self._handlers.values()):
+            await handler(message)
+        if self._latencies is not None:
+            self._latencies.append(time.perf_counter() - received)
 
-        Parameters
-        ----------
-        msg : dict
-            The incoming message to log.
-        """
-
-        if msg != {} and msg:
-            self._log_file.write(str(msg) + '\n')
-            self._log_file.flush()
-        
-    def on_message(self, method, handler):
+    def on_message(self, method, handler, batch_size=None, batch_interval=_UNSET):
         """
         Register a handler for a specific method.
 
@@ -142,12 +236,23 @@ class RealF1Client:
             The method to handle.
         handler : callable
             The function to handle the method.
+        batch_size : int, optional
+            Number of records of a topic passed to the handler together.
+            Defaults to the ``realtime_batch_size`` setting.
+        batch_interval : float or None, optional
+            Maximum seconds a record waits for its batch to fill. Defaults to
+            the ``realtime_batch_interval`` setting.
         """
         if method not in self._handlers:
-            func = MessageHandlerTemplate(handler).get
-            self._handlers[method] = func
+            template = MessageHandlerTemplate(
+                handler,
+                batch_size=batch_size if batch_size is not None else get_setting("realtime_batch_size"),
+                batch_interval=batch_interval if batch_interval is not _UNSET else get_setting("realtime_batch_interval"),
+            )
+            self._templates[method] = template
+            self._handlers[method] = template.get
 
-    def callback(self, method):
+    def callback(self, method, batch_size=None, batch_interval=_UNSET):
         """
         Decorator to register a callback function for a specific method.
 
@@ -155,6 +260,22 @@ class RealF1Client:
         method. The function being registered must have arguments matching the 
         required parameters defined in `REALTIME_CALLBACK_DEFAULT_PARAMETERS`.
 
+        With ``batch_size`` or ``batch_interval``, the records of each topic are
+        accumulated and the callback receives them in batches, e.g.
+        ``{"CarData.z": [...]}`` with up to ``batch_size`` updates, instead of
+        once per update. Pending batches are delivered when the client stops.
+
+        Parameters
+        ----------
+        method : str
+            Name the callback is registered under.
+        batch_size : int, optional
+            Number of records of a topic passed to the callback together.
+            Defaults to the ``realtime_batch_size`` setting (1, no batching).
+        batch_interval : float or None, optional
+            Maximum seconds a record waits for its batch to fill. Defaults to
+            the ``realtime_batch_interval`` setting (None, no time limit).
+
         Raises
         ------
         TypeError
@@ -186,6 +307,15 @@ class RealF1Client:
             
             client.run()
 
+        Receiving car data in batches of 200 updates, or at least every second:
+
+        .. code-block:: python
+
+            @client.callback("bulk writer", batch_size=200, batch_interval=1.0)
+            async def write_callback(records):
+                for topic, rows in records.items():
+                    database.insert_many(topic, rows)
+
         """
         def inner(func):
             # Check if the provided function has the required arguments
@@ -195,7 +325,7 @@ class RealF1Client:
                 raise ArgumentError(f"The provided callback function does not have following required arguments. {args_diff}")
             else:
                 # Register the function as a handler for the given method
-                self.on_message(method,func)
+                self.on_message(method, func, batch_size=batch_size, batch_interval=batch_interval)
                 logger.debug(f"Custom callback method with '{method}' has successfully inserted.")
             return func
         return inner
@@ -222,18 +352,199 @@ class RealF1Client:
         Run the client asynchronously.
         """
         logger.info(f"Starting LiveF1 live timing client")
-        await asyncio.gather(
-            asyncio.ensure_future(self._forever_check()),
-            asyncio.ensure_future(self._run())
-            )
+        batch_timer = self._start_ingest()
+        try:
+            await asyncio.gather(
+                asyncio.ensure_future(self._forever_check()),
+                asyncio.ensure_future(self._run())
+                )
+        finally:
+            # Stop the transport's supervisor from reconnecting once the client is done.
+            if self._connection is not None:
+                self._connection.close()
+            await self._stop_ingest(batch_timer)
         logger.info("Exiting...")
 
+    def _start_ingest(self):
+        """Start the ingestion queue workers and the batch timer on the running loop."""
+        self._loop = asyncio.get_running_loop()
+        self._open_files()
+        self.ingest_queue.start()
+        return asyncio.ensure_future(self._flush_batches())
+
+    def _open_files(self):
+        """Open the log file and the recording for a run. Later runs append to them."""
+        flush_size = get_setting("realtime_log_flush_size")
+        flush_interval = get_setting("realtime_log_flush_interval")
+        if self._log_file_name:
+            self._log_sink = FileSink(
+                self._log_file_name,
+                mode=self._log_file_mode if self._log_sink is None else "a",
+                flush_size=flush_size,
+                flush_interval=flush_interval,
+                max_bytes=self._log_max_bytes,
+            )
+        if self._record_file:
+            self.recorder = FrameRecorder(self._record_file, flush_size=flush_size, flush_interval=flush_interval)
+
+    async def _stop_ingest(self, batch_timer):
+        """Handle the messages already received, deliver pending batches and close the recording."""
+        await self.ingest_queue.close(drain=True)
+        batch_timer.cancel()
+        await self.flush_batches()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self._log_sink is not None:
+            self._log_sink.close()
+            logger.info(f"Log file: {self._log_sink.metrics()}")
+        logger.info(f"Ingestion queue: {self.ingest_queue.metrics()}")
+
+    def replay(self, source, speed=1.0, topics=None, start=None):
+        """
+        Play recorded frames through the client's queue and callbacks, without a network connection.
+
+        The frames are fired by an in-process
+        :class:`~livef1.adapters.realtime_replay.ReplayTransport` in place of
+        the websocket, so callbacks can be tested and benchmarked offline
+        against a real session's message rate.
+
+        Parameters
+        ----------
+        source : str or list of str
+            A recording made with ``record_file``, or ``.jsonStream`` archive
+            files or a directory of them (see
+            :func:`~livef1.adapters.realtime_replay.load_frames`).
+        speed : float or None, optional
+            1 (default) replays in real time, ``N`` N times faster, None as
+            fast as the callbacks keep up.
+        topics : list of str, optional
+            Archive topics to replay. Defaults to the client's ``topics``.
+        start : datetime, optional
+            UTC start time given to archived messages. Defaults to now.
+
+        Returns
+        -------
+        dict
+            ``frames`` and ``messages`` replayed, ``seconds`` of wall time,
+            ``messages_per_second``, and the ``latency_p50``, ``latency_p95``,
+            ``latency_p99`` and ``latency_max`` in seconds from a message's
+            arrival to the end of its callbacks. For batched callbacks this is
+            the time to add the message to its batch.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            client = RealF1Client(topics=["CarData.z", "Position.z"])
+
+            @client.callback("writer")
+            async def writer(records):
+                ...
+
+            stats = client.replay("~/archives/2024_bahrain_race", speed=None)
+            print(stats["messages_per_second"], stats["latency_p99"])
+        """
+        frames = load_frames(
+            os.path.expanduser(source) if isinstance(source, str) else source,
+            topics=topics if topics is not None else self.topics,
+            start=start,
+        )
+        return asyncio.run(self._async_replay(frames, speed))
+
+    async def _async_replay(self, frames, speed):
+        """
+        Replay frames asynchronously and measure the callbacks.
+        """
+        logger.info(f"Replaying frames at {'maximum' if speed is None else f'{speed}x'} speed")
+        self._latencies = []
+        started = time.perf_counter()
+        batch_timer = self._start_ingest()
+        try:
+            await self._run(transport=lambda connection: ReplayTransport(connection, frames, speed=speed))
+            await self._connection.transport.finished
+        finally:
+            await self._stop_ingest(batch_timer)
+        seconds = time.perf_counter() - started
+        latencies, self._latencies = sorted(self._latencies), None
+
+        def percentile(q):
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))] if latencies else None
+
+        stats = {
+            "frames": self._connection.transport.frames,
+            "messages": len(latencies),
+            "seconds": seconds,
+            "messages_per_second": len(latencies) / seconds if seconds else None,
+            "latency_p50": percentile(0.5),
+            "latency_p95": percentile(0.95),
+            "latency_p99": percentile(0.99),
+            "latency_max": latencies[-1] if latencies else None,
+        }
+        logger.info(f"Replay finished: {stats}")
+        return stats
+
+    async def _flush_batches(self):
+        """
+        Deliver the batches of time-limited callbacks as their window passes.
+        """
+        intervals = [template.batch_interval for template in self._templates.values() if template.batch_interval is not None]
+        if not intervals:
+            return
+        # Check twice per window so no batch waits more than 1.5 windows.
+        period = max(min(intervals) / 2, 0.001)
+        while True:
+            await asyncio.sleep(period)
+            for template in list(self._templates.values()):
+                try:
+                    await template.flush_due()
+                except Exception as e:
+                    logger.error(f"Realtime callback failed: {e!r}")
+
+    async def flush_batches(self):
+        """
+        Deliver the pending batches of every callback.
+
+        Called when the client stops; callbacks registered with
+        ``batch_size`` or ``batch_interval`` receive the records still
+        waiting for their batch.
+        """
+        for method, template in list(self._templates.items()):
+            try:
+                await template.flush()
+            except Exception as e:
+                logger.error(f"Realtime callback '{method}' failed: {e!r}")
+
     async def _forever_check(self):
         """
-        Keep the client running indefinitely.
+        Keep the client running indefinitely, reopening the websocket when the stream goes stale.
         """
         while True:
-            await asyncio.sleep(1)
+            await asyncio.sleep(min(1, self.stale_timeout or 1))
+            if self._stale():
+                logger.warning(f"No message received for {self.stale_timeout} seconds, reconnecting.")
+                # Give the new websocket a full timeout before checking again.
+                self._t_last_message = time.time()
+                self._connection.reconnect()
+
+    def _stale(self):
+        """Whether the connection has received nothing for ``stale_timeout`` seconds."""
+        if self.stale_timeout is None or self._connection is None or self._t_last_message is None:
+            return False
+        return time.time() - self._t_last_message > self.stale_timeout
+
+    async def _subscribe(self):
+        """
+        Subscribe to ``topics`` each time a websocket opens.
+
+        The server answers with a snapshot of the topics, which is passed to
+        the handlers like any "R" message.
+        """
+        self._t_last_message = time.time()
+        if self._hub_subscribed:
+            self.reconnects += 1
+            logger.info(f"Reconnected to the live timing stream, subscribing to {self.topics} again.")
+        self._hub_subscribed = True
+        self._hub.server.invoke("Subscribe", self.topics)
         
     def _sync_engine_run(self):
         pass
@@ -241,20 +552,31 @@ class RealF1Client:
     def _sync_engine(self):
         pass
     
-    async def _run(self):
+    async def _run(self, transport=None):
         """
         Set up the SignalR connection and register handlers.
+
+        Parameters
+        ----------
+        transport : callable, optional
+            Builds the transport from the connection, in place of the websocket.
         """
         # Create connection
-        self._connection = Connection(self._connection_url, session=self._create_session())
+        self._connection = Connection(
+            self._connection_url,
+            session=self._create_session(),
+            backoff=get_setting("realtime_reconnect_backoff"),
+            max_backoff=get_setting("realtime_reconnect_max_backoff"),
+            transport=transport,
+        )
         # Register hub
-        hub = self._connection.register_hub('Streaming')
-        # Set default message handler
-        for method, handler in self._handlers.items():
-            hub.client.on(method, handler)
+        self._hub = self._connection.register_hub('Streaming')
+        # Received frames go through the bounded ingestion queue to the handlers
+        self._connection.received += self._receive
 
-        # Subscribe topics in interest
-        hub.server.invoke("Subscribe", self.topics)
+        # Subscribe topics in interest, again after every reconnection
+        self._hub_subscribed = False
+        self._connection.connected += self._subscribe
         # Start the client
         loop = asyncio.get_event_loop()
         executor = concurrent.futures.ThreadPoolExecutor()
@@ -268,19 +590,48 @@ class MessageHandlerTemplate:
     This class serves as a message handler for SignalR streams, where incoming 
     messages are processed and passed to a user-defined function.
 
+    By default every message is parsed and passed to the function on its own.
+    With ``batch_size`` above 1 or a ``batch_interval``, the ``(timestamp, data)``
+    records of each topic are accumulated instead, and parsed and passed to
+    the function together once ``batch_size`` records are pending or the
+    oldest pending record is ``batch_interval`` seconds old. Records of one
+    topic keep their order across batches.
+
     Parameters
     ----------
     func : callable
         A user-defined asynchronous function that processes the parsed records
         from incoming SignalR messages. The function must accept the processed 
         records as its input.
+    batch_size : int, optional
+        Number of records of a topic delivered together, by default 1.
+    batch_interval : float, optional
+        Maximum seconds a record waits for its batch to fill, by default None
+        (no time limit). Time-based batches are delivered by :meth:`flush_due`.
     """
     def __init__(
         self,
-        func
+        func,
+        batch_size = 1,
+        batch_interval = None
     ):
         self._func = func
-    
+        self.batch_size = max(1, int(batch_size))
+        self.batch_interval = batch_interval
+        self._pending = {}          # topic -> list of (timestamp, data)
+        self._pending_since = {}    # topic -> monotonic time of the oldest pending record
+        self._locks = {}            # topic -> lock keeping the batches of a topic in order
+
+    @property
+    def batching(self):
+        """Whether records are accumulated before being delivered."""
+        return self.batch_size > 1 or self.batch_interval is not None
+
+    @property
+    def pending(self):
+        """Number of records waiting for their batch, by topic."""
+        return {topic: len(records) for topic, records in self._pending.items()}
+
     async def get(self, msg):
         """
         Process incoming messages and invoke the handler function.
@@ -312,13 +663,7 @@ class MessageHandlerTemplate:
                         topic_name = key
                         data = batch.get("R")[key]
                         timestamp = None
-                        records = list(function_map[topic_name]([(timestamp, data)], None))
-                        records = {topic_name: records}
-                        await self._func(records)
-                        # await self._func(
-                        #     topic_name = key,
-                        #     data = batch.get("R")[key],
-                        #     timestamp = None)
+                        await self._add(topic_name, (timestamp, data))
                     except Exception as e:
                         raise ParsingError(e)
 
@@ -330,11 +675,40 @@ class MessageHandlerTemplate:
                     topic_name = message[0]
                     data = message[1]
                     timestamp = message[2]
-                    records = list(function_map[topic_name]([(timestamp, data)], None))
-                    records = {topic_name: records}
-
-                    await self._func(records)
-                    # await self._func(
-                    #     topic_name = message[0],
-                    #     data = message[1],
-                    #     timestamp = message[2])
\ No newline at end of file
+                    await self._add(topic_name, (timestamp, data))
+
+    async def _add(self, topic_name, record):
+        """Deliver a record, or add it to the pending batch of its topic."""
+        if not self.batching:
+            records = list(function_map[topic_name]([record], None))
+            await self._func({topic_name: records})
+            return
+
+        self._pending.setdefault(topic_name, []).append(record)
+        self._pending_since.setdefault(topic_name, time.monotonic())
+        if len(self._pending[topic_name]) >= self.batch_size:
+            await self._flush_topic(topic_name)
+
+    async def _flush_topic(self, topic_name):
+        """Parse and deliver the pending records of a topic."""
+        lock = self._locks.setdefault(topic_name, asyncio.Lock())
+        async with lock:
+            pending = self._pending.pop(topic_name, None)
+            self._pending_since.pop(topic_name, None)
+            if pending:
+                records = list(function_map[topic_name](pending, None))
+                await self._func({topic_name: records})
+
+    async def flush_due(self):
+        """Deliver the batches whose oldest record is ``batch_interval`` seconds old."""
+        if self.batch_interval is None:
+            return
+        now = time.monotonic()
+        for topic_name, since in list(self._pending_since.items()):
+            if now - since >= self.batch_interval:
+                await self._flush_topic(topic_name)
+
+    async def flush(self):
+        """Deliver every pending batch, e.g. before shutting down."""
+        for topic_name in list(self._pending):
+            await self._flush_topic(topic_name)
@@ -0,0 +1,224 @@
+# Standard Library Imports
+import asyncio
+import itertools
+import time
+from collections import deque
+
+# Internal Project Imports
+from ..utils.logger import logger
+
+OVERFLOW_POLICIES = ("block", "drop-oldest", "coalesce")
+
+
+class RealtimeQueue:
+    """
+    Bounded queue of SignalR messages between the transport and the realtime callbacks.
+
+    Messages are queued per key (the topic name) and handed to a fixed pool
+    of worker tasks. A key is processed by one worker at a time, so messages
+    of the same topic reach the callbacks in the order they were received,
+    while different topics are processed concurrently.
+
+    When ``maxsize`` messages are queued, a new message is handled by the
+    ``overflow`` policy:
+
+    - ``"block"``: wait until a worker frees a slot. The websocket is not
+      read meanwhile, so the server buffers instead of this process.
+    - ``"drop-oldest"``: discard the oldest queued message.
+    - ``"coalesce"``: replace the newest queued message of the same topic,
+      keeping only the latest update. Messages of topics with nothing
+      queued discard the oldest message instead.
+
+    Parameters
+    ----------
+    handle : callable
+        Coroutine function called with each message.
+    maxsize : int, optional
+        Maximum number of queued messages, by default 10000.
+    overflow : str, optional
+        One of ``OVERFLOW_POLICIES``, by default ``"block"``.
+    workers : int, optional
+        Number of worker tasks, by default 4.
+    """
+
+    def __init__(self, handle, maxsize=10000, overflow="block", workers=4):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow policy '{overflow}'. Must be one of {list(OVERFLOW_POLICIES)}.")
+        self._handle = handle
+        self.maxsize = max(1, int(maxsize))
+        self.overflow = overflow
+        self.workers = max(1, int(workers))
+
+        self._queues = {}       # key -> deque of (sequence, message)
+        self._ready = deque()   # keys with queued messages and no worker
+        self._busy = set()      # keys being processed
+        self._size = 0
+        self._sequence = itertools.count()
+        self._changed = asyncio.Condition()
+        self._tasks = []
+        self._closed = False
+
+        self.enqueued = 0
+        self.processed = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.blocked_seconds = 0.0
+
+    @property
+    def depth(self):
+        """Number of queued messages."""
+        return self._size
+
+    def metrics(self):
+        """
+        Return the queue counters.
+
+        Returns
+        -------
+        dict
+            ``depth`` and ``max_depth`` (current and highest number of queued
+            messages), ``enqueued``, ``processed``, ``dropped``, ``coalesced``,
+            ``errors`` (callbacks that raised) and ``blocked_seconds`` (time
+            the producer waited for a free slot).
+        """
+        return {
+            "depth": self._size,
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "blocked_seconds": self.blocked_seconds,
+        }
+
+    def start(self):
+        """
+        Start the worker tasks on the running event loop.
+
+        The queue can be started again after :meth:`close`, also on another
+        event loop. Messages queued before the start are kept.
+        """
+        if not self._tasks:
+            # asyncio primitives belong to the loop they are first used on.
+            self._changed = asyncio.Condition()
+            self._closed = False
+            self._busy.clear()
+            self._queues = {key: queue for key, queue in self._queues.items() if queue}
+            self._ready = deque(self._queues)
+            self._size = sum(len(queue) for queue in self._queues.values())
+            self._tasks = [
+                asyncio.create_task(self._work(), name=f"livef1-realtime-{i}")
+                for i in range(self.workers)
+            ]
+
+    async def put(self, message, key=None):
+        """
+        Queue a message, applying the overflow policy if the queue is full.
+
+        Parameters
+        ----------
+        message : dict
+            The message passed to ``handle``.
+        key : hashable, optional
+            Topic of the message. Messages without a key are never coalesced.
+        """
+        async with self._changed:
+            if self._closed:
+                self.dropped += 1
+                return
+            if self._size >= self.maxsize:
+                if self.overflow == "block":
+                    start = time.monotonic()
+                    await self._changed.wait_for(lambda: self._size < self.maxsize or self._closed)
+                    self.blocked_seconds += time.monotonic() - start
+                    if self._closed:
+                        self.dropped += 1
+                        return
+                elif self.overflow == "coalesce" and key is not None and self._queues.get(key):
+                    queue = self._queues[key]
+                    queue[-1] = (queue[-1][0], message)
+                    self.enqueued += 1
+                    self.coalesced += 1
+                    return
+                else:
+                    self._drop_oldest()
+
+            queue = self._queues.setdefault(key, deque())
+            if not queue and key not in self._busy:
+                self._ready.append(key)
+            queue.append((next(self._sequence), message))
+            self._size += 1
+            self.enqueued += 1
+            self.max_depth = max(self.max_depth, self._size)
+            self._changed.notify_all()
+
+    def _drop_oldest(self):
+        key = min(
+            (key for key, queue in self._queues.items() if queue),
+            key=lambda key: self._queues[key][0][0],
+        )
+        self._queues[key].popleft()
+        self._size -= 1
+        self.dropped += 1
+        if not self._queues[key] and key not in self._busy:
+            self._ready.remove(key)
+            del self._queues[key]
+
+    async def _work(self):
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: self._ready or (self._closed and not self._size))
+                if not self._ready:
+                    return
+                key = self._ready.popleft()
+                _, message = self._queues[key].popleft()
+                self._size -= 1
+                self._busy.add(key)
+                self._changed.notify_all()
+
+            try:
+                await self._handle(message)
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Realtime callback failed for '{key}': {e!r}")
+            finally:
+                self.processed += 1
+                async with self._changed:
+                    self._busy.discard(key)
+                    if self._queues[key]:
+                        self._ready.append(key)
+                    else:
+                        del self._queues[key]
+                    self._changed.notify_all()
+
+    async def close(self, drain=True):
+        """
+        Stop the workers.
+
+        Parameters
+        ----------
+        drain : bool, optional
+            If True (default), queued messages are processed first.
+            Otherwise they are discarded and running callbacks are cancelled.
+        """
+        async with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+        if not drain:
+            self.dropped += self._size
+            self._queues = {key: deque() for key in self._busy}
+            self._ready.clear()
+            self._size = 0
+            for task in self._tasks:
+                task.cancel()
+        results = await asyncio.gather(*self._tasks, return_exceptions=True)
+        for task, result in zip(self._tasks, results):
+            if isinstance(result, Exception):
+                self.errors += 1
+                logger.error(f"Realtime worker '{task.get_name()}' failed: {result!r}")
+        self._tasks = []
+        # Messages put before the next start() may come from another loop.
+        self._changed = asyncio.Condition()
@@ -0,0 +1,244 @@
+# Standard Library Imports
+import asyncio
+import gzip
+import heapq
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+# Internal Project Imports
+from .realtime_sink import FileSink
+from ..utils.exceptions import ArgumentError, ParsingError
+from ..utils.logger import logger
+
+_STREAM_SUFFIX = ".jsonStream"
+_KEY_LENGTH = 12  # "HH:MM:SS.mmm" offset of each .jsonStream line
+
+
+def _open(path, mode):
+    return gzip.open(path, mode + "t", encoding="utf-8") if str(path).endswith(".gz") else open(path, mode, encoding="utf-8")
+
+
+class FrameRecorder:
+    """
+    Append-only recording of the raw SignalR frames received by a realtime client.
+
+    Each frame is written as one line of compact JSON, ``[received, frame]``,
+    where ``received`` is the Unix time it was received. Paths ending in
+    ``.gz`` are gzip compressed. Frames are written by a background
+    :class:`~livef1.adapters.realtime_sink.FileSink`, so recording does not
+    block the event loop. Recordings are read back with :func:`load_frames`
+    and played with :meth:`RealF1Client.replay`.
+
+    Parameters
+    ----------
+    path : str
+        File to append to.
+    flush_size, flush_interval : optional
+        Write thresholds of the sink (see
+        :class:`~livef1.adapters.realtime_sink.FileSink`).
+    """
+
+    def __init__(self, path, flush_size=1000, flush_interval=1.0):
+        self.path = str(path)
+        self.frames = 0
+        self.sink = FileSink(self.path, mode="a", flush_size=flush_size, flush_interval=flush_interval)
+
+    def write(self, frame, received=None):
+        """
+        Append a frame.
+
+        Parameters
+        ----------
+        frame : dict
+            The decoded SignalR frame.
+        received : float, optional
+            Unix time the frame was received. Defaults to now.
+        """
+        received = time.time() if received is None else received
+        self.sink.write([round(received, 6), frame])
+        self.frames += 1
+
+    def close(self):
+        """Write the buffered frames and close the file."""
+        self.sink.close()
+
+
+def read_recording(path):
+    """
+    Read the frames of a :class:`FrameRecorder` file.
+
+    Parameters
+    ----------
+    path : str
+        Recording file.
+
+    Yields
+    ------
+    tuple
+        ``(received, frame)`` pairs, in recording order.
+    """
+    with _open(path, "r") as handle:
+        for number, line in enumerate(handle, 1):
+            if not line.strip():
+                continue
+            try:
+                received, frame = json.loads(line)
+            except (json.JSONDecodeError, ValueError) as e:
+                raise ParsingError(f"Invalid frame on line {number} of '{path}': {e}") from e
+            yield received, frame
+
+
+def _stream_topic(path):
+    name = os.path.basename(str(path))
+    return name[:-len(_STREAM_SUFFIX)]
+
+
+def _stream_offset(key):
+    hours, minutes, seconds = key.split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def _read_stream(path, start):
+    """Yield ``(received, frame)`` pairs of a ``.jsonStream`` archive file."""
+    topic = _stream_topic(path)
+    with open(path, encoding="utf-8-sig") as handle:
+        for line in handle:
+            line = line.rstrip("\r\n")
+            if not line:
+                continue
+            try:
+                offset = _stream_offset(line[:_KEY_LENGTH])
+                data = json.loads(line[_KEY_LENGTH:])
+            except ValueError as e:
+                raise ParsingError(f"Invalid record in '{path}': {e}") from e
+            utc = start + timedelta(seconds=offset)
+            frame = {"M": [{"H": "Streaming", "M": "feed", "A": [topic, data, utc.strftime("%Y-%m-%dT%H:%M:%S.%fZ")]}]}
+            yield start.timestamp() + offset, frame
+
+
+def load_frames(source, topics=None, start=None):
+    """
+    Load frames to replay from a recording or from ``.jsonStream`` archives.
+
+    Parameters
+    ----------
+    source : str or list of str
+        A :class:`FrameRecorder` file, a ``.jsonStream`` file, a list of
+        ``.jsonStream`` files, or a directory of them (e.g. a downloaded
+        session archive). The topic of an archive file is its name without
+        ``.jsonStream``.
+    topics : list of str, optional
+        Only load the archive files of these topics. Recordings are always
+        loaded whole.
+    start : datetime, optional
+        UTC start of the archived session, used for the message timestamps.
+        Defaults to now.
+
+    Returns
+    -------
+    iterator of tuple
+        ``(received, frame)`` pairs in time order. Archive files are merged
+        by their time offsets.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        source = str(source)
+        if os.path.isdir(source):
+            paths = sorted(os.path.join(source, name) for name in os.listdir(source) if name.endswith(_STREAM_SUFFIX))
+        elif source.endswith(_STREAM_SUFFIX):
+            paths = [source]
+        else:
+            return read_recording(source)
+    else:
+        paths = [str(path) for path in source]
+
+    if topics is not None:
+        paths = [path for path in paths if _stream_topic(path) in topics]
+    if not paths:
+        raise ArgumentError(f"No .jsonStream files to replay in {source!r}.")
+    start = start or datetime.now(timezone.utc).replace(tzinfo=None)
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    return heapq.merge(*(_read_stream(path, start) for path in paths), key=lambda item: item[0])
+
+
+class ReplayTransport:
+    """
+    In-process stand-in for the SignalR websocket transport that plays frames back.
+
+    Frames are fired on the connection's ``received`` event with their
+    original spacing divided by ``speed``, like frames read from a websocket.
+    Invocations sent by the client, such as ``Subscribe``, are kept in
+    ``sent`` and not answered: recordings already contain the server's
+    responses.
+
+    Parameters
+    ----------
+    connection : :class:`~livef1.adapters.signalr_aio.Connection`
+        The connection to feed.
+    frames : iterable of tuple
+        ``(received, frame)`` pairs, as returned by :func:`load_frames`.
+    speed : float or None, optional
+        Playback speed: 1 plays in real time, 10 ten times faster. None plays
+        as fast as the client consumes the frames. Defaults to 1.
+    """
+
+    def __init__(self, connection, frames, speed=1.0):
+        if speed is not None and speed <= 0:
+            raise ArgumentError(f"Replay speed must be positive or None, got {speed}.")
+        self._connection = connection
+        self._frames = frames
+        self.speed = speed
+        self.sent = []
+        self.frames = 0
+        self.ws_loop = asyncio.get_running_loop()
+        self.finished = self.ws_loop.create_future()
+        self._task = None
+
+    def start(self):
+        # Called from another thread while the loop serves the client.
+        self.ws_loop.call_soon_threadsafe(self._start)
+
+    def _start(self):
+        self._task = asyncio.ensure_future(self._play())
+
+    def send(self, message):
+        self.sent.append(message)
+
+    def close(self):
+        if self._task is not None:
+            self.ws_loop.call_soon_threadsafe(self._task.cancel)
+
+    def reconnect(self):
+        pass
+
+    @property
+    def reconnects(self):
+        return 0
+
+    async def _play(self):
+        try:
+            self._connection.started = True
+            await self._connection.connected.fire()
+            clock = None
+            for received, frame in self._frames:
+                if self.speed is not None:
+                    if clock is None:
+                        clock = (received, time.monotonic())
+                    delay = clock[1] + (received - clock[0]) / self.speed - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                else:
+                    # Let the callbacks run between frames, as between websocket reads.
+                    await asyncio.sleep(0)
+                await self._connection.received.fire(**frame)
+                self.frames += 1
+        except Exception as e:
+            logger.error(f"Replay stopped after {self.frames} frames: {e!r}")
+            if not self.finished.done():
+                self.finished.set_exception(e)
+        finally:
+            self._connection.started = False
+            if not self.finished.done():
+                self.finished.set_result(self.frames)
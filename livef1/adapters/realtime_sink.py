@@ -0,0 +1,211 @@
+# Standard Library Imports
+import gzip
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Internal Project Imports
+from ..utils.logger import logger
+
+
+class FileSink:
+    """
+    Newline-delimited JSON file written from a background thread.
+
+    :meth:`write` only adds a record to an in-memory buffer, so it can be
+    called from the event loop without waiting for the disk. A writer thread
+    serializes and writes the buffered records once ``flush_size`` are
+    waiting or the oldest has waited ``flush_interval`` seconds.
+
+    Parameters
+    ----------
+    path : str
+        File to write. Paths ending in ``.gz`` are gzip compressed.
+    mode : str, optional
+        ``"w"`` (default) to truncate the file, ``"a"`` to append to it.
+    flush_size : int, optional
+        Number of buffered records that triggers a write, by default 1000.
+    flush_interval : float or None, optional
+        Maximum seconds a record is buffered, by default 1.0. None only
+        writes on ``flush_size`` and :meth:`close`.
+    max_bytes : int, optional
+        Rotate the file once this many bytes (before compression) were
+        written to it: ``path`` is renamed to ``path.1``, older files are
+        shifted to ``path.2``, ... and a new ``path`` is started. None
+        (default) never rotates.
+    backup_count : int, optional
+        Number of rotated files kept, by default all.
+    max_queue : int, optional
+        Maximum number of buffered records. When full, the oldest record is
+        dropped. None (default) buffers without limit.
+    """
+
+    def __init__(
+        self,
+        path,
+        mode="w",
+        flush_size=1000,
+        flush_interval=1.0,
+        max_bytes=None,
+        backup_count=None,
+        max_queue=None,
+    ):
+        if mode not in ("w", "a"):
+            raise ValueError(f"Invalid mode '{mode}'. Must be 'w' or 'a'.")
+        self.path = str(path)
+        self.flush_size = max(1, int(flush_size))
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.max_queue = max_queue
+
+        self._buffer = deque(maxlen=max_queue)
+        self._oldest = None     # monotonic time the oldest buffered record was written
+        self._changed = threading.Condition()
+        self._closed = False
+        self._bytes = 0
+
+        self.written = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.errors = 0
+        self.flush_lag = 0.0
+        self.max_flush_lag = 0.0
+
+        self._file = self._open(mode)
+        if mode == "a":
+            self._bytes = os.path.getsize(self.path)
+        self._thread = threading.Thread(target=self._run, name="livef1-file-sink", daemon=True)
+        self._thread.start()
+
+    @property
+    def queue_size(self):
+        """Number of records waiting to be written."""
+        return len(self._buffer)
+
+    def metrics(self):
+        """
+        Return the sink counters.
+
+        Returns
+        -------
+        dict
+            ``queue_size`` (records waiting), ``written``, ``dropped``,
+            ``flushes``, ``errors`` (failed writes), and ``flush_lag`` and
+            ``max_flush_lag``: seconds between the oldest record of a write
+            being buffered and the write reaching the file, for the last
+            write and the slowest one.
+        """
+        return {
+            "queue_size": len(self._buffer),
+            "written": self.written,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "errors": self.errors,
+            "flush_lag": self.flush_lag,
+            "max_flush_lag": self.max_flush_lag,
+        }
+
+    def write(self, record):
+        """
+        Buffer a JSON-serializable record. Values JSON cannot encode are written as strings.
+
+        Parameters
+        ----------
+        record : object
+            The record to write as one line.
+        """
+        self.write_many((record,))
+
+    def write_many(self, records):
+        """Buffer several records at once."""
+        with self._changed:
+            if self._closed:
+                raise ValueError("Cannot write to a closed FileSink.")
+            for record in records:
+                if self.max_queue is not None and len(self._buffer) == self.max_queue:
+                    self.dropped += 1
+                self._buffer.append(record)
+            if self._oldest is None and self._buffer:
+                # Start the writer's flush_interval countdown.
+                self._oldest = time.monotonic()
+                self._changed.notify()
+            elif len(self._buffer) >= self.flush_size:
+                self._changed.notify()
+
+    def close(self):
+        """Write the buffered records and close the file."""
+        with self._changed:
+            if self._closed:
+                return
+            self._closed = True
+            self._changed.notify()
+        self._thread.join()
+        self._file.close()
+
+    def _open(self, mode):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, mode + "t", encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+
+    def _due(self):
+        return (
+            self._closed
+            or len(self._buffer) >= self.flush_size
+            or (
+                self._oldest is not None
+                and self.flush_interval is not None
+                and time.monotonic() - self._oldest >= self.flush_interval
+            )
+        )
+
+    def _run(self):
+        while True:
+            with self._changed:
+                while not self._due():
+                    timeout = None
+                    if self._oldest is not None and self.flush_interval is not None:
+                        timeout = self.flush_interval - (time.monotonic() - self._oldest)
+                    self._changed.wait(timeout)
+                records, oldest = list(self._buffer), self._oldest
+                self._buffer.clear()
+                self._oldest = None
+                closed = self._closed
+            if records:
+                self._flush(records, oldest)
+            if closed:
+                return
+
+    def _flush(self, records, oldest):
+        try:
+            text = "".join(json.dumps(record, separators=(",", ":"), default=str) + "\n" for record in records)
+            self._file.write(text)
+            self._file.flush()
+            self._bytes += len(text)
+            self.written += len(records)
+            if self.max_bytes is not None and self._bytes >= self.max_bytes:
+                self._rotate()
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Writing {len(records)} records to '{self.path}' failed: {e!r}")
+        self.flushes += 1
+        self.flush_lag = time.monotonic() - oldest
+        self.max_flush_lag = max(self.max_flush_lag, self.flush_lag)
+
+    def _rotate(self):
+        self._file.close()
+        index = 1
+        while os.path.exists(f"{self.path}.{index}"):
+            index += 1
+        for i in range(index, 1, -1):
+            os.replace(f"{self.path}.{i - 1}", f"{self.path}.{i}")
+        os.replace(self.path, f"{self.path}.1")
+        if self.backup_count is not None:
+            i = self.backup_count + 1
+            while os.path.exists(f"{self.path}.{i}"):
+                os.remove(f"{self.path}.{i}")
+                i += 1
+        self._file = self._open("w")
+        self._bytes = 0
@@ -13,7 +13,7 @@ from .transports import Transport
 class Connection(object):
     protocol_version = '1.5'
 
-    def __init__(self, url, session=None):
+    def __init__(self, url, session=None, reconnect=True, backoff=1.0, max_backoff=30.0, transport=None):
         self.url = url
         self.__hubs = {}
         self.__send_counter = -1
@@ -21,7 +21,11 @@ class Connection(object):
         self.session = session
         self.received = EventHook()
         self.error = EventHook()
-        self.__transport = Transport(self)
+        self.connected = EventHook()
+        if transport is None:
+            self.__transport = Transport(self, reconnect=reconnect, backoff=backoff, max_backoff=max_backoff)
+        else:
+            self.__transport = transport(self)
         self.started = False
 
         async def handle_error(**data):
@@ -52,3 +56,14 @@ class Connection(object):
 
     def close(self):
         self.__transport.close()
+
+    def reconnect(self):
+        self.__transport.reconnect()
+
+    @property
+    def transport(self):
+        return self.__transport
+
+    @property
+    def reconnects(self):
+        return self.__transport.reconnects
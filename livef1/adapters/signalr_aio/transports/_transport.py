@@ -24,9 +24,13 @@ except ModuleNotFoundError:
     from json import dumps, loads
 import websockets
 import asyncio
+import inspect
+import random
 import sys
 import time
 
+from ....utils.logger import logger
+
 # uvloop is Unix-only (Linux, macOS); use default policy on Windows
 if sys.platform != "win32":
     try:
@@ -36,11 +40,36 @@ if sys.platform != "win32":
         pass
 
 
+def _header_option():
+    # websockets 14 renamed ``extra_headers`` to ``additional_headers``.
+    parameters = inspect.signature(websockets.connect).parameters
+    return 'additional_headers' if 'additional_headers' in parameters else 'extra_headers'
+
+
 class Transport:
-    def __init__(self, connection):
+    """
+    Websocket transport of a connection.
+
+    The websocket is supervised: when it drops, fails to open or is dropped
+    with ``reconnect()``, a new connection is negotiated after a jittered
+    exponential backoff (``backoff * 2 ** attempt`` seconds, capped at
+    ``max_backoff``, of which a random 50-100% is waited). The attempt count
+    restarts once a websocket opens. ``connection.connected`` is fired every
+    time a websocket opens, so subscriptions can be renewed.
+    """
+
+    def __init__(self, connection, reconnect=True, backoff=1.0, max_backoff=30.0):
         self._connection = connection
         self._ws_params = None
         self._conn_handler = None
+        self._socket_task = None
+        self._closing = False
+        self._dropped = False
+        self._opened = False
+        self.reconnect_enabled = reconnect
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.reconnects = 0
         self.ws_loop = None
         self.invoke_queue = None
         self.ws = None
@@ -50,17 +79,25 @@ class Transport:
     # Public Methods
 
     def start(self):
-        self._ws_params = WebSocketParameters(self._connection)
-        self._connect()
-        if not self.ws_loop.is_running():
+        self._closing = False
+        if self.ws_loop.is_running():
+            # Called from another thread while the loop serves the client.
+            self.ws_loop.call_soon_threadsafe(self._connect)
+        else:
+            self._connect()
             self.ws_loop.run_forever()
 
     def send(self, message):
         asyncio.Task(self.invoke_queue.put(InvokeEvent(message)), loop=self.ws_loop)
 
     def close(self):
+        self._closing = True
         asyncio.Task(self.invoke_queue.put(CloseEvent()), loop=self.ws_loop)
 
+    def reconnect(self):
+        """Drop the current websocket; the supervisor opens a new one."""
+        self.ws_loop.call_soon_threadsafe(self._drop_socket)
+
     # -----------------------------------
     # Private Methods
 
@@ -74,24 +111,71 @@ class Transport:
         self.invoke_queue = asyncio.Queue()
 
     def _connect(self):
-        self._conn_handler = asyncio.ensure_future(self._socket(self.ws_loop), loop=self.ws_loop)
+        self._conn_handler = asyncio.ensure_future(self._supervise(), loop=self.ws_loop)
+
+    def _drop_socket(self):
+        if self._socket_task is not None and not self._socket_task.done():
+            self._dropped = True
+            self._socket_task.cancel()
+
+    async def _supervise(self):
+        attempt = 0
+        while not self._closing:
+            self._opened = False
+            self._socket_task = asyncio.ensure_future(self._socket(self.ws_loop))
+            try:
+                await self._socket_task
+                reason = 'closed by the server'
+            except asyncio.CancelledError:
+                if not self._dropped:
+                    raise
+                reason = 'dropped'
+            except Exception as e:
+                reason = repr(e)
+            finally:
+                self._dropped = False
+                self._connection.started = False
+
+            if self._closing or not self.reconnect_enabled:
+                break
+            if self._opened:
+                attempt = 0
+            delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+            delay = random.uniform(delay / 2, delay)
+            attempt += 1
+            logger.warning(f'Websocket {reason}; reconnecting in {delay:.1f} seconds (attempt {attempt}).')
+            await asyncio.sleep(delay)
+            self.reconnects += 1
 
     async def _socket(self, loop):
-        async with websockets.connect(self._ws_params.socket_url, extra_headers=self._ws_params.headers,
-                                      loop=loop) as self.ws:
+        # Negotiate a new connection token for every websocket.
+        self._ws_params = await loop.run_in_executor(None, WebSocketParameters, self._connection)
+        options = {_header_option(): self._ws_params.headers}
+        async with websockets.connect(self._ws_params.socket_url, **options) as self.ws:
+            self._opened = True
             self._connection.started = True
+            await self._connection.connected.fire()
             await self._master_handler(self.ws)
 
     async def _master_handler(self, ws):
         consumer_task = asyncio.ensure_future(self._consumer_handler(ws), loop=self.ws_loop)
         producer_task = asyncio.ensure_future(self._producer_handler(ws), loop=self.ws_loop)
-        # done, pending = await asyncio.wait([consumer_task, producer_task],
-        #                                    loop=self.ws_loop, return_when=asyncio.FIRST_EXCEPTION)
-        done, pending = await asyncio.wait([consumer_task, producer_task],
-                                           return_when=asyncio.FIRST_EXCEPTION)
-
-        for task in pending:
-            task.cancel()
+        tasks = [consumer_task, producer_task]
+        try:
+            # done, pending = await asyncio.wait([consumer_task, producer_task],
+            #                                    loop=self.ws_loop, return_when=asyncio.FIRST_EXCEPTION)
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # Also when the socket is dropped: stop both handlers and collect
+            # their outcome, so none is left running on the old websocket.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        for task in done:
+            # Re-raise a dropped websocket so the supervisor reconnects.
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
 
     async def _consumer_handler(self, ws):
         while True:
@@ -109,11 +193,8 @@ class Transport:
                         await ws.send(dumps(event.message))
                     elif event.type == 'CLOSE':
                         await ws.close()
-                        while ws.open is True:
-                            await asyncio.sleep(0.1)
-                        else:
-                            self._connection.started = False
-                            break
+                        self._connection.started = False
+                        break
                 else:
                     break
                 self.invoke_queue.task_done()
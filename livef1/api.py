@@ -1,5 +1,5 @@
 from .adapters import LivetimingF1adapters, livetimingF1_request
-from .adapters.jolpicaf1_adapter import jolpica_client
+from .adapters.functions import fetch_jolpica_seasons
 from .models import (
     Session,
     Season,
@@ -15,8 +15,7 @@ from .utils.constants import SESSIONS_COLUMN_MAP
 from datetime import datetime
 
 def list_seasons() -> list:
-    res = jolpica_client.get_seasons(limit=100)
-    return [season.season for season in res.data.seasons]
+    return [season.season for season in fetch_jolpica_seasons()]
 
 def get_season(season: int) -> Season:
     """
@@ -1,15 +1,77 @@
 """Package-level configuration for LiveF1.
 
 Call :func:`configure` before running LiveF1 code to adjust logging and
-(in the future) other runtime settings.
+other runtime settings such as the Livetiming download cache.
 """
 
+import warnings
+
 from .utils.logger import configure_logging
 
 _UNSET = object()
 
-# Reserved for future non-logging package settings.
-_settings = {}
+# Non-logging package settings. Read them with :func:`get_setting`.
+_settings = {
+    # Livetiming download cache (disabled while ``cache_dir`` is None)
+    "cache_dir": None,
+    "cache_size_limit": 5 * 1024 ** 3,
+    # Seconds season-level metadata is kept in memory (0 disables)
+    "metadata_ttl": 600.0,
+    "offline": False,
+    # Shared HTTP transport
+    "http_pool_size": 10,
+    "http_retries": 3,
+    "http_backoff_factor": 0.5,
+    "http_timeout": 300,
+    # Concurrent topic downloads of Session.load_data(parallel=True)
+    "max_concurrent_downloads": 8,
+    # Incremental parsing of .jsonStream topics
+    "incremental_parse": False,
+    "stream_chunk_size": 64 * 1024,
+    # Batched decoding of compressed CarData.z / Position.z payloads
+    "parallel_decode": False,
+    "decode_workers": None,
+    "decode_chunk_size": 512,
+    # Columnar parsing of CarData.z / Position.z
+    "columnar_parse": False,
+    # Persistent lake storage (disabled while ``lake_dir`` is None)
+    "lake_dir": None,
+    "lake_format": "parquet",
+    # Silver table generation
+    "vectorized_laps": True,
+    "generate_workers": None,
+    "parallel_telemetry": False,
+    "telemetry_workers": None,
+    # Micro-batches of a live session lake
+    "live_batch_size": 1000,
+    "live_batch_interval": 0.5,
+    # Ingestion queue of the realtime client
+    "realtime_queue_size": 10000,
+    "realtime_overflow": "block",
+    "realtime_workers": 4,
+    # Batches of realtime callback records (1 and None deliver every update)
+    "realtime_batch_size": 1,
+    "realtime_batch_interval": None,
+    # Supervision of the realtime websocket
+    "realtime_stale_timeout": 30.0,
+    "realtime_reconnect_backoff": 1.0,
+    "realtime_reconnect_max_backoff": 30.0,
+    # Background writes of realtime log and recording files
+    "realtime_log_flush_size": 1000,
+    "realtime_log_flush_interval": 1.0,
+}
+
+
+def get_setting(name):
+    """
+    Return the current value of a non-logging package setting.
+
+    Parameters
+    ----------
+    name : str
+        Setting name, e.g. ``"cache_dir"``.
+    """
+    return _settings[name]
 
 
 def configure(
@@ -20,6 +82,39 @@ def configure(
     logging_file_path=_UNSET,
     logging_file_format=None,
     logging_file_datefmt=None,
+    cache_dir=_UNSET,
+    cache_size_limit=None,
+    metadata_ttl=None,
+    offline=None,
+    http_pool_size=None,
+    http_retries=None,
+    http_backoff_factor=None,
+    http_timeout=None,
+    max_concurrent_downloads=None,
+    incremental_parse=None,
+    stream_chunk_size=None,
+    parallel_decode=None,
+    decode_workers=_UNSET,
+    decode_chunk_size=None,
+    columnar_parse=None,
+    lake_dir=_UNSET,
+    lake_format=None,
+    vectorized_laps=None,
+    generate_workers=_UNSET,
+    parallel_telemetry=None,
+    telemetry_workers=_UNSET,
+    live_batch_size=None,
+    live_batch_interval=None,
+    realtime_queue_size=None,
+    realtime_overflow=None,
+    realtime_workers=None,
+    realtime_batch_size=None,
+    realtime_batch_interval=_UNSET,
+    realtime_stale_timeout=_UNSET,
+    realtime_reconnect_backoff=None,
+    realtime_reconnect_max_backoff=None,
+    realtime_log_flush_size=None,
+    realtime_log_flush_interval=None,
 ):
     """
     Configure LiveF1 package settings.
@@ -27,8 +122,9 @@ def configure(
     Call this before running LiveF1 code when you need non-default behaviour
     (for example logging in read-only environments such as AWS Lambda).
 
-    Logging options are supported today; additional package settings may be
-    added in future releases.
+    Besides logging, it sets the download cache, HTTP transport, parsing,
+    lake storage, table generation, live session and realtime client
+    settings below. Only the options passed are changed.
 
     Parameters
     ----------
@@ -47,6 +143,140 @@ def configure(
         Format string for the file handler.
     logging_file_datefmt : str, optional
         Date/time format for the file handler.
+    cache_dir : str or pathlib.Path or None, optional
+        Directory of the on-disk Livetiming download cache. Session topic
+        files are immutable once a session is over, so they are read from this
+        cache before touching the network. Pass ``None`` to disable caching.
+        Omit to leave unchanged. Caching is disabled by default.
+    cache_size_limit : int, optional
+        Maximum size of the cache in bytes. Least recently used files are
+        evicted once the limit is exceeded. Defaults to 5 GiB.
+    metadata_ttl : float, optional
+        Seconds season ``Index.json`` files and Jolpica season queries are
+        kept in memory and shared by ``get_season``, ``get_meeting``,
+        ``get_session`` and the season, meeting and session models. ``0``
+        fetches them on every use. Defaults to 600. See
+        :func:`livef1.clear_metadata_cache` to drop them earlier.
+    offline : bool, optional
+        If True, Livetiming downloads are served from the cache only and a
+        :class:`~livef1.utils.exceptions.CacheMissError` is raised, before any
+        network request, for files that have not been cached yet. This
+        includes every file while ``cache_dir`` is None and files that are
+        never cached, such as season indexes.
+    http_pool_size : int, optional
+        Number of keep-alive connections kept per host by the shared HTTP
+        session. Defaults to 10.
+    http_retries : int, optional
+        Number of retries for failed connections and 429/5xx responses.
+        Defaults to 3.
+    http_backoff_factor : float, optional
+        Exponential backoff factor between retries, in seconds. Defaults to 0.5.
+    http_timeout : float, optional
+        Default request timeout in seconds. Defaults to 300.
+    max_concurrent_downloads : int, optional
+        Maximum number of topics fetched at the same time when a session loads
+        several topics in parallel. Defaults to 8.
+    incremental_parse : bool, optional
+        If True, streamed topics such as ``CarData.z`` are read in chunks and
+        fed to the parsers record by record, so peak memory follows the chunk
+        size instead of the file size. The raw records are then not kept on
+        the bronze table (``table.raw`` is None). Defaults to False.
+    stream_chunk_size : int, optional
+        Number of bytes read at a time in incremental mode. Defaults to 64 KiB.
+    parallel_decode : bool, optional
+        If True, the compressed payloads of ``CarData.z`` and ``Position.z``
+        are decoded in batches across a pool of worker processes. Records keep
+        their original order. Worker processes are spawned and re-import the
+        main module, so scripts that turn this on must guard their entry point
+        with ``if __name__ == "__main__":``. Defaults to False.
+    decode_workers : int or None, optional
+        Number of decode worker processes. ``None`` uses one per CPU; 1
+        decodes in the calling process. Omit to leave unchanged.
+    decode_chunk_size : int, optional
+        Number of records sent to a worker at a time. Topics with fewer
+        records are decoded in the calling process. Defaults to 512.
+    columnar_parse : bool, optional
+        If True, ``CarData.z`` and ``Position.z`` are parsed straight into
+        typed column arrays (float32 channels and coordinates, uint8 gear and
+        DRS, nullable ``UInt8`` when a value is missing, categorical driver
+        numbers) instead of one dict per driver and
+        sample. ``Utc`` is then already a ``datetime64[ns]`` column rather
+        than a string. Defaults to False.
+    lake_dir : str or pathlib.Path or None, optional
+        Root directory for storing session data lakes. Bronze tables and
+        generated silver and gold tables are written under
+        ``<lake_dir>/<session path>/`` and read back lazily by later
+        processes, so a generated session does not have to be downloaded,
+        parsed and generated again. Pass ``None`` to disable. Omit to leave
+        unchanged. Disabled by default.
+    lake_format : str, optional
+        File format of stored tables: ``'parquet'`` or ``'arrow'`` (Arrow IPC,
+        memory-mapped on read), both requiring ``pyarrow``, or ``'pickle'``.
+        Defaults to ``'parquet'``.
+    vectorized_laps : bool, optional
+        If True, the ``laps`` silver table is built with whole-column
+        operations, walking only the sector updates in order to find lap
+        boundaries. False uses the original row-by-row builder. Both give the
+        same table. Defaults to True.
+
+        .. deprecated:: 1.3.0
+            ``vectorized_laps=False`` and the row-by-row builder will be
+            removed in LiveF1 1.4.0.
+    generate_workers : int or None, optional
+        Number of silver and gold tables :meth:`Session.generate` builds at
+        the same time. A table starts as soon as the tables it depends on are
+        done. ``None`` uses a thread pool sized from the CPU count; 1 builds
+        the tables one after another. Omit to leave unchanged.
+    parallel_telemetry : bool, optional
+        If True, the ``carTelemetry`` silver table is built one driver at a
+        time across a pool of worker processes and the drivers' rows are
+        concatenated in the same order as the serial build. As with
+        ``parallel_decode``, scripts must guard their entry point on
+        platforms that spawn processes. Defaults to False.
+    telemetry_workers : int or None, optional
+        Number of worker processes for ``parallel_telemetry``. ``None`` uses
+        one per CPU; 1 builds the table in the calling process. Omit to leave
+        unchanged.
+    live_batch_size : int, optional
+        Number of buffered live records that makes :meth:`Session.live`
+        append a batch to the session's tables. Defaults to 1000.
+    live_batch_interval : float, optional
+        Seconds after which buffered live records are appended even if there
+        are fewer than ``live_batch_size``. Defaults to 0.5.
+    realtime_queue_size : int, optional
+        Maximum number of received messages a ``RealF1Client`` keeps waiting
+        for its callbacks. Defaults to 10000.
+    realtime_overflow : str, optional
+        What a ``RealF1Client`` does with a message when its queue is full:
+        ``'block'`` (stop reading the websocket until there is room),
+        ``'drop-oldest'`` or ``'coalesce'`` (keep only the latest queued
+        message of the topic). Defaults to ``'block'``.
+    realtime_workers : int, optional
+        Number of tasks running ``RealF1Client`` callbacks. Messages of one
+        topic are handled in order. Defaults to 4.
+    realtime_batch_size : int, optional
+        Number of records of a topic ``RealF1Client`` callbacks receive
+        together. Defaults to 1, one call per update.
+    realtime_batch_interval : float or None, optional
+        Maximum seconds a record waits for its ``RealF1Client`` callback
+        batch to fill. ``None`` (default) sets no time limit. Omit to leave
+        unchanged.
+    realtime_stale_timeout : float or None, optional
+        Seconds without any frame after which a ``RealF1Client`` reopens its
+        websocket. ``None`` disables the check. Defaults to 30. Omit to leave
+        unchanged.
+    realtime_reconnect_backoff : float, optional
+        Base delay in seconds before reopening a dropped ``RealF1Client``
+        websocket. It doubles with every failed attempt, and a random 50-100%
+        of it is waited. Defaults to 1.
+    realtime_reconnect_max_backoff : float, optional
+        Maximum delay in seconds between reconnection attempts. Defaults to 30.
+    realtime_log_flush_size : int, optional
+        Number of buffered records that makes a ``RealF1Client`` write its
+        log or recording file. Defaults to 1000.
+    realtime_log_flush_interval : float, optional
+        Maximum seconds a record waits in the buffer before it is written.
+        Defaults to 1.
 
     Examples
     --------
@@ -61,6 +291,10 @@ def configure(
     ...     logging_file_path="logs/livef1.log",
     ...     logging_file_format="%(asctime)s %(levelname)s %(message)s",
     ... )
+    >>> # Cache session downloads between runs
+    >>> livef1.configure(cache_dir="~/.cache/livef1")
+    >>> # Keep generated tables between runs
+    >>> livef1.configure(lake_dir="~/.cache/livef1/lakes", lake_format="arrow")
     """
     logging_kwargs = {}
     if log_level is not None:
@@ -77,4 +311,91 @@ def configure(
         logging_kwargs["file_datefmt"] = logging_file_datefmt
 
     if logging_kwargs:
-        configure_logging(**logging_kwargs)
\ No newline at end of file
+        configure_logging(**logging_kwargs)
+
+    if cache_dir is not _UNSET:
+        _settings["cache_dir"] = None if cache_dir is None else str(cache_dir)
+    if cache_size_limit is not None:
+        _settings["cache_size_limit"] = int(cache_size_limit)
+    if metadata_ttl is not None:
+        _settings["metadata_ttl"] = max(0.0, float(metadata_ttl))
+    if offline is not None:
+        _settings["offline"] = bool(offline)
+    if max_concurrent_downloads is not None:
+        _settings["max_concurrent_downloads"] = max(1, int(max_concurrent_downloads))
+    if incremental_parse is not None:
+        _settings["incremental_parse"] = bool(incremental_parse)
+    if stream_chunk_size is not None:
+        _settings["stream_chunk_size"] = max(1, int(stream_chunk_size))
+    if parallel_decode is not None:
+        _settings["parallel_decode"] = bool(parallel_decode)
+    if decode_workers is not _UNSET:
+        _settings["decode_workers"] = None if decode_workers is None else max(1, int(decode_workers))
+    if decode_chunk_size is not None:
+        _settings["decode_chunk_size"] = max(1, int(decode_chunk_size))
+    if columnar_parse is not None:
+        _settings["columnar_parse"] = bool(columnar_parse)
+    if lake_dir is not _UNSET:
+        _settings["lake_dir"] = None if lake_dir is None else str(lake_dir)
+    if lake_format is not None:
+        from .data_processing.storage import STORAGE_FORMATS
+
+        if lake_format not in STORAGE_FORMATS:
+            raise ValueError(f"Invalid lake_format '{lake_format}'. Must be one of {list(STORAGE_FORMATS)}.")
+        _settings["lake_format"] = lake_format
+    if vectorized_laps is not None:
+        if not vectorized_laps:
+            warnings.warn(
+                "configure(vectorized_laps=False) and the row-by-row laps builder are deprecated "
+                "and will be removed in LiveF1 1.4.0. The default builder gives the same table.",
+                FutureWarning,
+                stacklevel=2,
+            )
+        _settings["vectorized_laps"] = bool(vectorized_laps)
+    if generate_workers is not _UNSET:
+        _settings["generate_workers"] = None if generate_workers is None else max(1, int(generate_workers))
+    if parallel_telemetry is not None:
+        _settings["parallel_telemetry"] = bool(parallel_telemetry)
+    if telemetry_workers is not _UNSET:
+        _settings["telemetry_workers"] = None if telemetry_workers is None else max(1, int(telemetry_workers))
+    if live_batch_size is not None:
+        _settings["live_batch_size"] = max(1, int(live_batch_size))
+    if live_batch_interval is not None:
+        _settings["live_batch_interval"] = max(0.0, float(live_batch_interval))
+    if realtime_queue_size is not None:
+        _settings["realtime_queue_size"] = max(1, int(realtime_queue_size))
+    if realtime_overflow is not None:
+        from .adapters.realtime_queue import OVERFLOW_POLICIES
+
+        if realtime_overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid realtime_overflow '{realtime_overflow}'. Must be one of {list(OVERFLOW_POLICIES)}.")
+        _settings["realtime_overflow"] = realtime_overflow
+    if realtime_workers is not None:
+        _settings["realtime_workers"] = max(1, int(realtime_workers))
+    if realtime_batch_size is not None:
+        _settings["realtime_batch_size"] = max(1, int(realtime_batch_size))
+    if realtime_batch_interval is not _UNSET:
+        _settings["realtime_batch_interval"] = None if realtime_batch_interval is None else max(0.0, float(realtime_batch_interval))
+    if realtime_stale_timeout is not _UNSET:
+        _settings["realtime_stale_timeout"] = None if realtime_stale_timeout is None else max(0.0, float(realtime_stale_timeout))
+    if realtime_reconnect_backoff is not None:
+        _settings["realtime_reconnect_backoff"] = max(0.0, float(realtime_reconnect_backoff))
+    if realtime_reconnect_max_backoff is not None:
+        _settings["realtime_reconnect_max_backoff"] = max(0.0, float(realtime_reconnect_max_backoff))
+    if realtime_log_flush_size is not None:
+        _settings["realtime_log_flush_size"] = max(1, int(realtime_log_flush_size))
+    if realtime_log_flush_interval is not None:
+        _settings["realtime_log_flush_interval"] = max(0.0, float(realtime_log_flush_interval))
+
+    http_kwargs = {
+        "http_pool_size": http_pool_size,
+        "http_retries": http_retries,
+        "http_backoff_factor": http_backoff_factor,
+        "http_timeout": http_timeout,
+    }
+    http_kwargs = {k: v for k, v in http_kwargs.items() if v is not None}
+    if http_kwargs:
+        from .utils.http import reset_http_session
+
+        _settings.update(http_kwargs)
+        reset_http_session()
\ No newline at end of file
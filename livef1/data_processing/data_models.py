@@ -1,5 +1,6 @@
 # Standard Library Imports
 import json
+import threading
 from datetime import datetime
 
 # Third-Party Library Imports
@@ -115,20 +116,90 @@ class Table:
         self.table_name = table_name
         self.table = None
         self.callback = None
+        self._loader = None
+        self._appended = []
+        self._load_lock = threading.Lock()
         self.df = None
-    
+
+    @property
+    def df(self):
+        # Tables reopened from lake storage read their data on first access,
+        # and rows appended since the last read are concatenated once.
+        if (self._df is None and self._loader is not None) or self._appended:
+            # Tables generated at the same time may read a shared source.
+            with self._load_lock:
+                if self._loader is not None:
+                    self._df = self._loader()
+                    self._loader = None
+                if self._appended:
+                    parts = [self._df] if self._df is not None else []
+                    self._df = pd.concat(parts + self._appended, ignore_index=True)
+                    self._appended = []
+        return self._df
+
+    @df.setter
+    def df(self, value):
+        self._df = value
+        self._loader = None
+        self._appended = []
+
+    def set_loader(self, loader):
+        """
+        Load the table's DataFrame lazily with ``loader()`` on first access.
+        """
+        self._df = None
+        self._loader = loader
+        self._appended = []
+
+    def append(self, df):
+        """
+        Append rows to the table.
+
+        The rows are concatenated to the table's DataFrame on the next read of
+        ``df``, so appending many small batches between reads copies the
+        table once instead of once per batch.
+        """
+        with self._load_lock:
+            self._appended.append(df)
+
+    def has_data(self):
+        """True if the table holds a DataFrame or can load one, without loading it."""
+        return self._df is not None or self._loader is not None or bool(self._appended)
+
+    def take_data(self, other):
+        """Use another table's DataFrame, or its pending loader, as this table's data."""
+        self._df = other._df
+        self._loader = other._loader
+        self._appended = list(other._appended)
+
     def generate_table(self):
         if self.callback:
+            # Fingerprint the inputs before they are read, so the recorded
+            # value describes exactly what the table was built from.
+            fingerprint = self.data_lake.table_fingerprint(self)
             self.df = self.callback(self)
             self.data_lake.update_metadata(
                 table_name = self.table_name,
                 level = None,
                 created_at = datetime.now(),
-                generated = True
+                generated = True,
+                fingerprint = fingerprint
             )
+            self.data_lake.persist_table(self.table_name)
         return self.df
 
 class BronzeTable(Table):
+    @classmethod
+    def from_loader(cls, table_name, loader, data_lake = None):
+        """
+        Create a bronze table whose DataFrame is read by ``loader()`` on first access.
+        """
+        table = cls.__new__(cls)
+        Table.__init__(table, table_name, data_lake)
+        table.raw = None
+        table.set_loader(loader)
+        return table
+
     def __init__(self, table_name, data, parsed_data, data_lake = None):
         super().__init__(table_name, data_lake)
         self.raw = data
@@ -161,6 +232,8 @@ class SilverTable(Table):
         self.source_tables = _fresh_source_tables_dict(source_tables)
         self.df = None
         self.dependency_tables = []
+        # Topics the callback reads through the session rather than as sources
+        self.session_sources = []
 
     def refine_sources(self):
         for source in self.sources:
@@ -183,6 +256,8 @@ class GoldTable(Table):
         self.source_tables = _fresh_source_tables_dict(source_tables)
         self.df = None
         self.dependency_tables = []
+        # Topics the callback reads through the session rather than as sources
+        self.session_sources = []
 
 
     def refine_sources(self):
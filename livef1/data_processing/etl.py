@@ -6,6 +6,7 @@ import pandas as pd
 from typing import Optional, Union
 
 # Internal Project Imports
+from ..config import get_setting
 from ..utils.helper import *
 from ..utils.exceptions import (
     MissingFunctionError,
@@ -52,7 +53,10 @@ class livef1SessionETL:
         
         Returns
         ----------
-            Parsed data from the respective function in the function map.
+            Parsed data from the respective function in the function map. When
+            the ``columnar_parse`` setting is on, topics in
+            ``columnar_function_map`` return a dict of column arrays instead of
+            a generator of records.
         """
         if title not in self.function_map:
             logger.error(f"No parser function found for title: {title}")
@@ -61,7 +65,10 @@ class livef1SessionETL:
         try:
             # Perform the parsing
             logger.debug(f"Using parser function for title: {title}")
-            parsed_data = self.function_map[title](data, self.session.key, session_path = self.session.path)
+            parser = self.function_map[title]
+            if get_setting("columnar_parse") and title in columnar_function_map:
+                parser = columnar_function_map[title]
+            parsed_data = parser(data, self.session.key, session_path = self.session.path)
             logger.debug(f"Parsing successful for title: {title}")
             return parsed_data
         except Exception as e:
@@ -190,3 +197,9 @@ function_map = {
     'LapCount': parse_basic
 }
 
+# Columnar parsers used instead of the record parsers above when the
+# ``columnar_parse`` setting is on
+columnar_function_map = {
+    'Position.z': parse_position_z_columnar,
+    'CarData.z': parse_car_data_z_columnar,
+}
@@ -0,0 +1,54 @@
+# Standard Library Imports
+import hashlib
+import inspect
+
+_callback_fingerprints = {}
+
+
+def combine_fingerprints(*parts):
+    """
+    Combine fingerprints and other strings into one fingerprint.
+
+    Returns None if any part is None, so a table with an unknown input is
+    never considered up to date.
+    """
+    if any(part is None for part in parts):
+        return None
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def callback_fingerprint(callback):
+    """
+    Return a hash of a table callback's source code.
+
+    Decorated callbacks are unwrapped first. When the source is not
+    available (e.g. functions typed into a REPL), the compiled code object
+    is hashed instead.
+
+    Parameters
+    ----------
+    callback : callable or None
+
+    Returns
+    -------
+    str or None
+        Hex digest, or None if ``callback`` is None.
+    """
+    if callback is None:
+        return None
+    func = inspect.unwrap(callback)
+    code = getattr(func, "__code__", None)
+    if code is not None and code in _callback_fingerprints:
+        return _callback_fingerprints[code]
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = repr((code.co_code, code.co_consts, code.co_names)) if code is not None else repr(func)
+    fingerprint = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    if code is not None:
+        _callback_fingerprints[code] = fingerprint
+    return fingerprint
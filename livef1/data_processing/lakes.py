@@ -1,10 +1,20 @@
+import os
+import time
 import pandas as pd
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import partial
+from pathlib import Path
 
+from ..config import get_setting
 from ..utils.logger import logger
 from ..utils.constants import TABLE_GENERATION_FUNCTIONS, TABLE_REQUIREMENTS
 from .silver_functions import *
 from .data_models import *
+from .storage import get_storage
+from .fingerprint import callback_fingerprint, combine_fingerprints
+
+_UNSET = object()
 
 # class BronzeLake:
 #     def __init__(self, session, great_lake):
@@ -309,34 +319,123 @@ class GoldLake(SimpleLake):
 
 
 class DataLake:
-    def __init__(self, session):
+    """
+    Medallion (bronze/silver/gold) store of a session's tables.
+
+    Tables are kept in memory. With a storage backend (see
+    :mod:`livef1.data_processing.storage`), bronze tables and generated silver
+    and gold tables are also written to disk along with the lake metadata.
+    A lake opened on the same directory later lists those tables in its
+    metadata and reads each one only when it is first used.
+
+    Parameters
+    ----------
+    session : :class:`~livef1.models.session.Session`
+        The session the lake belongs to.
+    storage : :class:`~livef1.data_processing.storage.LakeStorage`, optional
+        Storage backend. Defaults to one under the ``lake_dir`` setting, or
+        none if that setting is not set.
+    """
+
+    def __init__(self, session, storage=None):
         self.session = session
         self.metadata = {}
 
         self.bronze = BronzeLake(great_lake=self)
         self.silver = SilverLake(great_lake=self)
         self.gold = GoldLake(great_lake=self)
+
+        self.storage = storage if storage is not None else self._default_storage(session)
+        if self.storage is not None:
+            self.metadata.update(self.storage.read_metadata())
+            if self.metadata:
+                logger.info(f"Found {len(self.metadata)} stored tables in {self.storage.directory}.")
+
+    @staticmethod
+    def _default_storage(session):
+        lake_dir = get_setting("lake_dir")
+        if lake_dir is None:
+            return None
+        session_dir = getattr(session, "path", None)
+        if not isinstance(session_dir, str) or not session_dir.strip("/"):
+            session_dir = str(getattr(session, "key", "session"))
+        return get_storage(Path(lake_dir) / session_dir.strip("/"), get_setting("lake_format"))
+
+    def is_stored(self, table_name):
+        """True if a table is in the storage backend."""
+        info = self.metadata.get(table_name)
+        return (
+            self.storage is not None
+            and info is not None
+            and self.storage.has_table(info["table_type"], table_name)
+        )
+
+    def persist_table(self, table_name):
+        """
+        Write a table and the lake metadata to the storage backend, if there is one.
+
+        Tables that the backend cannot serialise are logged and kept in memory only.
+        """
+        if self.storage is None or table_name not in self.metadata:
+            return
+        level = self.metadata[table_name]["table_type"]
+        table = self.get(level, table_name)
+        if table is None or table.df is None:
+            return
+        try:
+            self.storage.write_table(level, table_name, table.df)
+            self.storage.write_metadata(self.metadata)
+            logger.debug(f"'{table_name}' has been written to {self.storage.directory}.")
+        except ImportError:
+            raise
+        except Exception as e:
+            logger.warning(f"Could not store table '{table_name}': {e}")
+
+    def _stored_loader(self, level, table_name):
+        if self.storage is None or not self.storage.has_table(level, table_name):
+            return None
+        return partial(self.storage.read_table, level, table_name)
+
+    def _open_stored_table(self, level, table_name):
+        """Create a lazily loaded table object for a table found in storage."""
+        info = self.metadata.get(table_name)
+        if info is None or info["table_type"] != level:
+            return None
+        loader = self._stored_loader(level, table_name)
+        if loader is None:
+            return None
+        if level == "bronze":
+            return BronzeTable.from_loader(table_name, loader, data_lake=self)
+        table_cls = SilverTable if level == "silver" else GoldTable
+        table = table_cls(table_name, sources=[], data_lake=self)
+        table.set_loader(loader)
+        return table
     
     def update_metadata(
         self,
         table_name,
         level,
         created_at=None,
-        generated=False
+        generated=False,
+        fingerprint=_UNSET
         ):
 
         if table_name in self.metadata:
+            info = self.metadata[table_name]
             self.metadata[table_name] = {
-                "table_type": level if level else self.metadata[table_name]["table_type"],
-                "created_at": created_at if created_at else self.metadata[table_name]["created_at"],
-                "generated" : generated if generated else self.metadata[table_name]["generated"]
+                **info,
+                "table_type": level if level else info["table_type"],
+                "created_at": created_at if created_at else info["created_at"],
+                "generated" : generated if generated else info["generated"],
+                "fingerprint": info.get("fingerprint") if fingerprint is _UNSET else fingerprint,
             }
         
         else:
             self.metadata[table_name] = {
                 "table_type": level,
                 "created_at": created_at,
-                "generated" : generated
+                "generated" : generated,
+                "fingerprint": None if fingerprint is _UNSET else fingerprint,
             }
     
     def put(self, level, table_name, table):
@@ -351,15 +450,18 @@ class DataLake:
             The data to store.
         """
 
-        if level == "bronze":
-            self.bronze.put(table_name, table)
-        elif level == "silver":
-            self.silver.put(table_name, table)
-        elif level == "gold":
-            self.gold.put(table_name, table)
-        else:
-            raise ValueError("Invalid level. Must be one of 'bronze', 'silver', or 'gold'.")
-    
+        previous = self._lake(level).lake.get(table_name)
+        self._lake(level).put(table_name, table)
+        # A table registered again (e.g. a default silver table) reuses its
+        # generated data; generate() rebuilds it only if its inputs changed.
+        if not table.has_data() and self.metadata.get(table_name, {}).get("generated"):
+            if previous is not None and previous is not table and previous.has_data():
+                table.take_data(previous)
+            else:
+                loader = self._stored_loader(level, table_name)
+                if loader is not None:
+                    table.set_loader(loader)
+
     def get(self, level: str, table_name: str):
         """
         Retrieve the data from the DataLake.
@@ -376,12 +478,20 @@ class DataLake:
         object
             The requested data or None if it does not exist.
         """
+        lake = self._lake(level)
+        if not lake.has_data(table_name):
+            table = self._open_stored_table(level, table_name)
+            if table is not None:
+                lake.lake[table_name] = table
+        return lake.get(table_name)
+
+    def _lake(self, level):
         if level == "bronze":
-            return self.bronze.get(table_name)
+            return self.bronze
         elif level == "silver":
-            return self.silver.get(table_name)
+            return self.silver
         elif level == "gold":
-            return self.gold.get(table_name)
+            return self.gold
         else:
             raise ValueError("Invalid level. Must be one of 'bronze', 'silver', or 'gold'.")
     
@@ -435,24 +545,58 @@ class DataLake:
             raise ValueError("Invalid level. Must be one of 'bronze', 'silver', or 'gold'.")
 
 
-    def create_bronze_table(self, table_name, raw_data, parsed_data):
+    def create_bronze_table(self, table_name, raw_data, parsed_data, source=None):
         """
         Decorator factory that creates a BronzeTable instance
         
         Args:
             source_tables: List of source tables to use (BronzeTable instances in BronzeLake)
             table_name: Optional name for the table, defaults to function name if None
+            source: Fingerprint of where the data was retrieved from (e.g. its
+                URL and body digest). It becomes the table's fingerprint; with None,
+                the tables built from it are never considered up to date.
         """
-        self.put(
-            level="bronze",
+        table = BronzeTable(
             table_name=table_name,
-            table= BronzeTable(
-                table_name=table_name,
-                data=raw_data,  
-                parsed_data=parsed_data
-            )
+            data=raw_data,
+            parsed_data=parsed_data
         )
-    
+        self.put(level="bronze", table_name=table_name, table=table)
+        # A topic retrieved from a different source (e.g. a file whose content
+        # changed since it was last loaded) makes the tables built from it stale.
+        self.update_metadata(table_name=table_name, level=None, fingerprint=source)
+        self.persist_table(table_name)
+
+    def append_bronze_table(self, table_name, parsed_data):
+        """
+        Append parsed records to a bronze table, creating it if needed.
+
+        The records are normalised like a loaded topic (column names, dtypes,
+        ``timestamp`` as a timedelta) and concatenated to the table on its
+        next read. The table's fingerprint is cleared, so every table built
+        from it is stale, and the table is not written to lake storage.
+
+        Parameters
+        ----------
+        table_name : str
+            The topic name.
+        parsed_data : list of dict or pandas.DataFrame
+            The new records.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The normalised new rows.
+        """
+        rows = BronzeTable(table_name=table_name, data=None, parsed_data=parsed_data).df
+        table = self.get("bronze", table_name) if table_name in self.metadata else None
+        if table is None:
+            table = BronzeTable.from_loader(table_name, None, data_lake=self)
+            self.put(level="bronze", table_name=table_name, table=table)
+        table.append(rows)
+        self.update_metadata(table_name=table_name, level=None, created_at=datetime.now(), fingerprint=None)
+        return rows
+
     def _identify_table_level(self, table_name):
         """
         Identify the level of a table
@@ -546,6 +690,195 @@ class DataLake:
 
         return result
 
+    def table_fingerprint(self, table, _memo=None):
+        """
+        Fingerprint the inputs a silver or gold table is generated from.
+
+        Combines the hash of the table's callback source, the package
+        version, the source fingerprints of its bronze tables and, recursively,
+        the fingerprints of its silver and gold sources. It only depends on
+        inputs, so it can be computed before the table is (re)generated and
+        compared with the fingerprint recorded when the table was last
+        generated.
+
+        Parameters
+        ----------
+        table : SilverTable or GoldTable
+            A table with its ``sources`` set.
+
+        Returns
+        -------
+        str or None
+            Hex digest, or None if an input is unknown (e.g. a bronze topic
+            that has not been loaded yet). A table without a callback, such as
+            one reopened from storage and not registered again, keeps its
+            recorded fingerprint.
+        """
+        from .. import __version__
+
+        memo = {} if _memo is None else _memo
+        name = table.table_name
+        if name in memo:
+            return memo[name]
+        memo[name] = None  # guards against cycles
+
+        if table.callback is None:
+            fingerprint = self.metadata.get(name, {}).get("fingerprint")
+        else:
+            parts = [callback_fingerprint(table.callback), __version__]
+            sources = [*(getattr(table, "sources", []) or []), *getattr(table, "session_sources", [])]
+            for source in sources:
+                level = self._identify_table_level(source)
+                if level in ("silver", "gold"):
+                    source_table = self.get(level, source)
+                    parts.append(None if source_table is None else self.table_fingerprint(source_table, memo))
+                else:
+                    topic = source if source in self.metadata else self.session.check_data_name(source)
+                    parts.append(self.metadata.get(topic, {}).get("fingerprint"))
+            fingerprint = combine_fingerprints(name, *parts)
+
+        memo[name] = fingerprint
+        return fingerprint
+
+    def fresh_tables(self, tables):
+        """
+        Return the names of tables whose data is up to date with their inputs.
+
+        A table is fresh if it has been generated, its data is in memory or
+        in lake storage, and the fingerprint recorded at generation equals
+        :meth:`table_fingerprint` for the current inputs. Every other table,
+        and every table depending on one, needs to be generated again.
+
+        Parameters
+        ----------
+        tables : list of SilverTable or GoldTable
+
+        Returns
+        -------
+        set of str
+        """
+        memo = {}
+        fresh = set()
+        for table in tables:
+            name = table.table_name
+            info = self.metadata.get(name, {})
+            recorded = info.get("fingerprint")
+            if not info.get("generated") or recorded is None:
+                continue
+            if not (table.has_data() or self.is_stored(name)):
+                continue
+            if recorded == self.table_fingerprint(table, memo):
+                fresh.add(name)
+        return fresh
+
+    def generate_tables(self, tables, generate=None, max_workers=None):
+        """
+        Generate tables, running independent tables at the same time.
+
+        Each table starts as soon as every table it depends on within
+        ``tables`` has finished, on a pool of ``max_workers`` threads. A
+        table whose generation raises is logged and its dependents are
+        skipped; the other tables still run.
+
+        Parameters
+        ----------
+        tables : list of SilverTable or GoldTable
+            Tables to generate, with their ``dependency_tables`` resolved.
+        generate : callable, optional
+            Called with each table to generate it. Defaults to
+            ``table.generate_table()``.
+        max_workers : int, optional
+            Number of tables generated at the same time. 1 generates them one
+            after another in the calling thread. Defaults to the
+            ``generate_workers`` setting.
+
+        Returns
+        -------
+        dict
+            Wall time in seconds of each table that was generated, in
+            completion order.
+
+        Raises
+        ------
+        ValueError
+            If the tables have a circular dependency.
+        """
+        if generate is None:
+            generate = lambda table: table.generate_table()
+        if max_workers is None:
+            max_workers = get_setting("generate_workers") or min(32, (os.cpu_count() or 1) + 4)
+
+        ordered = self._topo_sort_tables(tables)
+        names = {t.table_name for t in ordered}
+        waiting_on = {
+            t.table_name: {dep.table_name for dep in getattr(t, "dependency_tables", []) or [] if dep.table_name in names}
+            for t in ordered
+        }
+        dependents = {name: [] for name in names}
+        for name, deps in waiting_on.items():
+            for dep_name in deps:
+                dependents[dep_name].append(name)
+        tables_by_name = {t.table_name: t for t in ordered}
+        timings = {}
+        failed = set()
+
+        def run(table):
+            start = time.perf_counter()
+            generate(table)
+            return time.perf_counter() - start
+
+        def fail(name, error):
+            level = self.metadata.get(name, {}).get("table_type", "")
+            logger.error(f"Failed to generate {level} table '{name}': {error}")
+            logger.debug(f"Traceback: ", exc_info=error)
+            return release(name, ok=False)
+
+        def release(name, ok=True):
+            """Mark a table as finished and return the dependents it made ready."""
+            ready = []
+            for dependent in dependents[name]:
+                waiting_on[dependent].discard(name)
+                if not ok:
+                    failed.add(dependent)
+                if waiting_on[dependent]:
+                    continue
+                if dependent in failed:
+                    logger.error(f"Skipped table '{dependent}' because a table it depends on failed.")
+                    ready.extend(release(dependent, ok=False))
+                else:
+                    ready.append(dependent)
+            return ready
+
+        ready = [t.table_name for t in ordered if not waiting_on[t.table_name]]
+
+        if max_workers <= 1:
+            while ready:
+                name = ready.pop(0)
+                try:
+                    timings[name] = run(tables_by_name[name])
+                except Exception as e:
+                    ready.extend(fail(name, e))
+                else:
+                    ready.extend(release(name))
+            return timings
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="livef1-generate") as pool:
+            running = {}
+            while ready or running:
+                for name in ready:
+                    running[pool.submit(run, tables_by_name[name])] = name
+                ready = []
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        timings[name] = future.result()
+                    except Exception as e:
+                        ready.extend(fail(name, e))
+                    else:
+                        ready.extend(release(name))
+        return timings
+
     def _check_circular_dependencies(self):
         """
         Check for circular dependencies in the tables across different levels.
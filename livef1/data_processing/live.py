@@ -0,0 +1,265 @@
+# Standard Library Imports
+import asyncio
+import threading
+import time
+from collections import defaultdict
+
+# Third-Party Library Imports
+import pandas as pd
+
+# Internal Project Imports
+from ..config import get_setting
+from ..utils.constants import LIVE_TOPICS
+from ..utils.helper import to_datetime
+from ..utils.logger import logger
+from .silver_functions import extend_car_telemetry_table
+
+# Topics whose new rows can change the laps table
+_LAP_TOPICS = {"TimingData", "RaceControlMessages", "TyreStintSeries", "TrackStatus"}
+# Topics telemetry is interpolated from
+_SAMPLE_TOPICS = ("CarData.z", "Position.z")
+
+
+class LiveSessionLake:
+    """
+    Keeps a session's data lake up to date from a live timing stream.
+
+    Records received by a :class:`~livef1.adapters.realtime_client.RealF1Client`
+    are buffered per topic and appended to the session's bronze tables in
+    micro-batches, once ``batch_size`` records are buffered or
+    ``batch_interval`` seconds have passed since the last batch. After each
+    batch, ``session.laps`` is rebuilt in memory if lap-related topics changed, and
+    ``session.carTelemetry`` is extended with the samples of the laps
+    completed since the previous batch only.
+
+    Live messages carry UTC times, so record timestamps are stored as the
+    time since ``session.first_datetime`` (the first message received, unless
+    it was already set).
+
+    Parameters
+    ----------
+    session : :class:`~livef1.models.session.Session`
+        The session to fill.
+    batch_size : int, optional
+        Number of buffered records that triggers a batch. Defaults to the
+        ``live_batch_size`` setting.
+    batch_interval : float, optional
+        Seconds after which buffered records are written even if there are
+        fewer than ``batch_size``. Defaults to the ``live_batch_interval`` setting.
+
+    Attributes
+    ----------
+    batches : int
+        Number of batches written so far.
+    last_batch_seconds : float or None
+        Time the last batch took, from buffer to updated silver tables.
+    """
+
+    def __init__(self, session, batch_size=None, batch_interval=None):
+        self.session = session
+        self.batch_size = batch_size if batch_size is not None else get_setting("live_batch_size")
+        self.batch_interval = batch_interval if batch_interval is not None else get_setting("live_batch_interval")
+        self.batches = 0
+        self.last_batch_seconds = None
+
+        self._buffer = defaultdict(list)
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._latest_datetime = None
+        # Car and position samples of laps that are not in carTelemetry yet
+        self._samples = {topic: [] for topic in _SAMPLE_TOPICS}
+        # Last lap of each driver already in carTelemetry, and its end
+        self._telemetry_laps = {}
+        self._telemetry_until = {}
+
+    def attach(self, client, method="livef1 live lake"):
+        """
+        Subscribe ``client`` to the live topics and feed its records to the lake.
+
+        Parameters
+        ----------
+        client : :class:`~livef1.adapters.realtime_client.RealF1Client`
+            The client to read from. Topics in ``LIVE_TOPICS`` are added to
+            its subscription.
+        method : str, optional
+            Name the callback is registered under.
+
+        Returns
+        -------
+        :class:`~livef1.adapters.realtime_client.RealF1Client`
+            ``client``, to be started with ``client.run()``.
+        """
+        client.topics.extend(topic for topic in LIVE_TOPICS if topic not in client.topics)
+        client.callback(method)(self.ingest)
+        return client
+
+    async def ingest(self, records):
+        """
+        Buffer records from the realtime client, writing a batch when one is due.
+
+        The batch is written on a worker thread so the event loop keeps
+        receiving messages meanwhile.
+        """
+        if self.add_records(records):
+            await asyncio.get_running_loop().run_in_executor(None, self.flush)
+
+    def add_records(self, records):
+        """
+        Buffer parsed records.
+
+        Parameters
+        ----------
+        records : dict
+            Lists of parsed records by topic, as passed to realtime callbacks.
+
+        Returns
+        -------
+        bool
+            True if a batch is due.
+        """
+        with self._buffer_lock:
+            for topic, rows in records.items():
+                if rows:
+                    self._buffer[topic].extend(rows)
+                    self._buffered += len(rows)
+            return self._buffered >= self.batch_size or time.monotonic() - self._last_flush >= self.batch_interval
+
+    def flush(self):
+        """
+        Append the buffered records to the bronze tables and extend the silver tables.
+
+        Returns
+        -------
+        dict
+            Number of records written per topic.
+        """
+        with self._flush_lock:
+            with self._buffer_lock:
+                buffer, self._buffer = self._buffer, defaultdict(list)
+                self._buffered = 0
+                self._last_flush = time.monotonic()
+            if not buffer:
+                return {}
+
+            start = time.perf_counter()
+            lake = self.session.data_lake
+            for topic, rows in buffer.items():
+                new_rows = lake.append_bronze_table(topic, self._frame(rows))
+                if topic in self._samples:
+                    new_rows = new_rows.copy(deep=False)
+                    new_rows["Utc"] = to_datetime(new_rows["Utc"])
+                    self._samples[topic].append(new_rows)
+
+            if _LAP_TOPICS.intersection(buffer):
+                self._update_laps()
+            self._extend_car_telemetry()
+
+            self.batches += 1
+            self.last_batch_seconds = time.perf_counter() - start
+            counts = {topic: len(rows) for topic, rows in buffer.items()}
+            logger.debug(f"Live batch {self.batches} written in {self.last_batch_seconds:.3f} seconds: {counts}")
+            return counts
+
+    def _frame(self, rows):
+        """Build a DataFrame of records, with timestamps relative to the session start."""
+        df = pd.DataFrame(rows)
+        if "timestamp" in df.columns:
+            stamps = pd.Series(to_datetime(df["timestamp"].to_numpy()), index=df.index)
+            # Snapshot records ("R" messages) have no time; use the latest seen.
+            stamps = stamps.ffill()
+            if self._latest_datetime is not None:
+                stamps = stamps.fillna(self._latest_datetime)
+            stamps = stamps.bfill().fillna(pd.Timestamp.now(tz="UTC").tz_localize(None))
+            self._latest_datetime = stamps.max()
+            session_dict = self.session.__dict__
+            if "first_datetime" not in session_dict:
+                session_dict["first_datetime"] = stamps.min()
+            session_dict.setdefault("session_start_datetime", session_dict["first_datetime"])
+            df["timestamp"] = stamps - session_dict["first_datetime"]
+        # Live parsers do not know the session key.
+        for column in ("SessionKey", "session_key"):
+            if column in df.columns:
+                df[column] = getattr(self.session, "key", None)
+        return df
+
+    def _update_laps(self):
+        """
+        Rebuild ``session.laps`` from the bronze tables received so far.
+
+        The table is kept in memory only: its inputs change with every batch,
+        so it is neither fingerprinted nor written to lake storage.
+        """
+        lake = self.session.data_lake
+        table = lake.silver.lake.get("laps")
+        if table is None:
+            self.session._load_default_silver_tables()
+            table = lake.silver.lake["laps"]
+        if table.callback is None or any(source not in lake.metadata for source in table.sources):
+            return
+        try:
+            laps = table.callback(table)
+        except Exception as e:
+            # E.g. no lap has been completed yet.
+            logger.debug(f"Live laps could not be built yet: {e}")
+            return
+        table.df = laps
+        lake.update_metadata(table_name="laps", level=None, generated=True, fingerprint=None)
+        self.session.__dict__["laps"] = laps
+
+    def _extend_car_telemetry(self):
+        """Append the telemetry of laps completed since the last batch to ``session.carTelemetry``."""
+        session = self.session
+        lake = session.data_lake
+        laps = session.__dict__.get("laps")
+        if laps is None or laps.empty or not all(self._samples.values()):
+            return
+        if any(topic not in lake.metadata for topic in ("TyreStintSeries", "TrackStatus", "TimingData")):
+            return
+
+        completed = laps.dropna(subset=["LapStartDate", "LapTime"])
+        done = completed["DriverNo"].astype(object).map(self._telemetry_laps).fillna(0)
+        new_laps = completed[completed["LapNo"] > done]
+        if new_laps.empty:
+            return
+
+        # Samples of each driver from the start of their first new lap up to,
+        # but not including, the end of their last one: a sample at a lap end
+        # belongs to the next lap, as in a full build.
+        new_laps = new_laps.assign(LapEndDate=new_laps["LapStartDate"] + new_laps["LapTime"])
+        by_driver = new_laps.groupby(new_laps["DriverNo"].astype(object)).agg(
+            LapNo=("LapNo", "max"), LapStartDate=("LapStartDate", "min"), LapEndDate=("LapEndDate", "max")
+        )
+        samples = {}
+        for topic, parts in self._samples.items():
+            df = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+            self._samples[topic] = [df]
+            drivers = df["DriverNo"].astype(object)
+            in_new_laps = (df["Utc"] >= drivers.map(by_driver["LapStartDate"])) & (df["Utc"] < drivers.map(by_driver["LapEndDate"]))
+            samples[topic] = df[in_new_laps]
+
+        df_circuits = lake.get("bronze", "track_regions").df if "track_regions" in lake.metadata else None
+        telemetry = extend_car_telemetry_table(
+            session,
+            session.__dict__.get("carTelemetry"),
+            samples["CarData.z"],
+            samples["Position.z"],
+            lake.get("bronze", "TyreStintSeries").df.copy(deep=False),
+            new_laps.drop(columns="LapEndDate"),
+            lake.get("bronze", "TrackStatus").df,
+            lake.get("bronze", "TimingData").df,
+            df_circuits,
+        )
+        session.__dict__["carTelemetry"] = telemetry
+        table = lake.silver.lake.get("carTelemetry")
+        if table is not None:
+            table.df = telemetry
+            lake.update_metadata(table_name="carTelemetry", level=None, generated=True, fingerprint=None)
+
+        # Samples before the end of a driver's last processed lap are not needed again.
+        self._telemetry_laps.update(by_driver["LapNo"].to_dict())
+        self._telemetry_until.update(by_driver["LapEndDate"].to_dict())
+        for topic, (df,) in self._samples.items():
+            until = df["DriverNo"].astype(object).map(self._telemetry_until)
+            self._samples[topic] = [df[until.isna() | (df["Utc"] >= until)].reset_index(drop=True)]
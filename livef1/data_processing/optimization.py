@@ -1,16 +1,25 @@
 from ..utils.constants import _DOWNCAST_MAP, _CATEGORICAL_COLUMNS
 
+def _downcast_column(column, dtype):
+    """
+    Cast a column, using the nullable integer dtype (e.g. ``UInt8`` for
+    ``uint8``) when an integer column has missing values.
+    """
+    if dtype.startswith(("int", "uint")) and column.isna().any():
+        dtype = "UInt" + dtype[4:] if dtype.startswith("uint") else "Int" + dtype[3:]
+    return column.astype(dtype)
+
 def downcast(df, extra_mapping : dict = None):
     """
     Downcast columns to reduce memory usage.
     """
     for col, dtype in _DOWNCAST_MAP.items():
         if col in df.columns:
-            df[col] = df[col].astype(dtype)
+            df[col] = _downcast_column(df[col], dtype)
     if extra_mapping:
         for col, dtype in extra_mapping.items():
             if col in df.columns:
-                df[col] = df[col].astype(dtype)
+                df[col] = _downcast_column(df[col], dtype)
     return df
 
 def categorize(df, extra_columns : list = None):
@@ -1,5 +1,11 @@
+from array import array
+
+import numpy as np
+import pandas as pd
+
 from ..utils.helper import *
 from ..utils.constants import channel_name_map
+from ..utils.decode import decode_zipped_records
 import urllib
 
 def parse_tyre_stint_series(data, sessionKey, **kwargs):
@@ -188,21 +194,6 @@ def parse_timing_data(data, sessionKey, **kwargs):
         dict :
             A record containing the session key, timestamp, driver number, and various timing metrics.
     """
-    def parse_helper(info, record, prefix=""):
-        """
-        Recursively parses nested dictionaries in the timing data.
-        """
-        for info_k, info_v in info.items():
-            if info_k == "_deleted":
-                record = {**record, **{"_deleted": info_v}}
-            elif isinstance(info_v, list):
-                record = {**record, **{f"{info_k}_{sector_no+1}_{k}": v for sector_no in range(len(info_v)) for k, v in info_v[sector_no].items()}}
-            elif isinstance(info_v, dict):
-                record = parse_helper(info_v, record, prefix=prefix + info_k + "_")
-            else:
-                record = {**record, **{prefix + info_k: info_v}}
-        return record
-
     for ts, value in data:
     #data.items()::
         if "Withheld" in value.keys():
@@ -217,8 +208,7 @@ def parse_timing_data(data, sessionKey, **kwargs):
                     "timestamp": ts,
                     "DriverNo": driver_no
                 }
-                record = parse_helper(info, record)
-                yield record
+                yield flatten_nested_dict(info, record, deleted_key="_deleted")
 
 def parse_lap_series(data, sessionKey, **kwargs):
     """
@@ -497,8 +487,7 @@ def parse_session_info(data, sessionKey, **kwargs):
             "timestamp": ts
         }
 
-        record = parse_helper_for_nested_dict(value, record)
-        yield record
+        yield flatten_nested_dict(value, record)
 
 def parse_position_z(data, sessionKey, **kwargs):
     """
@@ -516,9 +505,7 @@ def parse_position_z(data, sessionKey, **kwargs):
         dict :
             A record containing the session key, timestamp, UTC time, driver number, and z-axis position data.
     """
-    for ts, v in data:
-    #data.items()::
-        parsed_entry = parse(v, zipped=True)
+    for ts, parsed_entry in decode_zipped_records(data):
         for position_entry in parsed_entry["Position"]:
             utc = position_entry["Timestamp"]
             for driver_entry in position_entry["Entries"].items():
@@ -548,9 +535,8 @@ def parse_car_data_z(data, sessionKey, **kwargs):
             A record containing the session key, timestamp, UTC time, driver number, and channel data.
     """
     
-    if isinstance(data, list):
-        for ts, v in data:
-            parsed_entry = parse(v, zipped=True)
+    if not isinstance(data, str):
+        for ts, parsed_entry in decode_zipped_records(data):
             for entry in parsed_entry["Entries"]:
                 utc = entry["Utc"]
                 for driver_entry in entry["Cars"].items():
@@ -564,7 +550,7 @@ def parse_car_data_z(data, sessionKey, **kwargs):
                     }
                     yield record
 
-    elif isinstance(data, str):
+    else:
         parsed_entry = parse(data, zipped=True)
         for entry in parsed_entry["Entries"]:
             utc = entry["Utc"]
@@ -578,6 +564,154 @@ def parse_car_data_z(data, sessionKey, **kwargs):
                 }
                 yield record
 
+class _CategoryBuilder:
+    """Collects values as integer codes and builds a :class:`pandas.Categorical` from them."""
+
+    def __init__(self):
+        self.codes = array("l")
+        self.categories = {}
+
+    def append(self, value):
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self.categories.get(value)
+        if code is None:
+            code = self.categories[value] = len(self.categories)
+        self.codes.append(code)
+
+    def to_categorical(self):
+        return pd.Categorical.from_codes(
+            np.frombuffer(self.codes, dtype=self.codes.typecode),
+            categories=list(self.categories)
+        )
+
+
+def _sample_columns(sessionKey, timestamps, utcs, sample_index, drivers):
+    """
+    Builds the columns shared by the columnar telemetry parsers.
+
+    Timestamps and UTC times are converted once per sample and then expanded
+    to one row per driver through ``sample_index``.
+    """
+    index = np.frombuffer(sample_index, dtype=sample_index.typecode)
+    utc = pd.to_datetime(pd.Index(utcs, dtype=object), format="ISO8601", utc=True)
+    return {
+        "SessionKey": pd.Categorical.from_codes(
+            np.full(len(index), -1 if sessionKey is None else 0, dtype=np.int8),
+            categories=[] if sessionKey is None else [sessionKey]
+        ),
+        "timestamp": pd.to_timedelta(pd.Index(timestamps, dtype=object)).values[index],
+        "Utc": utc.tz_localize(None).as_unit("ns").values[index],
+        "DriverNo": drivers.to_categorical(),
+    }
+
+
+# Stands for a missing gear or DRS value while the uint8 columns are built;
+# neither channel uses it.
+_MISSING_UINT8 = 255
+
+
+def parse_car_data_z_columnar(data, sessionKey, **kwargs):
+    """
+    Parses car data (z-axis) into typed columns instead of one record per driver.
+
+    Produces the same columns as :func:`parse_car_data_z`, but builds them in
+    compact arrays: float32 channels, uint8 gear and DRS, ``datetime64[ns]``
+    UTC times and categorical driver numbers. Missing channels are NaN, and
+    gear and DRS become nullable ``UInt8`` columns when a value is missing.
+
+    Parameters
+    ----------
+        data : :class:`list`
+            The car data, as ``(timestamp, payload)`` pairs.
+        sessionKey : :class:`int`
+            The key of the current session.
+
+    Returns
+    ----------
+        dict :
+            Column name to array mapping, ready to be turned into a DataFrame.
+    """
+    if isinstance(data, str):
+        data = [(None, data)]
+
+    timestamps, utcs = [], []
+    sample_index = array("l")
+    drivers = _CategoryBuilder()
+    typecodes = {"n_gear": "B", "drs": "B"}
+    channels = {
+        key: (name, array(typecodes.get(name, "f")))
+        for key, name in channel_name_map.items()
+    }
+
+    for ts, parsed_entry in decode_zipped_records(data):
+        for entry in parsed_entry["Entries"]:
+            sample = len(utcs)
+            timestamps.append(ts)
+            utcs.append(entry["Utc"])
+            for driver_no, car in entry["Cars"].items():
+                sample_index.append(sample)
+                drivers.append(driver_no)
+                ch = car["Channels"]
+                for key, (name, values) in channels.items():
+                    values.append(ch.get(key, _MISSING_UINT8 if values.typecode == "B" else np.nan))
+
+    columns = _sample_columns(sessionKey, timestamps, utcs, sample_index, drivers)
+    for name, values in channels.values():
+        if values.typecode == "B":
+            column = np.frombuffer(values, dtype=np.uint8)
+            missing = column == _MISSING_UINT8
+            columns[name] = pd.arrays.IntegerArray(column, missing) if missing.any() else column
+        else:
+            columns[name] = np.frombuffer(values, dtype=np.float32)
+    return columns
+
+
+def parse_position_z_columnar(data, sessionKey, **kwargs):
+    """
+    Parses driver position (z-axis) data into typed columns instead of one record per driver.
+
+    Produces the same columns as :func:`parse_position_z`, with float32
+    coordinates, ``datetime64[ns]`` UTC times and categorical driver numbers
+    and statuses.
+
+    Parameters
+    ----------
+        data : :class:`list`
+            The driver position data, as ``(timestamp, payload)`` pairs.
+        sessionKey : :class:`int`
+            The key of the current session.
+
+    Returns
+    ----------
+        dict :
+            Column name to array mapping, ready to be turned into a DataFrame.
+    """
+    timestamps, utcs = [], []
+    sample_index = array("l")
+    drivers = _CategoryBuilder()
+    status = _CategoryBuilder()
+    coordinates = {axis: array("f") for axis in ("X", "Y", "Z")}
+
+    for ts, parsed_entry in decode_zipped_records(data):
+        for position_entry in parsed_entry["Position"]:
+            sample = len(utcs)
+            timestamps.append(ts)
+            utcs.append(position_entry["Timestamp"])
+            for driver_no, position in position_entry["Entries"].items():
+                sample_index.append(sample)
+                drivers.append(driver_no)
+                status.append(position.get("Status"))
+                for axis, values in coordinates.items():
+                    values.append(position.get(axis, np.nan))
+
+    columns = _sample_columns(sessionKey, timestamps, utcs, sample_index, drivers)
+    columns["Status"] = status.to_categorical()
+    for axis, values in coordinates.items():
+        columns[axis] = np.frombuffer(values, dtype=np.float32)
+    return columns
+
 def parse_pit_lane_time(data, sessionKey, **kwargs):
 
     for key, value in data:
@@ -1,9 +1,12 @@
 import pandas as pd
 import numpy as np
 from datetime import timedelta
+import os
 import re
 
+from ..config import get_setting
 from ..utils.helper import to_datetime
+from ..utils.pool import map_partitions
 from ..utils.constants import (
     interpolation_map, 
     silver_cartel_col_order, 
@@ -54,29 +57,342 @@ def add_distance_to_lap(lap_df, start_x, start_y, x_coeff, y_coeff):
 
     return lap_df
 
+def add_distance_by_lap(df, start_x, start_y, x_coeff, y_coeff, by="LapNo"):
+    """
+    Vectorized :func:`add_distance_to_lap` for a frame holding many laps.
+
+    The distance of every lap is computed in one grouped pass: the speed is
+    integrated over time with the trapezoid rule and cumulated per group, and
+    each group is offset by the distance of its first sample from the
+    starting line. Rows whose group key is missing get no distance.
+
+    Args:
+        df (pd.DataFrame): Telemetry with 'Speed', 'timestamp', 'X', 'Y' and the `by` columns, ordered by time within each group.
+        start_x (float): X-coordinate of the starting line.
+        start_y (float): Y-coordinate of the starting line.
+        x_coeff (float): Coefficient for determining direction along the X-axis.
+        y_coeff (float): Coefficient for determining direction along the Y-axis.
+        by (str or list): Column(s) identifying a lap, e.g. ["DriverNo", "LapNo"] for several drivers.
+
+    Returns:
+        pd.DataFrame: `df` with a 'Distance' column, equal to applying add_distance_to_lap to every lap.
+    """
+    lap = df.groupby(by, sort=False).ngroup()  # NaN for rows without a lap
+    is_first = lap.groupby(lap).cumcount() == 0
+
+    dt_diff = df["timestamp"].groupby(lap).diff().dt.total_seconds().mask(is_first, 0)
+    step = (((df.Speed + df["Speed"].groupby(lap).shift(1)) / 2) / 3.6) * dt_diff
+    distance = step.groupby(lap).cumsum()
+
+    # Position of the first sample of each lap
+    first_x = df["X"].where(is_first).groupby(lap).ffill()
+    first_y = df["Y"].where(is_first).groupby(lap).ffill()
+    direction = np.where(((first_x - start_x) / x_coeff > 0) & ((first_y - start_y) / y_coeff > 0), 1, -1)
+    offset = direction * (((first_x - start_x)**2 + (first_y - start_y)**2)**0.5) / 10
+
+    df["Distance"] = offset + distance
+    return df
+
 def add_track_status(laps_df, df_track):
     temp_df = laps_df.copy()
     temp_df = temp_df.set_index("LapStartTime").join(df_track.set_index("timestamp")[["Status","Message"]], how="outer")
     temp_df.LapNo = temp_df.LapNo.ffill()
 
     temp_df.Status = temp_df.Status.ffill().bfill()
-    laps_df = laps_df.set_index("LapNo").join(temp_df.groupby("LapNo").Status.unique().apply(lambda x: ",".join(x))).reset_index().rename(columns={"Status":"TrackStatus"})
+    statuses = temp_df.drop_duplicates(["LapNo", "Status"]).groupby("LapNo").Status.agg(",".join)
+    laps_df = laps_df.set_index("LapNo").join(statuses).reset_index().rename(columns={"Status":"TrackStatus"})
     # temp_df.Message = temp_df.Message.ffill()
     # laps_df = laps_df.set_index("LapNo").join(temp_df.groupby("LapNo").Message.unique().apply(lambda x: ",".join(x))).reset_index()
 
     return laps_df
 
-def add_track_status_telemetry(telemetry_df, df_track):
+def add_asof_columns(telemetry_df, events_df, columns, on="timestamp"):
+    """
+    Attach to every telemetry sample the latest event values at or before its timestamp.
+
+    Events are sorted and forward-filled once, then each sample is matched to
+    its event with a binary search. The columns are added to `telemetry_df`
+    in place, so the telemetry frame is not copied or re-sorted, and events
+    never add rows to it.
+
+    Args:
+        telemetry_df (pd.DataFrame): Telemetry samples with an `on` column.
+        events_df (pd.DataFrame): Timestamped events, e.g. track status or tyre stints.
+        columns (dict): Event columns to attach, mapped to their telemetry column names.
+        on (str): Name of the timestamp column in both frames.
+
+    Returns:
+        pd.DataFrame: `telemetry_df`, with the new columns missing before the first event.
+    """
+    events = events_df[[on, *columns]].dropna(subset=[on]).sort_values(on, kind="stable")
+    values = events[list(columns)].ffill().reset_index(drop=True)
+
+    timestamps = telemetry_df[on]
+    positions = np.searchsorted(events[on].to_numpy(), timestamps.to_numpy(), side="right") - 1
+    positions[timestamps.isna().to_numpy()] = -1
 
-    telemetry_df = telemetry_df.set_index("timestamp").join(df_track.set_index("timestamp")[["Status"]]).rename(columns={"Status":"TrackStatus"})
-    telemetry_df.TrackStatus = telemetry_df.TrackStatus.astype(str).ffill()
-    return telemetry_df.dropna(subset="SessionKey").reset_index()
+    for column, target in columns.items():
+        telemetry_df[target] = values[column].reindex(positions).array
+    return telemetry_df
+
+def add_track_status_telemetry(telemetry_df, df_track):
+    telemetry_df = add_asof_columns(telemetry_df, df_track, {"Status": "TrackStatus"})
+    return telemetry_df.dropna(subset="SessionKey")
 
 def add_lineposition(telemetry_df, df_tmg):
-    # df_tmg.Position = df_tmg.Position.ffill() # TODO: Check if this is correct
-    telemetry_df = telemetry_df.set_index("timestamp").join(df_tmg.set_index("timestamp")[["Position"]], how="outer")
-    telemetry_df.Position = telemetry_df.Position.ffill()
-    return telemetry_df.reset_index()
+    return add_asof_columns(telemetry_df, df_tmg, {"Position": "Position"})
+
+def _duration_to_timedelta(col):
+    """
+    Convert Livetiming duration strings ("23.456", "1:23.456", "1:02:03.456") to timedeltas.
+    """
+    if not (pd.api.types.is_object_dtype(col) or pd.api.types.is_string_dtype(col)):
+        return pd.to_timedelta(col)
+    col = col.astype(object)
+    n_sep = col.str.count(":")
+    padded = col.mask(n_sep == 0, "00:00:" + col.where(n_sep == 0, ""))
+    padded = padded.mask(n_sep == 1, "00:" + col.where(n_sep == 1, ""))
+    return pd.to_timedelta(padded)
+
+
+def _timedelta_values(col):
+    """Timedelta column as a list of int nanoseconds, with None for NaT."""
+    values = col.to_numpy(dtype="timedelta64[ns]")
+    return np.where(np.isnat(values), None, values.view("int64").astype(object)).tolist()
+
+
+def _lap_timedeltas(values, unit):
+    """Inverse of :func:`_timedelta_values`, in the given resolution."""
+    return pd.to_timedelta(pd.array(values, dtype="Int64"), unit="ns").as_unit(unit)
+
+
+def _finest_unit(*cols):
+    """Finest resolution among the non-empty timedelta columns."""
+    units = [np.datetime_data(col.dtype)[0] for col in cols if col.notna().any()]
+    if not units:
+        return "ns"
+    return min(units, key=lambda unit: np.timedelta64(1, unit).astype("timedelta64[ns]"))
+
+
+def _gap_to_float(col):
+    """Gap strings to seconds: "LAP n" is 0, "+n L" (lapped) is NaN."""
+    text = col.astype(object)
+    is_lap = text.str.contains("LAP", na=False)
+    lapped = text.str.contains("L", na=False) & ~is_lap
+    gap = pd.to_numeric(text.where(~(is_lap | lapped)), errors="coerce").astype(float)
+    return gap.mask(is_lap, 0.0)
+
+
+# A sector value that differs from the one already recorded starts a new lap
+# only if the previous sector update is older than this.
+_NEW_LAP_GAP = 10 * 10**9  # ns
+
+
+def _close_lap(laps, record):
+    """Append a lap record, filling its lap time from the sectors if missing, and return a new one."""
+    if record[3] is None and None not in record[:3]:
+        record[3] = sum(record[:3])
+    laps.append(record)
+    return [None] * 5
+
+
+def _split_sector_updates(drivers, timestamps, stopped, last_lap_times, values, previous_values):
+    """
+    Walk the sector updates of every driver in order and find where laps end.
+
+    Lap boundaries depend on which sectors of the current lap are already
+    filled and on how long ago the last sector update was, so they cannot be
+    expressed as column operations. This is the only sequential part of the
+    vectorized laps builder. It runs on plain Python values, over the rows
+    that carry a sector update or a ``Stopped`` flag only.
+
+    Returns
+    -------
+    closed : list of int
+        Number of laps completed by each input row.
+    laps : dict
+        ``{driver: [[sector1, sector2, sector3, lap_time, lap_start], ...]}``
+        in nanoseconds (None when missing), one entry per completed lap.
+    """
+    closed = [0] * len(drivers)
+    laps = {}
+    state = {}
+    driver = object()
+    driver_laps = record = last_ts = None
+
+    rows = zip(drivers, timestamps, stopped, last_lap_times, zip(*values), zip(*previous_values))
+    for i, (row_driver, ts, is_stopped, last_lap_time, sector_values, sector_previous) in enumerate(rows):
+        if row_driver != driver:
+            if driver_laps is not None:
+                state[driver] = (record, last_ts)
+            driver = row_driver
+            driver_laps = laps.setdefault(driver, [])
+            record, last_ts = state.get(driver, ([None] * 5, 0))
+
+        if is_stopped:
+            record = _close_lap(driver_laps, record)
+            closed[i] += 1
+            continue
+
+        if last_lap_time is not None:
+            if sector_values[2] is not None:
+                record[3] = last_lap_time
+            elif sector_previous[2] is not None and driver_laps:
+                driver_laps[-1][3] = last_lap_time
+
+        for sector, value in enumerate(sector_values):
+            if value is None:
+                continue
+            current = record[sector]
+            if current is None:
+                record[sector] = value
+                last_ts = ts
+                if sector == 2:
+                    record = _close_lap(driver_laps, record)
+                    record[4] = ts
+                    closed[i] += 1
+            elif value != current and ts - last_ts > _NEW_LAP_GAP:
+                record = _close_lap(driver_laps, record)
+                record[sector] = value
+                record[4] = ts - value
+                last_ts = ts
+                closed[i] += 1
+
+        for sector, value in enumerate(sector_previous):
+            if value is None:
+                continue
+            if sector != 2:
+                record[sector] = value
+                last_ts = ts
+            elif driver_laps:
+                driver_laps[-1][2] = value
+                last_ts = ts
+
+    return closed, laps
+
+
+def _vectorized_driver_laps(df_timing, drivers, is_race):
+    """
+    Build the completed laps of every driver from prepared timing rows.
+
+    Lap boundaries come from :func:`_split_sector_updates`. Every other lap
+    field is aggregated over whole columns: the number of laps completed so
+    far gives each row its lap, pit entries and exits and the last speed
+    trap, position and gap readings are taken per lap with a group-by,
+    positions are carried forward to laps without an update and the pit
+    count is a cumulative sum.
+
+    Parameters
+    ----------
+    df_timing : pandas.DataFrame
+        Timing rows with ``DriverNo``, ``timestamp`` and the raw timing
+        columns, with durations already converted to timedeltas.
+    drivers : array-like
+        Driver numbers in output order.
+    is_race : bool
+        Whether to add ``GapToLeader`` and ``IntervalToPositionAhead``.
+
+    Returns
+    -------
+    list of tuple
+        ``(driver_no, laps_df)`` pairs, in the order of ``drivers``.
+    """
+    codes, uniques = pd.factorize(df_timing["DriverNo"].to_numpy(dtype=object))
+    stopped = df_timing["Stopped"].eq(True).to_numpy()
+    sector_cols = [f"Sectors_{i}_Value" for i in range(3)]
+    previous_cols = [f"Sectors_{i}_PreviousValue" for i in range(3)]
+
+    # Only rows with a sector update or a stop can end a lap.
+    events = np.flatnonzero(stopped | df_timing[sector_cols + previous_cols].notna().any(axis=1).to_numpy())
+    df_events = df_timing.iloc[events]
+    closed_events, lap_records = _split_sector_updates(
+        codes[events].tolist(),
+        _timedelta_values(df_events["timestamp"]),
+        stopped[events].tolist(),
+        _timedelta_values(df_events["LastLapTime_Value"]),
+        [_timedelta_values(df_events[col]) for col in sector_cols],
+        [_timedelta_values(df_events[col]) for col in previous_cols],
+    )
+
+    # Lap of each row: pit columns come before the sector columns of a row,
+    # speed traps, position and gaps after them.
+    closed = np.zeros(len(df_timing), dtype=np.int64)
+    closed[events] = closed_events
+    lap_after = pd.Series(closed).groupby(codes).cumsum().to_numpy()
+    lap_before = lap_after - closed
+    valid = ~stopped
+
+    def by_lap(values, mask, laps):
+        return values[mask].groupby([codes[mask], laps[mask]])
+
+    timestamps = df_timing["timestamp"].reset_index(drop=True)
+    pit_in = valid & df_timing["InPit"].eq(1).to_numpy()
+    pit_out = valid & df_timing["PitOut"].eq(True).to_numpy()
+    per_lap_cols = {
+        "PitIn": by_lap(timestamps, pit_in, lap_before).last(),
+        "PitOut": by_lap(timestamps, pit_out, lap_before).last(),
+        "NoPits": by_lap(timestamps, pit_out, lap_before).size(),
+    }
+    readings = {
+        "Speed_I1": "Speeds_I1_Value",
+        "Speed_I2": "Speeds_I2_Value",
+        "Speed_FL": "Speeds_FL_Value",
+        "Speed_ST": "Speeds_ST_Value",
+        "Position": "Position",
+    }
+    if is_race:
+        readings["GapToLeader"] = "GapToLeader"
+        readings["IntervalToPositionAhead"] = "IntervalToPositionAhead_Value"
+    for name, raw_col in readings.items():
+        values = df_timing[raw_col].reset_index(drop=True)
+        per_lap_cols[name] = by_lap(values, valid & values.notna().to_numpy(), lap_after).last()
+
+    # Keep the resolution that timedelta arithmetic on the inputs would give.
+    lap_unit = _finest_unit(*(df_timing[col] for col in sector_cols + previous_cols + ["LastLapTime_Value"]))
+    start_unit = _finest_unit(df_timing["timestamp"], *(df_timing[col] for col in sector_cols))
+
+    lap_counts = np.array([len(lap_records.get(code, [])) for code in range(len(uniques))], dtype=np.int64)
+    records = [record for code in range(len(uniques)) for record in lap_records.get(code, [])]
+    sector1, sector2, sector3, lap_time, lap_start = zip(*records) if records else ([],) * 5
+    starts = np.cumsum(lap_counts) - lap_counts
+    lap_index = pd.MultiIndex.from_arrays([
+        np.repeat(np.arange(len(uniques)), lap_counts),
+        np.arange(len(records)) - np.repeat(starts, lap_counts),
+    ])
+
+    laps = pd.DataFrame({
+        "LapNo": lap_index.get_level_values(1) + 1,
+        "LapTime": _lap_timedeltas(lap_time, lap_unit),
+        "PitIn": per_lap_cols["PitIn"].reindex(lap_index).to_numpy(),
+        "PitOut": per_lap_cols["PitOut"].reindex(lap_index).to_numpy(),
+        "Sector1_Time": _lap_timedeltas(sector1, lap_unit),
+        "Sector2_Time": _lap_timedeltas(sector2, lap_unit),
+        "Sector3_Time": _lap_timedeltas(sector3, lap_unit),
+    })
+    for name in ["Speed_I1", "Speed_I2", "Speed_FL", "Speed_ST"]:
+        laps[name] = per_lap_cols[name].reindex(lap_index).astype(float).to_numpy()
+    laps["Position"] = per_lap_cols["Position"].reindex(lap_index).groupby(level=0).ffill().to_numpy()
+    if is_race:
+        laps["GapToLeader"] = _gap_to_float(per_lap_cols["GapToLeader"].reindex(lap_index)).to_numpy()
+        laps["IntervalToPositionAhead"] = _gap_to_float(per_lap_cols["IntervalToPositionAhead"].reindex(lap_index)).to_numpy()
+    laps["NoPits"] = per_lap_cols["NoPits"].reindex(lap_index, fill_value=0).groupby(level=0).cumsum().to_numpy()
+    laps["LapStartTime"] = _lap_timedeltas(lap_start, start_unit)
+
+    driver_laps = []
+    for driver_no in drivers:
+        code = np.flatnonzero(uniques == driver_no)
+        if len(code) == 0 or lap_counts[code[0]] == 0:
+            driver_laps.append((driver_no, pd.DataFrame()))
+            continue
+        start = starts[code[0]]
+        laps_df = laps.iloc[start:start + lap_counts[code[0]]].reset_index(drop=True)
+        # Like the row-by-row builder, only keep start times once a lap has one.
+        if laps_df["LapStartTime"].isna().all():
+            laps_df = laps_df.drop(columns="LapStartTime")
+        driver_laps.append((driver_no, laps_df))
+
+    return driver_laps
+
 
 def generate_laps_table(session, df_exp, df_rcm, df_tyre, df_track):
 
@@ -169,18 +485,6 @@ def generate_laps_table(session, df_exp, df_rcm, df_tyre, df_track):
     cols = list(base_cols.values()) + list(pit_cols.values()) + list(sector_cols.values()) + list(speedTrap_cols.values()) + list(misc_cols.values())
     raw_cols = list(base_cols.keys()) + list(pit_cols.keys()) + list(sector_cols.keys()) + list(speedTrap_cols.keys()) + list(misc_cols.keys()) + extra_raw_cols
 
-    def str_timedelta(x):
-        if isinstance(x, str):
-            count_sep = x.count(":")
-            if count_sep == 0:
-                return "00:00:" + x
-            elif count_sep == 1:
-                return "00:" + x
-            else:
-                return x
-        else:
-            return x
-    
     def enter_new_lap(laps, record):
         if laps is None and record is None:
             NoPits = 0
@@ -201,20 +505,22 @@ def generate_laps_table(session, df_exp, df_rcm, df_tyre, df_track):
 
         return laps, record
 
-    all_laps = []
-
-    for driver_no in df_exp["DriverNo"].unique():
-        df_driver = df_exp[df_exp["DriverNo"] == driver_no]
-        df_test = df_driver[["timestamp"] + raw_cols].dropna(subset=raw_cols, how="all").replace('', np.nan)
+    # Live TimingData only has the fields received so far.
+    missing_cols = [col for col in raw_cols if col not in df_exp.columns]
+    if missing_cols:
+        df_exp = df_exp.assign(**{col: np.nan for col in missing_cols})
 
-        for col in ["Sectors_0_Value", "Sectors_1_Value", "Sectors_2_Value", "Sectors_0_PreviousValue", "Sectors_1_PreviousValue", "Sectors_2_PreviousValue", "LastLapTime_Value"]:
-            df_test[col] = df_test[col]
-            df_test[col] = pd.to_timedelta(df_test[col].apply(str_timedelta))
+    df_timing = df_exp[["DriverNo", "timestamp"] + raw_cols].dropna(subset=raw_cols, how="all").replace('', np.nan)
+    df_timing["timestamp"] = pd.to_timedelta(df_timing["timestamp"])
+    for col in ["Sectors_0_Value", "Sectors_1_Value", "Sectors_2_Value", "Sectors_0_PreviousValue", "Sectors_1_PreviousValue", "Sectors_2_PreviousValue", "LastLapTime_Value"]:
+        df_timing[col] = _duration_to_timedelta(df_timing[col])
+    df_timing = df_timing[df_timing.RacingNumber.isna()]
 
+    def build_driver_laps(df_test):
         new_lap_allowed = True
         laps, record, last_record_ts = enter_new_lap(None, None)
 
-        for idx, row in df_test[df_test.RacingNumber.isna()].iterrows():
+        for idx, row in df_test.iterrows():
             ts = pd.to_timedelta(row.timestamp)
 
             if row.Stopped == True:
@@ -300,12 +606,30 @@ def generate_laps_table(session, df_exp, df_rcm, df_tyre, df_track):
                                 laps[-1][f"Sector{str(sc_no + 1)}_Time"] = sc_value
                                 last_record_ts = ts
 
+        return pd.DataFrame(laps)
+
+    # build_driver_laps is deprecated and goes in 1.4.0. Until then the tests
+    # check that both builders give the same table.
+    if get_setting("vectorized_laps"):
+        driver_laps = _vectorized_driver_laps(df_timing, df_exp["DriverNo"].unique(), is_race=session.type == "Race")
+    else:
+        driver_laps = [
+            (driver_no, build_driver_laps(df_timing[df_timing["DriverNo"] == driver_no].drop(columns="DriverNo")))
+            for driver_no in df_exp["DriverNo"].unique()
+        ]
+
+    all_laps = []
+
+    for driver_no, laps_df in driver_laps:
+        if laps_df.empty:
+            # No completed lap for this driver
+            continue
+
         # Aggregate all laps data of the driver
-        laps_df = pd.DataFrame(laps)
         laps_df["DriverNo"] = driver_no
 
         if "LapStartTime" in laps_df.columns: laps_df = add_track_status(laps_df, df_track)
-        else: laps_df["LapStartTime"] = None
+        else: laps_df["LapStartTime"] = pd.Series(pd.NaT, index=laps_df.index, dtype="timedelta64[ns]")
             
 
         new_ts = ( laps_df["LapStartTime"] + laps_df["LapTime"] ).shift(1)
@@ -372,16 +696,108 @@ def generate_laps_table(session, df_exp, df_rcm, df_tyre, df_track):
     return all_laps_df[silver_laps_col_order]
 
 def assign_regions(tel_cor, df_corners):
+    """
+    Label every telemetry sample with the track region its distance falls in.
 
-    # Example: same bins_df as above
-    conditions = [
-        (tel_cor["Distance"] >= row['corner_start']) & (tel_cor["Distance"] < row['corner_end']) if row["corner_end"] >= row["corner_start"]
-        else (tel_cor["Distance"] >= row['corner_start']) | (tel_cor["Distance"] < row['corner_end'])
-        for _, row in df_corners.iterrows()
-    ]
-    choices = df_corners['name'].tolist()
+    Region boundaries are sorted once and split the lap into segments that
+    lie entirely inside or outside each region. Every segment is labelled
+    with the first region in ``df_corners`` that covers it (a region whose
+    ``corner_end`` is before its ``corner_start`` wraps around the start
+    line), and samples are mapped to segments with a binary search, so
+    memory stays proportional to the number of samples.
+
+    Args:
+        tel_cor (pd.DataFrame): Telemetry with a 'Distance' column.
+        df_corners (pd.DataFrame): Regions with 'name', 'corner_start' and 'corner_end' columns.
+
+    Returns:
+        np.ndarray: Region name per sample, None where no region applies.
+    """
+    starts = df_corners["corner_start"].to_numpy(dtype=float)
+    ends = df_corners["corner_end"].to_numpy(dtype=float)
+    boundaries = np.unique(np.concatenate([starts, ends]))
+    boundaries = boundaries[~np.isnan(boundaries)]
+
+    # One point per segment: below the first boundary, then each boundary.
+    points = np.concatenate([[-np.inf], boundaries])[:, None]
+    conditions = np.where(
+        ends >= starts,
+        (points >= starts) & (points < ends),
+        (points >= starts) | (points < ends),
+    )
+    segment_labels = np.select(list(conditions.T), df_corners["name"].tolist(), default=None).astype(object)
+
+    distance = tel_cor["Distance"].to_numpy(dtype=float)
+    regions = segment_labels[np.searchsorted(boundaries, distance, side="right")]
+    regions[np.isnan(distance)] = None
+    return regions
+
+def generate_driver_telemetry(df_driver, laps_driver, df_track, df_tmg, df_tyre, first_datetime, start_line=None):
+    """
+    Build the telemetry rows of one driver.
+
+    Interpolates the driver's joined car and position samples, assigns lap
+    numbers, keeps the samples between the first lap start and the last lap
+    end, and adds lap distance, track status, line position and tyres. Takes
+    only plain data so it can run in a worker process.
+
+    Args:
+        df_driver (pd.DataFrame): Joined car and position samples of the driver, with a 'Utc' column.
+        laps_driver (pd.DataFrame): Silver laps of the driver.
+        df_track (pd.DataFrame): Track status changes with 'timestamp' and 'Status' columns.
+        df_tmg (pd.DataFrame): Line position updates of the driver.
+        df_tyre (pd.DataFrame): Tyre stint updates of the driver.
+        first_datetime (pd.Timestamp): Session start, used for the 'timestamp' column.
+        start_line (tuple, optional): Start line ``(x, y, x_direction, y_direction)``. When None,
+            'Distance' is left empty.
+
+    Returns:
+        pd.DataFrame: The driver's telemetry rows.
+    """
+    df_driver = df_driver.set_index("Utc")
+
+    for col in df_driver.columns:
+        if col in interpolation_map:
+            if len(df_driver[col].dropna()) < len(df_driver)*0.2:
+                continue
+            if interpolation_map[col] == "ffill": df_driver[col] = df_driver[col].ffill().values
+            else: df_driver[col] = df_driver[col].interpolate(method=interpolation_map[col], order=2).values
+
+    laps_driver = laps_driver.copy()
+    laps_driver.loc[:, "lap_end_date"] = laps_driver["LapStartDate"] + laps_driver["LapTime"]
+
+    df_driver = df_driver.join(laps_driver[["LapStartDate", "LapNo"]].set_index("LapStartDate"), how="outer")
+
+    df_driver["LapNo"] = df_driver["LapNo"].ffill().bfill()
+    df_driver.index.names = ['Utc']
+
+    df_driver = df_driver.reset_index()
+    df_driver = df_driver[df_driver.Utc.between(laps_driver["LapStartDate"].min(), laps_driver["lap_end_date"].max())]
+
+    df_driver["SessionKey"] = df_driver["SessionKey"].ffill().bfill()
+    df_driver["timestamp"] = df_driver["Utc"] - first_datetime
+
+    df_driver = df_driver.dropna(subset=["DriverNo"])
+
+    # Add the cumulative distance covered during each lap based on speed and timestamp,
+    # adjusted for the starting line position.
+    if start_line is not None:
+        df_driver = add_distance_by_lap(df_driver, *start_line)
+    else:
+        df_driver.loc[df_driver["LapNo"].notna(), "Distance"] = None
 
-    return np.select(conditions, choices, default=None)
+    # Track status, line position and tyres in effect at each sample
+    df_driver = df_driver.dropna(subset="SessionKey").reset_index(drop=True)
+    add_asof_columns(df_driver, df_track, {"Status": "TrackStatus"})
+    add_asof_columns(df_driver, df_tmg, {"Position": "Position"})
+    add_asof_columns(df_driver, df_tyre, {"Compound": "Compound", "New": "New", "TotalLaps": "TyreAge"})
+
+    ## TODO: Add race distance
+    # if len(df_driver) > 0:
+    #     race_distance = add_distance_to_lap(df_driver.copy(), *start_line)["Distance"].values
+    #     df_driver["RaceDistance"] = race_distance
+
+    return df_driver
 
 def generate_car_telemetry_table(session, df_car, df_pos, df_tyre, laps, df_track, df_tmg, df_circuits):
     """
@@ -408,6 +824,38 @@ def generate_car_telemetry_table(session, df_car, df_pos, df_tyre, laps, df_trac
     Raises:
         ValueError: If required data is missing or cannot be processed.
     """
+    laps = session.data_lake.silver.lake["laps"].df
+    return _car_telemetry_rows(session, df_car, df_pos, df_tyre, laps, df_track, df_tmg, df_circuits)
+
+def extend_car_telemetry_table(session, telemetry, df_car, df_pos, df_tyre, new_laps, df_track, df_tmg, df_circuits):
+    """
+    Extends a car telemetry table with the rows of newly completed laps.
+
+    Only the samples of ``new_laps`` are processed, with the same steps as
+    :func:`generate_car_telemetry_table`, so a live session's telemetry grows
+    by lap instead of being rebuilt from every sample received so far.
+
+    Args:
+        session: The session object containing circuit and meeting information.
+        telemetry (pd.DataFrame or None): The telemetry built so far.
+        df_car (pd.DataFrame): Car samples covering ``new_laps``. Older samples may be included.
+        df_pos (pd.DataFrame): Position samples covering ``new_laps``.
+        df_tyre (pd.DataFrame): Tyre stint updates.
+        new_laps (pd.DataFrame): Silver laps not yet in ``telemetry``.
+        df_track (pd.DataFrame): Track status changes.
+        df_tmg (pd.DataFrame): Timing data with line positions.
+        df_circuits (pd.DataFrame): Track regions.
+
+    Returns:
+        pd.DataFrame: ``telemetry`` followed by the rows of ``new_laps``.
+    """
+    rows = _car_telemetry_rows(session, df_car, df_pos, df_tyre, new_laps, df_track, df_tmg, df_circuits)
+    if telemetry is None or telemetry.empty:
+        return rows
+    return pd.concat([telemetry, rows], ignore_index=True)
+
+def _car_telemetry_rows(session, df_car, df_pos, df_tyre, laps, df_track, df_tmg, df_circuits):
+    """Build the telemetry rows of ``laps`` from car and position samples."""
     # Get position data
     df_pos["Utc"] = to_datetime(df_pos["Utc"])
     df_pos["tag"] = "position"
@@ -430,82 +878,42 @@ def generate_car_telemetry_table(session, df_car, df_pos, df_tyre, laps, df_trac
 
     df["tag"] = df["tag"].fillna("") + df["tag_pos"].fillna("")
 
-    all_drivers_data = []
-
-    for driver_no in df["DriverNo"].unique():
-        
-        df_driver = df[df["DriverNo"] == driver_no].set_index("Utc")
-
-        laps = session.data_lake.silver.lake["laps"].df
-        laps_driver = laps[laps["DriverNo"] == driver_no]
-
-        for col in df_driver.columns:
-            if col in interpolation_map:
-                if len(df_driver[col].dropna()) < len(df_driver)*0.2:
-                    continue
-                if interpolation_map[col] == "ffill": df_driver[col] = df_driver[col].ffill().values
-                else: df_driver[col] = df_driver[col].interpolate(method=interpolation_map[col], order=2).values
+    laps_by_driver = dict(tuple(laps.groupby("DriverNo", sort=False)))
+    tmg_by_driver = dict(tuple(df_tmg.groupby("DriverNo", sort=False)))
+    tyre_by_driver = dict(tuple(df_tyre.groupby("DriverNo", sort=False)))
 
-        laps_driver.loc[:, "lap_end_date"] = laps_driver["LapStartDate"] + laps_driver["LapTime"]
-
-        df_driver = df_driver.join(laps_driver[["LapStartDate", "LapNo"]].set_index("LapStartDate"), how="outer")
-
-        df_driver["LapNo"] = df_driver["LapNo"].ffill().bfill()
-        df_driver.index.names = ['Utc']
-
-        df_driver = df_driver.reset_index()
-        df_driver = df_driver[df_driver.Utc.between(laps_driver["LapStartDate"].min(), laps_driver["lap_end_date"].max())]
-
-        df_driver["SessionKey"] = df_driver["SessionKey"].ffill().bfill()
-        df_driver["timestamp"] = df_driver["Utc"] - session.first_datetime
+    start_line = None
+    if hasattr(session.meeting.circuit, "start_coordinates"):
+        start_line = (
+            session.meeting.circuit.start_coordinates[0],
+            session.meeting.circuit.start_coordinates[1],
+            session.meeting.circuit.start_direction[0],
+            session.meeting.circuit.start_direction[1],
+        )
+
+    # One partition per driver; drivers are independent after the join above.
+    partitions = [
+        (
+            df_driver,
+            laps_by_driver.get(driver_no, laps.iloc[:0]),
+            df_track,
+            tmg_by_driver.get(driver_no, df_tmg.iloc[:0]),
+            tyre_by_driver.get(driver_no, df_tyre.iloc[:0]),
+            session.first_datetime,
+            start_line,
+        )
+        for driver_no, df_driver in df.groupby("DriverNo", sort=False)
+    ]
+    del df # free memory
 
-        df_driver = df_driver.dropna(subset=["DriverNo"])
+    workers = 1
+    if get_setting("parallel_telemetry"):
+        workers = get_setting("telemetry_workers") or os.cpu_count() or 1
+    all_drivers_data = map_partitions(generate_driver_telemetry, partitions, workers)
+    del partitions
 
-        # Iterate through each unique lap number for the driver to calculate and add the cumulative distance
-        # covered during the lap based on speed and timestamp, adjusted for the starting line position.
-        for lap_no in df_driver["LapNo"].unique():
-            lap_df = df_driver[df_driver["LapNo"] == lap_no]
-            if hasattr(session.meeting.circuit, "start_coordinates"):
-                lap_df = add_distance_to_lap(
-                    lap_df,
-                    session.meeting.circuit.start_coordinates[0],
-                    session.meeting.circuit.start_coordinates[1],
-                    session.meeting.circuit.start_direction[0],
-                    session.meeting.circuit.start_direction[1]
-                    )
-                            
-                df_driver.loc[lap_df.index, "Distance"] = lap_df["Distance"].values
-            else:
-                df_driver.loc[lap_df.index, "Distance"] = None
-        
-        df_driver = add_track_status_telemetry(df_driver, df_track)
-        df_driver = add_lineposition(df_driver, df_tmg[df_tmg.DriverNo == driver_no])
-
-        ## TODO: Add race distance
-        # if len(df_driver) > 0:
-        #     race_distance = add_distance_to_lap(
-        #         df_driver.copy(),
-        #         session.meeting.circuit.start_coordinates[0],
-        #         session.meeting.circuit.start_coordinates[1],
-        #         session.meeting.circuit.start_direction[0],
-        #         session.meeting.circuit.start_direction[1]
-        #     )["Distance"].values
-        #     df_driver["RaceDistance"] = race_distance
-        #     print("added race distance :", driver_no, race_distance)
-
-        all_drivers_data.append(df_driver)
-
-    del df # free memory
     all_drivers_df = pd.concat(all_drivers_data, ignore_index=True)
 
-    # Add Tyre Data
-    all_drivers_df = all_drivers_df.set_index(["DriverNo", "timestamp"]).join(
-        df_tyre.rename(columns={"TotalLaps":"TyreAge"}).set_index(["DriverNo", "timestamp"]),
-        how="outer"
-    )
-    all_drivers_df[["Compound","New","TyreAge"]] = all_drivers_df.groupby('DriverNo')[["Compound","New","TyreAge"]].ffill()
-    all_drivers_df = all_drivers_df.reset_index().dropna(subset = ["SessionKey"])
-
     if hasattr(session.meeting.circuit, "start_coordinates"):
         all_drivers_df["TrackRegion"] = assign_regions(all_drivers_df, df_circuits)
     else:
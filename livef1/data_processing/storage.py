@@ -0,0 +1,225 @@
+# Standard Library Imports
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+
+# Third-Party Library Imports
+import pandas as pd
+
+# Internal Project Imports
+from ..utils.logger import logger
+
+METADATA_FILE = "metadata.json"
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Parquet and Arrow IPC lake storage require 'pyarrow'. "
+            "Install it with 'pip install pyarrow', or use lake_format='pickle'."
+        ) from e
+    return pyarrow
+
+
+class LakeStorage:
+    """
+    Base class of on-disk storage backends for a :class:`~livef1.data_processing.lakes.DataLake`.
+
+    Tables are stored as one file per table under ``<directory>/<level>/``,
+    next to a ``metadata.json`` file mirroring the lake metadata of the stored
+    tables. Subclasses implement :meth:`_write` and :meth:`_read` for a file
+    format.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        Directory of the stored lake. Created on first write.
+    """
+
+    extension = None
+
+    def __init__(self, directory):
+        self.directory = Path(directory).expanduser()
+        self._lock = threading.Lock()
+
+    def path(self, level, table_name):
+        """Return the path a table is (or would be) stored at."""
+        return self.directory / level / f"{table_name}.{self.extension}"
+
+    def has_table(self, level, table_name):
+        return level is not None and self.path(level, table_name).is_file()
+
+    def write_table(self, level, table_name, df):
+        """
+        Write a table's DataFrame, replacing any stored version.
+
+        Parameters
+        ----------
+        level : str
+            The level of the lake ('bronze', 'silver', 'gold').
+        table_name : str
+            The name of the table.
+        df : pandas.DataFrame
+            The data to store.
+        """
+        path = self.path(level, table_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self._write(df, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def read_table(self, level, table_name):
+        """
+        Read a stored table's DataFrame.
+
+        Parameters
+        ----------
+        level : str
+            The level of the lake ('bronze', 'silver', 'gold').
+        table_name : str
+            The name of the table.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        logger.debug(f"Reading '{table_name}' from {self.directory}.")
+        return self._read(self.path(level, table_name))
+
+    def write_metadata(self, metadata):
+        """Write the lake metadata of the stored tables to ``metadata.json``."""
+        stored = {
+            name: {
+                **info,
+                "created_at": info["created_at"].isoformat() if isinstance(info.get("created_at"), datetime) else info.get("created_at"),
+            }
+            for name, info in metadata.items()
+            if self.has_table(info.get("table_type"), name)
+        }
+        path = self.directory / METADATA_FILE
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(stored, indent=2, default=str))
+            os.replace(tmp_path, path)
+
+    def read_metadata(self):
+        """
+        Read the stored lake metadata, keeping only tables whose file exists.
+
+        Returns
+        -------
+        dict
+        """
+        path = self.directory / METADATA_FILE
+        try:
+            stored = json.loads(path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable lake metadata '{path}': {e}")
+            return {}
+
+        metadata = {}
+        for name, info in stored.items():
+            if not self.has_table(info.get("table_type"), name):
+                continue
+            created_at = info.get("created_at")
+            if isinstance(created_at, str):
+                try:
+                    created_at = datetime.fromisoformat(created_at)
+                except ValueError:
+                    pass
+            metadata[name] = {**info, "created_at": created_at}
+        return metadata
+
+    def clear(self):
+        """Delete every stored table and the metadata file."""
+        with self._lock:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _write(self, df, path):
+        raise NotImplementedError
+
+    def _read(self, path):
+        raise NotImplementedError
+
+
+class ParquetStorage(LakeStorage):
+    """Stores tables as Parquet files. Requires ``pyarrow``."""
+
+    extension = "parquet"
+
+    def _write(self, df, path):
+        _require_pyarrow()
+        df.to_parquet(path, engine="pyarrow")
+
+    def _read(self, path):
+        _require_pyarrow()
+        return pd.read_parquet(path, engine="pyarrow", memory_map=True)
+
+
+class ArrowIPCStorage(LakeStorage):
+    """Stores tables as Arrow IPC (Feather v2) files, read back memory-mapped. Requires ``pyarrow``."""
+
+    extension = "arrow"
+
+    def _write(self, df, path):
+        pa = _require_pyarrow()
+        table = pa.Table.from_pandas(df)
+        with pa.OSFile(str(path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    def _read(self, path):
+        pa = _require_pyarrow()
+        # Arrow buffers keep the mapping alive, so columns that pandas can
+        # wrap without conversion are not copied into memory.
+        return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all().to_pandas()
+
+
+class PickleStorage(LakeStorage):
+    """Stores tables as pandas pickle files. Needs no extra dependency and keeps every dtype."""
+
+    extension = "pkl"
+
+    def _write(self, df, path):
+        df.to_pickle(path)
+
+    def _read(self, path):
+        return pd.read_pickle(path)
+
+
+STORAGE_FORMATS = {
+    "parquet": ParquetStorage,
+    "arrow": ArrowIPCStorage,
+    "pickle": PickleStorage,
+}
+
+
+def get_storage(directory, format="parquet"):
+    """
+    Create a lake storage backend.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        Directory of the stored lake.
+    format : str, optional
+        One of 'parquet', 'arrow' or 'pickle', by default 'parquet'.
+
+    Returns
+    -------
+    LakeStorage
+    """
+    if format not in STORAGE_FORMATS:
+        raise ValueError(f"Invalid lake format '{format}'. Must be one of {list(STORAGE_FORMATS)}.")
+    return STORAGE_FORMATS[format](directory)
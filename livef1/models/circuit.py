@@ -1,10 +1,11 @@
+import hashlib
 from typing import Dict, Optional
-import requests
 import pandas as pd
 
 from livef1.utils.constants import START_COORDINATES_URL
 from livef1.utils.exceptions import livef1Exception
 from livef1.utils.helper import string_match_ratio
+from livef1.utils.http import http_get
 from livef1.models.location import Location
 
 
@@ -53,7 +54,7 @@ class Circuit:
         """
         Load the start coordinates of the circuit from an external API.
         """
-        response = requests.get(START_COORDINATES_URL)
+        response = http_get(START_COORDINATES_URL)
         
         if response.status_code == 200:
             data = response.json()
@@ -67,7 +68,7 @@ class Circuit:
         
     def _load_circuit_data(self):
         HEADERS = {'User-Agent': 'LiveF1/user'}
-        response = requests.get("https://api.multiviewer.app/api/v1/circuits", headers=HEADERS)
+        response = http_get("https://api.multiviewer.app/api/v1/circuits", headers=HEADERS)
         circuits = response.json()
 
         circuit_ref = next(
@@ -85,7 +86,9 @@ class Circuit:
         circuit_key = circuit_ref["circuitKey"]
         circuit_ref_years = circuit_ref["years"]
 
-        response = requests.get(f"https://api.multiviewer.app/api/v1/circuits/{circuit_key}/{circuit_ref_years[0]}/", headers=HEADERS)
+        self._circuit_data_url = f"https://api.multiviewer.app/api/v1/circuits/{circuit_key}/{circuit_ref_years[0]}/"
+        response = http_get(self._circuit_data_url, headers=HEADERS)
+        self._circuit_data_digest = hashlib.sha256(response.content).hexdigest()
         self._raw_circuit_data = response.json()
 
         for corner in self._raw_circuit_data["corners"]:
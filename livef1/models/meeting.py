@@ -15,6 +15,7 @@ from ..adapters.functions import (
     fetch_jolpica_season_races_list,
     livetiming_meeting_in_season_index,
     jolpica_meeting_in_races,
+    season_availability_index,
 )
 from ..adapters.jolpicaf1_adapter import jolpica_client
 from ..data_processing.jolpica_etl import parse_constructor_standings, parse_driver_standings
@@ -120,8 +121,9 @@ class Meeting:
         # if "is_jolpica_available" in kwargs:
         #     self.is_jolpica_available = kwargs["is_jolpica_available"]
 
-        self.is_livetiming_available = livetiming_meeting_in_season_index(self.season.livetiming_data, self.name)
-        self.is_jolpica_available = jolpica_meeting_in_races(self.season.jolpica_data, self.name)
+        availability = season_availability_index(self.season)
+        self.is_livetiming_available = availability.livetiming_meeting(self.name)
+        self.is_jolpica_available = availability.jolpica_meeting(self.name)
 
         self.parse_sessions()
 
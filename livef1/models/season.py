@@ -3,13 +3,18 @@ import urllib
 import json
 import dateutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Third-Party Library Imports
 import pandas as pd
 # Internal Project Imports
 from ..adapters import download_data
-from ..adapters.functions import fetch_livetiming_season_index, jolpica_season_races_fetch_ok
-from ..adapters.jolpicaf1_adapter import jolpica_client
+from ..adapters.functions import (
+    fetch_jolpica_season_data,
+    fetch_livetiming_season_index,
+    jolpica_season_races_fetch_ok,
+    AvailabilityIndex,
+)
 from ..adapters.other import parse_schedule_from_f1com
 
 from .driver import Driver, _jolpica_driver_dict
@@ -22,6 +27,8 @@ from ..utils.constants import SESSIONS_COLUMN_MAP
 
 from ..data_processing.jolpica_etl import parse_driver_standings, parse_constructor_standings
 
+JOLPICA_SEASON_QUERIES = ("get_drivers", "get_constructors", "get_driver_standings", "get_constructor_standings")
+
 
 class Season:
     """
@@ -98,33 +105,66 @@ class Season:
         """
         # self.meetings_json = self.meetings  # Store raw meeting data.
         self.meetings = []  # Initialize meetings list.
+        # Shared by the availability checks of every meeting and session.
+        self.availability_index = AvailabilityIndex(self.livetiming_data, self.jolpica_data)
 
         self.parse_sessions()  # Parse sessions from the meetings.
         self.set_meetings()  # Create Meeting objects for each meeting.
         if not self.is_jolpica_available:
             return
-        try:
-            self._load_drivers()
-        except Exception:
-            logger.debug(f"Drivers not available for season {self.year}.")
-        try:
-            self._load_constructors()
-        except Exception:
-            logger.debug(f"Constructors not available for season {self.year}.")
-        try:
-            self._load_driver_standings()
-        except Exception:
-            logger.debug(f"Driver standings not available for season {self.year}.")
-        try:
-            self._load_constructor_standings()
-        except Exception:
-            logger.debug(f"Constructor standings not available for season {self.year}.")
-    
+        # The four queries are independent: send them at once and let the
+        # loaders parse the responses in order, since the standings refer to
+        # the drivers and constructors.
+        with ThreadPoolExecutor(max_workers=len(JOLPICA_SEASON_QUERIES), thread_name_prefix="livef1-season") as pool:
+            self._jolpica_responses = self._fetch_jolpica_data(pool)
+            try:
+                try:
+                    self._load_drivers()
+                except Exception:
+                    logger.debug(f"Drivers not available for season {self.year}.")
+                try:
+                    self._load_constructors()
+                except Exception:
+                    logger.debug(f"Constructors not available for season {self.year}.")
+                try:
+                    self._load_driver_standings()
+                except Exception:
+                    logger.debug(f"Driver standings not available for season {self.year}.")
+                try:
+                    self._load_constructor_standings()
+                except Exception:
+                    logger.debug(f"Constructor standings not available for season {self.year}.")
+            finally:
+                self._jolpica_responses = {}
+
+    def _fetch_jolpica_data(self, pool):
+        """
+        Start fetching the season's Jolpica queries on ``pool``.
+
+        Returns
+        -------
+        dict
+            Future of each query result, keyed by query name.
+        """
+        return {
+            query: pool.submit(fetch_jolpica_season_data, self.year, query)
+            for query in JOLPICA_SEASON_QUERIES
+        }
+
+    def _jolpica_data(self, query):
+        """
+        Return a Jolpica query result, waiting for the one started by :meth:`load` if any.
+        """
+        future = getattr(self, "_jolpica_responses", {}).get(query)
+        if future is not None:
+            return future.result()
+        return fetch_jolpica_season_data(self.year, query)
+
     def _load_drivers(self):
         """
         Loads the drivers data from the API and populates the `drivers` attribute.
         """
-        drivers_jolpica = jolpica_client.query().season(self.year).get_drivers(limit=100).data.drivers
+        drivers_jolpica = self._jolpica_data("get_drivers").drivers
         self.drivers = {}
         for driver in drivers_jolpica:
             if driver.permanent_number is not None:
@@ -137,7 +177,7 @@ class Season:
         """
         Loads constructors from Jolpica and populates ``constructors`` keyed by ``constructorId``.
         """
-        constructors_jolpica = jolpica_client.query().season(self.year).get_constructors(limit=100).data.constructors
+        constructors_jolpica = self._jolpica_data("get_constructors").constructors
         self.constructors = {}
         for c in constructors_jolpica:
             d = c.to_dict()
@@ -147,12 +187,12 @@ class Season:
             self.constructors[cid] = Constructor(**_jolpica_constructor_dict(d))
     
     def _load_driver_standings(self):
-        driver_standings = jolpica_client.query().season(self.year).get_driver_standings(limit=100).data.standings_lists[0].to_dict()["DriverStandings"]
+        driver_standings = self._jolpica_data("get_driver_standings").standings_lists[0].to_dict()["DriverStandings"]
         self.driverStandings = parse_driver_standings(self, driver_standings)
         logger.info(f"Driver standings have been loaded and saved to 'season.driverStandings'.")
 
     def _load_constructor_standings(self):
-        ctor_standings = jolpica_client.query().season(self.year).get_constructor_standings(limit=100).data.standings_lists[0].to_dict()["ConstructorStandings"]
+        ctor_standings = self._jolpica_data("get_constructor_standings").standings_lists[0].to_dict()["ConstructorStandings"]
         self.constructorStandings = parse_constructor_standings(self, ctor_standings)
         logger.info("Constructor standings have been loaded and saved to 'season.constructorStandings'.")
     
@@ -2,13 +2,16 @@
 from urllib.parse import urljoin
 from typing import List, Dict
 from time import time
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import functools
+import threading
 
 # Third-Party Library Imports
 # (No third-party libraries imported in this file)
 
 # Internal Project Imports
-from ..adapters import livetimingF1_getdata
+from ..adapters import livetimingF1_getdata, livetimingF1_source_digest, RealF1Client
 from ..adapters.jolpicaf1_adapter import jolpica_client
 from ..adapters.functions import (
     fetch_livetiming_session_index,
@@ -17,22 +20,58 @@ from ..adapters.functions import (
     livetiming_session_in_season_index,
     jolpica_find_race_for_meeting,
     jolpica_session_available_on_race,
+    season_availability_index,
 )
 from ..utils import helper
+from ..config import get_setting
+from ..utils.aio import run_coroutine
 from ..utils.logger import logger
 from ..data_processing.etl import *
 from ..data_processing.jolpica_etl import parse_constructor_standings, parse_driver_standings
 from ..data_processing.data_models import *
 from ..data_processing.silver_functions import *
-from ..utils.constants import TOPICS_MAP, SILVER_SESSION_TABLES, TABLE_GENERATION_FUNCTIONS
+from ..utils.constants import TOPICS_MAP, SILVER_SESSION_TABLES, TABLE_GENERATION_FUNCTIONS, TABLE_SESSION_REQUIREMENTS, LIVE_TOPICS
 from ..utils.exceptions import *
+from ..data_processing.fingerprint import combine_fingerprints
 from ..data_processing.lakes import DataLake
+from ..data_processing.live import LiveSessionLake
 from .driver import Driver, _jolpica_driver_dict
 
-from multiprocessing import Pool
-from functools import partial
-import multiprocessing
-from itertools import repeat
+
+class _LazyTable:
+    """
+    Session attribute that builds a default silver table on first access.
+
+    Reading the attribute generates only the table and the tables it depends
+    on, loading just the topics they need. The table is then stored on the
+    session, so later reads (and assignments) bypass this descriptor.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, session, owner=None):
+        if session is None:
+            return self
+        return session._materialize_table(self.name)
+
+
+class _LazySessionValue:
+    """Session attribute computed on first access by the named session method."""
+
+    def __init__(self, method_name):
+        self.method_name = method_name
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, session, owner=None):
+        if session is None:
+            return self
+        with session._value_lock:
+            if self.name not in session.__dict__:
+                session.__dict__[self.name] = getattr(session, self.method_name)()
+        return session.__dict__[self.name]
 
 
 class Session:
@@ -65,8 +104,23 @@ class Session:
         Path information for accessing session data.
     loaded : :class:`bool`
         Indicates whether the session data has been loaded.
+    laps, carTelemetry, raceControlMessages : :class:`pandas.DataFrame` or None
+        Silver tables. Each is generated on first access, together with the
+        tables it depends on, loading only the topics they read. None if the
+        session has no Livetiming data or the table cannot be generated.
+    first_datetime, session_start_datetime : :class:`pandas.Timestamp`
+        Timing references computed from the session topics on first access.
     """
     
+    # Silver tables, generated on first access (see ``_materialize_table``)
+    laps = _LazyTable()
+    carTelemetry = _LazyTable()
+    raceControlMessages = _LazyTable()
+
+    # Session timing references, computed on first access
+    first_datetime = _LazySessionValue("_get_first_datetime")
+    session_start_datetime = _LazySessionValue("_get_session_start_datetime")
+
     def __init__(
         self,
         season: "Season" = None,
@@ -90,9 +144,10 @@ class Session:
         self.number = number
         self.data_lake = DataLake(self)
         self.etl_parser = livef1SessionETL(session=self)  # Create an ETL parser for the session.
-        # Silver Data
-        for attr in SILVER_SESSION_TABLES:
-            setattr(self, attr, None)
+        self._table_lock = threading.Lock()
+        self._value_lock = threading.Lock()
+        # Lazy tables that could not be generated; cleared by load_data and generate.
+        self._table_misses = set()
 
         # Iterate over the kwargs and set them as attributes of the instance
         for key, value in locals().items():
@@ -108,15 +163,13 @@ class Session:
             self.is_livetiming_available = False
             self.is_jolpica_available = False
         else:
-            self.is_livetiming_available = livetiming_session_in_season_index(getattr(self.season, "livetiming_data", None), self.meeting.name, self.name, self.type, self.number)
+            availability = season_availability_index(self.season)
+            self.is_livetiming_available = availability.livetiming_session(self.meeting.name, self.name, self.type, self.number)
             if not getattr(self.season, "is_jolpica_available", False):
                 self.is_jolpica_available = False
             else:
-                race = jolpica_find_race_for_meeting(
-                    getattr(self.season, "jolpica_data", None), self.meeting.name
-                )
-                self.is_jolpica_available = jolpica_session_available_on_race(
-                    race, self.name, self.type, self.number
+                self.is_jolpica_available = availability.jolpica_session(
+                    self.meeting.name, self.name, self.type, self.number
                 )
 
     def _check_if_livetiming_available(self):
@@ -166,11 +219,27 @@ class Session:
     def _load_default_silver_tables(self):
         for table_name in SILVER_SESSION_TABLES:
             self.create_silver_table(table_name, TABLE_REQUIREMENTS[table_name], include_session=True)(globals()[TABLE_GENERATION_FUNCTIONS[table_name]])
+            self.data_lake.get("silver", table_name).session_sources = TABLE_SESSION_REQUIREMENTS.get(table_name, [])
     
     def _load_circuit_data(self):
         circuit = self.meeting.circuit
         circuit._load_circuit_data()
-        self.data_lake.create_bronze_table(table_name="track_regions", raw_data=circuit._raw_circuit_data, parsed_data=circuit.track_regions)
+        self.data_lake.create_bronze_table(
+            table_name="track_regions",
+            raw_data=circuit._raw_circuit_data,
+            parsed_data=circuit.track_regions,
+            source=combine_fingerprints(circuit._circuit_data_url, circuit._circuit_data_digest),
+        )
+
+    def _track_regions_loaded(self):
+        """
+        Whether circuit data from a known source is already in the lake.
+
+        Circuit data is not compared with the circuit API once stored, since
+        that would need the download it saves; it is never refreshed after
+        it has been loaded.
+        """
+        return self.data_lake.metadata.get("track_regions", {}).get("fingerprint") is not None
 
     def load_session_data(self):
         """
@@ -367,14 +436,12 @@ class Session:
 
         Parameters
         ----------
-        dataNames : Union[str, List[str]]
-            Single data name or list of data names to retrieve
+        dataNames : List[Tuple[str, bool]]
+            ``(data name, stream)`` pairs of the topics to retrieve
         parallel : bool, optional
-            Whether to load data in parallel (True) or sequentially (False), by default True
+            Whether to load data in parallel (True) or sequentially (False), by default False
         dataType : str, optional
             The type of the data to fetch, by default "StreamPath"
-        stream : bool, optional
-            Whether to fetch as stream, by default True
 
         Returns
         -------
@@ -384,10 +451,14 @@ class Session:
 
         Notes
         -----
-        - For parallel loading, uses multiprocessing Pool with (CPU count - 1) processes
+        - Parallel loading fetches all topics at the same time on one event loop,
+          at most ``max_concurrent_downloads`` at once (see :func:`livef1.configure`).
+          Each topic is parsed as soon as its download finishes.
         - Saves all loaded data to bronze lake before returning
         - Returns same format as input: single result for str input, dict for list input
         """
+        self._table_misses.clear()
+
         # Ensure topic names are loaded
         if not hasattr(self, "topic_names_info"):
             self.get_topic_names()
@@ -396,28 +467,14 @@ class Session:
         single_input = len(dataNames) == 1
         validated_names = dataNames
 
-        results = {}
         if parallel and len(validated_names) > 1:
-            # Parallel loading
-            n_processes = max(1, multiprocessing.cpu_count() - 1)
-            with Pool(processes=n_processes) as pool:
-                loaded_results = pool.starmap(
-                    load_single_data, 
-                    zip(
-                        np.asarray(validated_names)[:,0],
-                        repeat(self),
-                        np.asarray(validated_names)[:,1]))
-                results = {name: {"data": data, "parsed_data": parsed_data} for name, data, parsed_data in loaded_results}
+            start = time()
+            run_coroutine(self._load_data_async(validated_names))
+            logger.debug(f"Loaded {len(validated_names)} topics in {round(time() - start,3)} seconds")
         else:
             # Sequential loading
             for name, stream in validated_names:
-                name, data, parsed_data = load_single_data(name, self, stream)
-                results[name] = {"data": data, "parsed_data": parsed_data}
-
-        # Save all results to bronze lake
-        for name, result in results.items():
-            self.data_lake.create_bronze_table(table_name=name, raw_data=result["data"], parsed_data=result["parsed_data"])
-            logger.debug(f"'{name}' has been saved to the bronze lake.")
+                self._save_bronze(*load_single_data(name, self, stream), stream=stream)
 
         # Return single result or dict based on input type
         if single_input:
@@ -425,6 +482,44 @@ class Session:
         return {name: self.data_lake.get(level="bronze", table_name=name)
                for name, stream in validated_names}
 
+    async def _load_data_async(self, dataNames):
+        """
+        Fetch and parse topics concurrently, saving each to the bronze lake as it completes.
+
+        Downloads run in a thread pool bounded by the ``max_concurrent_downloads``
+        setting, so the total time is roughly that of the slowest topic.
+        """
+        loop = asyncio.get_running_loop()
+        max_workers = min(get_setting("max_concurrent_downloads"), len(dataNames))
+        streams = dict(dataNames)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="livef1-load") as executor:
+            tasks = [
+                loop.run_in_executor(executor, load_single_data, name, self, stream)
+                for name, stream in dataNames
+            ]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    name, data, parsed_data = await task
+                    self._save_bronze(name, data, parsed_data, stream=streams[name])
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+    def _save_bronze(self, name, data, parsed_data, stream=True):
+        # The topic is fingerprinted from its URL and the digest of the
+        # downloaded body, hashed while it was read, rather than from the
+        # parsed rows; without them its source is unknown.
+        path = self.topic_names_info.get(name, {}).get("StreamPath" if stream else "KeyFramePath")
+        url = None if path is None else urljoin(self.full_path, path)
+        self.data_lake.create_bronze_table(
+            table_name=name,
+            raw_data=data,
+            parsed_data=parsed_data,
+            source=None if url is None else combine_fingerprints(url, livetimingF1_source_digest(url)),
+        )
+        logger.debug(f"'{name}' has been saved to the bronze lake.")
+
     def get_table(
         self,
         dataNames,
@@ -506,11 +601,11 @@ class Session:
         # Get single topic
         >>> telemetry = session.get_data("CarData.z")
         
-        # Get multiple topics in parallel (default)
+        # Get multiple topics sequentially (default)
         >>> data = session.get_data(["CarData.z", "Position.z", "SessionStatus"])
         
-        # Get multiple topics sequentially
-        >>> data = session.get_data(["CarData.z", "Position.z"], parallel=False)
+        # Download multiple topics concurrently
+        >>> data = session.get_data(["CarData.z", "Position.z"], parallel=True)
         
         # Force download data even if cached
         >>> data = session.get_data("CarData.z", force=True)
@@ -519,7 +614,7 @@ class Session:
         -----
         - Automatically handles both single and multiple data requests
         - Checks cache (data lake) before loading new data unless force=True
-        - Uses parallel processing for multiple topics when parallel=True
+        - Downloads multiple topics concurrently when parallel=True
         - Returns same format as input: single result for str input, dict for list input
         """
 
@@ -628,8 +723,8 @@ class Session:
         """
         Retrieve the laps data.
 
-        This method returns the laps data if it has been generated. If not, it logs an 
-        informational message indicating that the laps table is not generated yet.
+        This method returns the laps data, generating it on first access. If it
+        cannot be generated, it logs an informational message.
 
         Returns
         -------
@@ -638,21 +733,22 @@ class Session:
 
         Notes
         -----
-        - The method checks if the `laps` attribute is populated.
+        - Accessing the `laps` attribute loads only the topics the laps table needs.
         - If the `laps` attribute is not populated, it logs an informational message.
         """
         if self.laps is not None:
             return self.laps
         else:
-            logger.info("Laps table is not generated yet. Use .generate() to load required data and generate silver tables.")
+            logger.info("Laps table is not available. Use .generate() to load required data and generate silver tables.")
             return None
 
     def get_car_telemetry(self):
         """
         Retrieve the car telemetry data.
 
-        This method returns the car telemetry data if it has been generated. If not, it logs an 
-        informational message indicating that the car telemetry table is not generated yet.
+        This method returns the car telemetry data, generating it (and the laps
+        table it depends on) on first access. If it cannot be generated, it logs
+        an informational message.
 
         Returns
         -------
@@ -661,13 +757,13 @@ class Session:
 
         Notes
         -----
-        - The method checks if the `carTelemetry` attribute is populated.
+        - Accessing the `carTelemetry` attribute loads only the topics the table needs.
         - If the `carTelemetry` attribute is not populated, it logs an informational message.
         """
         if self.carTelemetry is not None:
             return self.carTelemetry
         else:
-            logger.info("Car Telemetry table is not generated yet. Use .generate() to load required data and generate silver tables.")
+            logger.info("Car Telemetry table is not available. Use .generate() to load required data and generate silver tables.")
             return None
     
     def _get_first_datetime(self):
@@ -689,16 +785,24 @@ class Session:
 
     def generate(self, silver=True, gold=False, tables=None):
         
-        self._load_circuit_data()
+        self._table_misses.clear()
+        if not self._track_regions_loaded():
+            self._load_circuit_data()
 
         try:
             self.load_session_results()
         except Exception as e:
             logger.warning(f"Failed to load session results: {e}")
 
-        required_data = set(["CarData.z", "Position.z", "SessionStatus"])
-        silver_tables_to_generate = []
-        gold_tables_to_generate = []
+        self._generate(silver=silver, gold=gold, tables=tables)
+
+    def _generate(self, silver=True, gold=False, tables=None):
+        """
+        Generate the requested silver and gold tables and the tables they depend on.
+
+        Only topics read by tables that are not up to date are loaded.
+        """
+        required_data = set()
 
         # Gold tables may depend on default silver tables; register them whenever
         # either level is requested so dependency expansion can resolve them.
@@ -716,52 +820,117 @@ class Session:
                     seeds.append(self.data_lake.get("gold", table_name))
 
         closure = self.data_lake._expand_table_dependencies(seeds)
+        # Tables generated earlier (in memory or in lake storage) from the
+        # same inputs and callbacks are reused instead of being generated again.
+        fresh_tables = self.data_lake.fresh_tables(closure)
         for table in closure:
-            required_data.update(set(table.source_tables["bronze"]))
-
-        silver_in_closure = [
-            t for t in closure
-            if self.data_lake.metadata[t.table_name]["table_type"] == "silver"
-        ]
-        gold_in_closure = [
-            t for t in closure
-            if self.data_lake.metadata[t.table_name]["table_type"] == "gold"
-        ]
-        silver_tables_to_generate = self.data_lake._topo_sort_tables(silver_in_closure)
-        gold_tables_to_generate = self.data_lake._topo_sort_tables(gold_in_closure)
-
-        # Use the unified get_data method instead of get_data_parallel
-        logger.info(f"Topics to be loaded : {list(required_data)}")
-        self.get_data(list(required_data), parallel=False)
-
-        self.first_datetime = self._get_first_datetime()
-        self.session_start_datetime = self._get_session_start_datetime()
+            if table.table_name not in fresh_tables:
+                required_data.update(set(table.source_tables["bronze"]))
+                required_data.update(getattr(table, "session_sources", []))
+
+        tables_to_generate = self.data_lake._topo_sort_tables(closure)
+
+        if "track_regions" in required_data and not self._track_regions_loaded():
+            self._load_circuit_data()
+
+        if required_data:
+            # Fetch all required topics concurrently
+            logger.info(f"Topics to be loaded : {list(required_data)}")
+            self.get(list(required_data), parallel=True)
+            # Timing references are recomputed from the loaded topics when next used.
+            self.__dict__.pop("first_datetime", None)
+            self.__dict__.pop("session_start_datetime", None)
 
+        self.table_timings = {}
         if self.data_lake._check_circular_dependencies():
-            if silver_tables_to_generate:
-                logger.info(f"Silver tables are being generated.")
-                for silver_table in silver_tables_to_generate:
-                    try:
-                        table_name = silver_table.table_name
-                        silver_table.generate_table()
-                        setattr(self, table_name, self.get_data(dataNames = table_name, level = "silver"))
-                        logger.info(f"'{table_name}' has been generated and saved to the silver lake. You can access it from 'session.{table_name}'.")
-                    except Exception as e:
-                        logger.error(f"Failed to generate silver table '{table_name}': {e}")
-                        logger.debug(f"Traceback: ", exc_info=True)
-            if gold_tables_to_generate:
-                logger.info("Gold tables are being generated.")
-                for gold_table in gold_tables_to_generate:
-                    try:
-                        table_name = gold_table.table_name
-                        gold_table.generate_table()
-                        setattr(self, table_name, self.get_data(dataNames = table_name, level = "gold"))
-                        logger.info(f"'{table_name}' has been generated and saved to the gold lake. You can access it from 'session.{table_name}'.")
-                    except Exception as e:
-                        logger.error(f"Failed to generate gold table '{table_name}': {e}")
+            if tables_to_generate:
+                logger.info(f"Tables are being generated: {[t.table_name for t in tables_to_generate]}")
+                self.table_timings = self.data_lake.generate_tables(
+                    tables_to_generate,
+                    generate=functools.partial(self._generate_table, fresh_tables=fresh_tables),
+                )
+                if self.table_timings:
+                    timings = ", ".join(f"{name}: {seconds:.2f}s" for name, seconds in self.table_timings.items())
+                    logger.info(f"Table generation times: {timings}")
         else:
             logger.error("Circular dependencies detected. Please check your table dependencies.")
 
+    def _materialize_table(self, table_name):
+        """
+        Build a default silver table on first access of its session attribute.
+
+        Only the table and the tables it depends on are generated, and only
+        the topics they read are loaded. Returns None when the session has no
+        Livetiming data or the table cannot be generated. A table that could
+        not be generated is remembered, and later accesses return None without
+        fetching or generating anything, until ``load_data`` or ``generate``
+        is called explicitly. Exceptions, such as network errors, are not
+        remembered, so the next access tries again.
+        """
+        if not getattr(self, "is_livetiming_available", False):
+            return None
+        with self._table_lock:
+            if table_name in self._table_misses:
+                return None
+            if table_name not in self.__dict__:
+                logger.info(f"'{table_name}' is being generated on first access.")
+                self._generate(silver=True, gold=False, tables=[table_name])
+                if table_name not in self.__dict__:
+                    self._table_misses.add(table_name)
+        return self.__dict__.get(table_name)
+
+    def _generate_table(self, table, fresh_tables=()):
+        """Generate one silver or gold table, unless it is up to date, and set it on the session."""
+        table_name = table.table_name
+        level = self.data_lake.metadata[table_name]["table_type"]
+        if table_name in fresh_tables:
+            setattr(self, table_name, table.df)
+            logger.info(f"'{table_name}' is up to date with its inputs and was not generated again. You can access it from 'session.{table_name}'.")
+            return
+        table.generate_table()
+        setattr(self, table_name, self.get_data(dataNames = table_name, level = level))
+        logger.info(f"'{table_name}' has been generated and saved to the {level} lake. You can access it from 'session.{table_name}'.")
+
+    def live(self, client=None, batch_size=None, batch_interval=None):
+        """
+        Keep the session's tables up to date from the live timing stream.
+
+        Records of the ``LIVE_TOPICS`` topics are appended to the bronze
+        tables in micro-batches. ``session.laps`` is rebuilt and
+        ``session.carTelemetry`` is extended with the laps completed since the
+        previous batch, so both stay current while the session is running.
+
+        Parameters
+        ----------
+        client : :class:`~livef1.adapters.realtime_client.RealF1Client`, optional
+            Client to read from. A new one is created if omitted.
+        batch_size : int, optional
+            Number of buffered records that triggers a batch. Defaults to the
+            ``live_batch_size`` setting.
+        batch_interval : float, optional
+            Seconds after which buffered records are written anyway. Defaults
+            to the ``live_batch_interval`` setting.
+
+        Returns
+        -------
+        :class:`~livef1.adapters.realtime_client.RealF1Client`
+            The client feeding the session. Start it with ``client.run()``.
+            The lake is available as ``session.live_lake``.
+
+        Examples
+        --------
+        >>> client = session.live()
+        >>> client.run()  # session.laps and session.carTelemetry grow as laps complete
+        """
+        if "track_regions" not in self.data_lake.metadata and getattr(self, "meeting", None) is not None:
+            try:
+                self._load_circuit_data()
+            except Exception as e:
+                logger.warning(f"Track regions are not available for live telemetry: {e}")
+        self.live_lake = LiveSessionLake(self, batch_size=batch_size, batch_interval=batch_interval)
+        if client is None:
+            client = RealF1Client(topics=list(LIVE_TOPICS))
+        return self.live_lake.attach(client)
 
     def _create_table(self, level, table_name, source_tables, include_session=False):
         """
@@ -842,7 +1011,12 @@ class Session:
                         # topic_name = self.check_data_name(table)
 
                         temp_table = self.get_table(topic_name, level=table_level)
-                        source_data[param_name] = temp_table.df
+                        source_df = temp_table.df
+                        # A shallow copy keeps column changes made by the callback
+                        # away from tables generated at the same time.
+                        if source_df is not None:
+                            source_df = source_df.copy(deep=False)
+                        source_data[param_name] = source_df
                         # source_objs.append(temp_table) # TODO: Add sources from different levels
 
                 # Call the original function with source data as parameters
@@ -940,18 +1114,29 @@ def load_single_data(dataName, session, stream):
     if stream: dataType = "StreamPath"
     else: dataType = "KeyFramePath"
 
+    # In incremental mode records are downloaded while they are parsed and
+    # the raw records are not kept.
+    incremental = stream and get_setting("incremental_parse")
+
     logger.debug(f"Fetching data : '{dataName}'")
     start = time()
     data = livetimingF1_getdata(
         urljoin(session.full_path, session.topic_names_info[dataName][dataType]),
-        stream=stream
+        stream=stream,
+        incremental=incremental
     )
-    logger.debug(f"Fetched in {round(time() - start,3)} seconds")
+    if not incremental:
+        logger.debug(f"Fetched in {round(time() - start,3)} seconds")
+        start = time()
     # Parse the retrieved data using the ETL parser and return the result.
-    start = time()
-    parsed_data = list(session.etl_parser.unified_parse(dataName, data))
+    parsed_data = session.etl_parser.unified_parse(dataName, data)
+    if not isinstance(parsed_data, dict):
+        # Columnar parsers already return columns; record parsers are generators.
+        parsed_data = list(parsed_data)
+    if incremental:
+        data = None
 
     logger.debug(f"Parsed in {round(time() - start,3)} seconds")
     logger.info(f"'{dataName}' has been fetched and parsed")
 
-    return dataName, data, parsed_data
\ No newline at end of file
+    return dataName, data, parsed_data
@@ -0,0 +1,30 @@
+# Standard Library Imports
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
+def run_coroutine(coro):
+    """
+    Run a coroutine to completion from synchronous code and return its result.
+
+    When no event loop is running the coroutine is run with :func:`asyncio.run`.
+    Inside a running loop (e.g. a Jupyter notebook) ``asyncio.run`` is not
+    allowed, so the coroutine is run on its own loop in a helper thread.
+
+    Parameters
+    ----------
+    coro : coroutine
+        The coroutine to run.
+
+    Returns
+    -------
+    Any
+        The value returned by the coroutine.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
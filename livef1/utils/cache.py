@@ -0,0 +1,360 @@
+# Standard Library Imports
+import hashlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Internal Project Imports
+from .. import config
+from .logger import logger
+
+
+class DiskCache:
+    """
+    Content-addressed on-disk cache for Livetiming downloads.
+
+    Files are stored under a name derived from the SHA-256 of the full request
+    URL. Reads refresh a file's modification time, which is used as the
+    recency key when the cache grows beyond ``size_limit`` and the least
+    recently used files are evicted.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        Root directory of the cache. Created on first write.
+    size_limit : int
+        Maximum total size of cached files in bytes.
+    """
+
+    def __init__(self, directory, size_limit):
+        self.directory = Path(directory).expanduser()
+        self.size_limit = size_limit
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url):
+        """Return the cache key (hex digest) of a URL."""
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def path(self, url):
+        """Return the path a URL is (or would be) cached at."""
+        key = self.key(url)
+        return self.directory / key[:2] / key
+
+    def contains(self, url):
+        return self.path(url).is_file()
+
+    def get(self, url):
+        """
+        Return the cached content of a URL, or None if it is not cached.
+
+        Parameters
+        ----------
+        url : str
+            The full request URL.
+
+        Returns
+        -------
+        bytes or None
+        """
+        path = self.path(url)
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        self.touch(path)
+        logger.debug(f"Cache hit for URL: {url}")
+        return content
+
+    def put(self, url, content):
+        """
+        Store the content of a URL and evict old files if the cache is full.
+
+        Parameters
+        ----------
+        url : str
+            The full request URL.
+        content : bytes
+            The raw response body.
+        """
+        path = self.path(url)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # A failing cache must never fail the download itself.
+            logger.warning(f"Could not write '{url}' to the download cache: {e}")
+            return
+        self.evict()
+
+    def open(self, url):
+        """
+        Open the cached file of a URL for binary reading, or return None if it is not cached.
+
+        Parameters
+        ----------
+        url : str
+            The full request URL.
+
+        Returns
+        -------
+        file object or None
+        """
+        path = self.path(url)
+        try:
+            handle = path.open("rb")
+        except FileNotFoundError:
+            return None
+        self.touch(path)
+        logger.debug(f"Cache hit for URL: {url}")
+        return handle
+
+    @contextmanager
+    def writer(self, url):
+        """
+        Context manager that writes the content of a URL in pieces.
+
+        The data is written to a temporary file which only replaces the cached
+        file once the block exits without an error, so readers never see a
+        partial download. Write errors are logged and the entry is dropped;
+        they never interrupt the caller.
+
+        Parameters
+        ----------
+        url : str
+            The full request URL.
+
+        Yields
+        ------
+        callable
+            A function taking a ``bytes`` piece to append.
+        """
+        path = self.path(url)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        state = {"handle": None, "failed": False}
+
+        def write(piece):
+            if state["failed"]:
+                return
+            try:
+                if state["handle"] is None:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    state["handle"] = tmp_path.open("wb")
+                state["handle"].write(piece)
+            except OSError as e:
+                logger.warning(f"Could not write '{url}' to the download cache: {e}")
+                state["failed"] = True
+
+        try:
+            yield write
+        except BaseException:
+            state["failed"] = True
+            raise
+        finally:
+            if state["handle"] is not None:
+                state["handle"].close()
+            if state["failed"]:
+                tmp_path.unlink(missing_ok=True)
+
+        if state["handle"] is None:
+            return
+        try:
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write '{url}' to the download cache: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        self.evict()
+
+    def touch(self, path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _entries(self):
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for path in self.directory.glob("*/*"):
+            if path.suffix == ".tmp":
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self):
+        """Total size of cached files in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Delete least recently used files until the cache fits ``size_limit``."""
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            if total <= self.size_limit:
+                return
+            for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+                if total <= self.size_limit:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                    logger.debug(f"Evicted '{path.name}' from the download cache.")
+                except FileNotFoundError:
+                    pass
+
+    def clear(self):
+        """Remove every cached file."""
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+
+_cache = None
+
+
+def get_cache():
+    """
+    Return the package-wide download cache, or None when caching is disabled.
+
+    The cache follows the ``cache_dir`` and ``cache_size_limit`` settings of
+    :func:`livef1.configure`.
+    """
+    global _cache
+    directory = config.get_setting("cache_dir")
+    if directory is None:
+        return None
+    size_limit = config.get_setting("cache_size_limit")
+    if (
+        _cache is None
+        or _cache.directory != Path(directory).expanduser()
+        or _cache.size_limit != size_limit
+    ):
+        _cache = DiskCache(directory, size_limit)
+    return _cache
+
+
+def is_offline():
+    """True if downloads must be served from the cache only."""
+    return bool(config.get_setting("offline"))
+
+
+class MetadataCache:
+    """
+    In-memory cache of season-level metadata with a time to live.
+
+    Season ``Index.json`` files and Jolpica season queries are requested by
+    every :func:`livef1.get_season`, :func:`livef1.get_meeting` and
+    :func:`livef1.get_session` call and by the availability checks of
+    seasons, meetings and sessions. Results are kept for ``ttl`` seconds
+    (the ``metadata_ttl`` setting) so they are fetched once per process
+    instead. Concurrent requests for the same key wait for one fetch.
+
+    Keys are tuples whose second item is the season year, so the entries of
+    a season can be dropped with :meth:`invalidate`.
+    """
+
+    def __init__(self):
+        self._entries = {}      # key -> (expiry, value)
+        self._locks = {}        # key -> lock held while the value is fetched
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_fetch(self, key, fetch, cache_if=None):
+        """
+        Return the cached value of ``key``, calling ``fetch()`` if it is missing or expired.
+
+        Parameters
+        ----------
+        key : tuple
+            Cache key, e.g. ``("livetiming_season_index", 2024)``.
+        fetch : callable
+            Returns the value. Exceptions are raised to the caller and
+            nothing is cached.
+        cache_if : callable, optional
+            Predicate on the fetched value; values it rejects (e.g. failed
+            requests) are returned but not cached.
+        """
+        ttl = config.get_setting("metadata_ttl")
+        if not ttl:
+            return fetch()
+        value = self._get(key)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another thread may have fetched it meanwhile.
+            value = self._get(key)
+            if value is not _MISSING:
+                return value
+            self.misses += 1
+            value = fetch()
+            if cache_if is None or cache_if(value):
+                with self._lock:
+                    self._entries[key] = (time.monotonic() + ttl, value)
+            return value
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self.hits += 1
+            return entry[1]
+
+    def invalidate(self, season=None):
+        """
+        Drop cached entries.
+
+        Parameters
+        ----------
+        season : int, optional
+            Only drop the entries of this season year. By default everything
+            is dropped.
+        """
+        with self._lock:
+            if season is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if len(key) > 1 and key[1] == season]:
+                    del self._entries[key]
+
+
+_MISSING = object()
+
+metadata_cache = MetadataCache()
+
+
+def clear_metadata_cache(season=None):
+    """
+    Forget cached season metadata so the next request fetches it again.
+
+    Parameters
+    ----------
+    season : int, optional
+        Only forget the metadata of this season year. By default all seasons
+        are forgotten.
+
+    Examples
+    --------
+    >>> import livef1
+    >>> # Pick up a session added to the calendar since the last request
+    >>> livef1.clear_metadata_cache(2025)
+    """
+    metadata_cache.invalidate(season)
@@ -579,6 +579,17 @@ TABLE_REQUIREMENTS = {
     "raceControlMessages": ["RaceControlMessages"]
 }
 
+# Topics a live session lake subscribes to: the sources of ``laps`` and
+# ``carTelemetry`` that are streamed during a session.
+LIVE_TOPICS = ["TimingData", "CarData.z", "Position.z", "RaceControlMessages", "TyreStintSeries", "TrackStatus"]
+
+# Topics a default table reads through the session (``first_datetime`` and
+# ``session_start_datetime``) in addition to its sources.
+TABLE_SESSION_REQUIREMENTS = {
+    "laps": ["CarData.z", "Position.z", "SessionData"],
+    "carTelemetry": ["CarData.z", "Position.z"],
+}
+
 column_mapping = {
   'rpm': "RPM",
   'speed' : "Speed",
@@ -0,0 +1,126 @@
+# Standard Library Imports
+import os
+from collections import deque
+from concurrent.futures import CancelledError
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+
+# Internal Project Imports
+from .. import config
+from .helper import parse
+from .logger import logger
+from .pool import can_use_processes, discard_process_pool, get_process_pool, shutdown_process_pool
+
+
+def _decode_chunk(payloads):
+    """Worker function: decode a list of compressed payloads."""
+    return [parse(payload, zipped=True) for payload in payloads]
+
+
+def _decode_workers():
+    workers = config.get_setting("decode_workers")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def shutdown_decode_pool():
+    """Stop the worker processes of the shared pools, if any."""
+    shutdown_process_pool()
+
+
+def _use_parallel_decode(workers):
+    return config.get_setting("parallel_decode") and can_use_processes(workers)
+
+
+def _serial(records):
+    for ts, payload in records:
+        yield ts, parse(payload, zipped=True)
+
+
+def decode_zipped_records(records):
+    """
+    Decode the compressed payloads of ``(timestamp, payload)`` records.
+
+    Each payload is a base64 encoded, deflate compressed JSON document, as in
+    the ``CarData.z`` and ``Position.z`` topics. When the ``parallel_decode``
+    setting is on and there are enough records, payloads are decoded in
+    batches of ``decode_chunk_size`` across a pool of ``decode_workers``
+    processes. A bounded number of batches is in flight at a time, so
+    ``records`` may be a generator that is consumed as decoding progresses.
+
+    Records are always yielded in input order. If the pool cannot be used the
+    remaining records are decoded in this process.
+
+    Parameters
+    ----------
+    records : iterable of tuple
+        ``(timestamp, payload)`` pairs.
+
+    Yields
+    ------
+    tuple
+        ``(timestamp, decoded)`` pairs, where ``decoded`` is the parsed JSON.
+    """
+    workers = _decode_workers()
+    records = iter(records)
+    if not _use_parallel_decode(workers):
+        yield from _serial(records)
+        return
+
+    chunk_size = config.get_setting("decode_chunk_size")
+    first = list(islice(records, chunk_size))
+    if len(first) < chunk_size:
+        # Too little data to be worth shipping to other processes.
+        yield from _serial(first)
+        return
+
+    def chunks():
+        chunk = first
+        while chunk:
+            yield [ts for ts, _ in chunk], [payload for _, payload in chunk]
+            chunk = list(islice(records, chunk_size))
+
+    pending = deque()
+    pool = None
+    try:
+        pool = get_process_pool(workers)
+    except (OSError, RuntimeError, NotImplementedError) as e:
+        logger.warning(f"Parallel decoding is unavailable, decoding serially: {e}")
+
+    for timestamps, payloads in chunks():
+        if pool is not None:
+            try:
+                pending.append((timestamps, payloads, pool.submit(_decode_chunk, payloads)))
+            except (BrokenProcessPool, RuntimeError) as e:
+                logger.warning(f"Decode pool failed, decoding serially: {e}")
+                discard_process_pool(pool)
+                pool = None
+                pending.append((timestamps, payloads, None))
+        else:
+            pending.append((timestamps, payloads, None))
+
+        # Keep at most two batches per worker in flight.
+        while len(pending) > 2 * workers or (pool is None and pending):
+            pool = yield from _yield_batch(pending.popleft(), pool)
+
+    while pending:
+        pool = yield from _yield_batch(pending.popleft(), pool)
+
+
+def _yield_batch(batch, pool):
+    """Yield one decoded batch, falling back to serial decoding on pool errors."""
+    timestamps, payloads, future = batch
+    decoded = None
+    if future is not None:
+        try:
+            decoded = future.result()
+        except (BrokenProcessPool, CancelledError) as e:
+            if pool is not None:
+                logger.warning(f"Decode pool failed, decoding serially: {e}")
+                discard_process_pool(pool)
+                pool = None
+    if decoded is None:
+        decoded = _decode_chunk(payloads)
+    yield from zip(timestamps, decoded)
+    return pool
@@ -63,6 +63,10 @@ class DataDecodingError(AdapterError):
     """Raised when decoding the response fails."""
     pass
 
+class CacheMissError(AdapterError):
+    """Raised in offline mode when a requested file is not in the download cache."""
+    pass
+
 
 
 
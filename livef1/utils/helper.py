@@ -15,13 +15,13 @@ import numpy as np
 import pandas as pd
 import pycountry
 import pytz
-import requests
 from bs4 import BeautifulSoup
 
 # Internal Project Imports
 from .constants import *
 from .logger import logger
 from .exceptions import LiveF1Error
+from .http import http_get
 
 def build_session_endpoint(session_path):
     """
@@ -151,6 +151,73 @@ def parse_hash(hash_code):
     tl = 12  # Length of the key in the response.
     return parse(hash_code, zipped=True)
 
+# Flattened key strings by prefix, e.g. _FLAT_KEYS["Sectors_1_"]["Value"] == "Sectors_1_Value".
+# Feeds reuse a small set of keys, so records share the same key objects.
+_FLAT_KEYS = {}
+_FLAT_KEYS_LIMIT = 10000
+
+
+def _flat_keys(prefix):
+    keys = _FLAT_KEYS.get(prefix)
+    if keys is None:
+        keys = {}
+        # Bound the cache for feeds with unexpected, ever-changing keys.
+        if len(_FLAT_KEYS) < _FLAT_KEYS_LIMIT:
+            _FLAT_KEYS[prefix] = keys
+    return keys
+
+
+def flatten_nested_dict(info, record, prefix="", deleted_key=None):
+    """
+    Flattens a nested dictionary into ``record`` in a single pass.
+
+    Keys of nested dictionaries are joined with ``_`` under their parent key.
+    Lists of dictionaries are expanded into ``<key>_<position>_<field>`` keys,
+    with positions starting at 1. Values are written into ``record`` in place,
+    so each field costs one assignment instead of a copy of the whole record,
+    and joined key strings are cached and reused across records.
+
+    Parameters
+    ----------
+    info : dict
+        The nested dictionary to flatten.
+    record : dict
+        The record to add the flattened keys to. It is modified in place.
+    prefix : str, optional
+        A prefix for keys in the flattened dictionary, by default "".
+    deleted_key : str, optional
+        A key that is copied to ``record`` as is, without a prefix and without
+        being flattened (e.g. ``"_deleted"`` in timing data), by default None.
+
+    Returns
+    -------
+    dict
+        ``record``, with the flattened keys added.
+    """
+    keys = _flat_keys(prefix)
+    for info_k, info_v in info.items():
+        if info_k == deleted_key:
+            record[info_k] = info_v
+        elif isinstance(info_v, list):
+            # Flatten list entries into the record with incremental suffixes.
+            for sector_no, item in enumerate(info_v, 1):
+                item_prefix = f"{info_k}_{sector_no}_"
+                item_keys = _flat_keys(item_prefix)
+                for k, v in item.items():
+                    key = item_keys.get(k)
+                    if key is None:
+                        key = item_keys[k] = item_prefix + k
+                    record[key] = v
+        else:
+            key = keys.get(info_k)
+            if key is None:
+                key = keys[info_k] = prefix + info_k
+            if isinstance(info_v, dict):
+                flatten_nested_dict(info_v, record, key + "_", deleted_key)
+            else:
+                record[key] = info_v
+    return record
+
 def parse_helper_for_nested_dict(info, record, prefix=""):
     """
     Recursively parses a nested dictionary and flattens it into a single-level dictionary.
@@ -169,18 +236,7 @@ def parse_helper_for_nested_dict(info, record, prefix=""):
     dict
         The updated record with flattened keys from the nested dictionary.
     """
-    for info_k, info_v in info.items():
-        if isinstance(info_v, list):
-            # Flatten list entries into the record with incremental suffixes.
-            record = {**record, **{**{info_k + "_" + str(sector_no + 1) + "_" + k: v 
-                                      for sector_no in range(len(info_v)) 
-                                      for k, v in info_v[sector_no].items()}}}
-        elif isinstance(info_v, dict):
-            # Recursively parse nested dictionaries.
-            record = parse_helper_for_nested_dict(info_v, record, prefix=prefix + info_k + "_")
-        else:
-            record = {**record, **{prefix + info_k: info_v}}  # Add scalar values to the record.
-    return record
+    return flatten_nested_dict(info, dict(record), prefix)
 
 def identifer_text_format(text):
     """
@@ -392,7 +448,7 @@ def scrape_f1_results(url):
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
     
-    response = requests.get(url, headers=headers)
+    response = http_get(url, headers=headers)
     if response.status_code != 200:
         print(f"Failed to retrieve page: {response.status_code}")
         return None
@@ -443,9 +499,9 @@ def scrape_f1_results(url):
         return None
 
 def get_circuit_keys():
-    response = requests.get(CIRCUIT_KEYS_URL)
+    response = http_get(CIRCUIT_KEYS_URL)
     if response.status_code == 200:
-        return pd.read_csv(CIRCUIT_KEYS_URL)
+        return pd.read_csv(io.StringIO(response.text))
     else:
         raise Exception(f"Failed to load circuit keys: {response.status_code}")
 
@@ -0,0 +1,104 @@
+# Standard Library Imports
+import threading
+
+# Third-Party Library Imports
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Internal Project Imports
+from .. import config
+from .logger import logger
+
+# Status codes worth retrying: rate limiting and transient server errors.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_session():
+    """
+    Build a ``requests.Session`` with keep-alive pooling and retries.
+    """
+    retry = Retry(
+        total=config.get_setting("http_retries"),
+        backoff_factor=config.get_setting("http_backoff_factor"),
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        # Hand the final response back so callers keep their own status handling.
+        raise_on_status=False,
+    )
+    pool_size = config.get_setting("http_pool_size")
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    logger.debug(f"Created pooled HTTP session (pool size: {pool_size}).")
+    return session
+
+
+def get_http_session():
+    """
+    Return the package-wide pooled HTTP session.
+
+    The session is shared by every LiveF1 HTTP call so that connections to the
+    same host are kept alive and reused instead of paying a new TCP and TLS
+    handshake per request. Pool size and retry behaviour follow the ``http_*``
+    settings of :func:`livef1.configure`.
+
+    Returns
+    -------
+    requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def reset_http_session():
+    """
+    Close the shared session. The next request builds a new one with the current settings.
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def http_get(url, headers=None, timeout=None, **kwargs):
+    """
+    Send a GET request through the shared pooled session.
+
+    Parameters
+    ----------
+    url : str
+        The full URL to request.
+    headers : dict, optional
+        Extra headers, merged over the session defaults.
+    timeout : float, optional
+        Request timeout in seconds. Defaults to the ``http_timeout`` setting.
+    **kwargs
+        Passed to :meth:`requests.Session.get`.
+
+    Returns
+    -------
+    requests.Response
+    """
+    if timeout is None:
+        timeout = config.get_setting("http_timeout")
+    return get_http_session().get(url, headers=headers, timeout=timeout, **kwargs)
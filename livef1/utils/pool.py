@@ -0,0 +1,123 @@
+# Standard Library Imports
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Internal Project Imports
+from .logger import logger
+
+_pools = {}     # worker count -> ProcessPoolExecutor
+_pool_lock = threading.Lock()
+
+
+def get_process_pool(workers):
+    """
+    Return the shared worker process pool with ``workers`` processes.
+
+    One pool is kept per worker count, so callers asking for different
+    counts (e.g. payload decoding and telemetry) never tear down a pool the
+    other is still using.
+
+    Parameters
+    ----------
+    workers : int
+        Number of worker processes.
+
+    Returns
+    -------
+    concurrent.futures.ProcessPoolExecutor
+    """
+    with _pool_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            # "spawn" avoids forking a process that is running download threads.
+            pool = _pools[workers] = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.debug(f"Started process pool with {workers} worker processes.")
+        return pool
+
+
+def discard_process_pool(pool):
+    """Stop a pool that failed, so the next :func:`get_process_pool` call starts a new one."""
+    with _pool_lock:
+        for workers, shared in list(_pools.items()):
+            if shared is pool:
+                del _pools[workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_process_pool():
+    """Stop the worker processes of every shared pool."""
+    with _pool_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_process_pool)
+
+
+def can_use_processes(workers):
+    """True if work may be handed to ``workers`` processes from this process."""
+    return (
+        workers > 1
+        # Never start a pool from inside a worker process.
+        and multiprocessing.parent_process() is None
+    )
+
+
+def map_partitions(func, partitions, workers):
+    """
+    Call ``func(*args)`` for every tuple of ``partitions`` on the shared pool.
+
+    Partitions are pickled to the worker processes, so ``func`` must be a
+    module-level function and its arguments picklable. Results are returned
+    in input order. When the pool cannot be used, or fails while running,
+    the remaining partitions are processed in this process.
+
+    Parameters
+    ----------
+    func : callable
+        Module-level function to apply.
+    partitions : iterable of tuple
+        Positional arguments of each call.
+    workers : int
+        Number of worker processes. 1 runs every call in this process.
+
+    Returns
+    -------
+    list
+        One result per partition.
+    """
+    partitions = list(partitions)
+    if len(partitions) < 2 or not can_use_processes(workers):
+        return [func(*args) for args in partitions]
+
+    pool = None
+    try:
+        pool = get_process_pool(workers)
+        futures = [pool.submit(func, *args) for args in partitions]
+    except (OSError, RuntimeError, NotImplementedError) as e:
+        logger.warning(f"Process pool is unavailable, running serially: {e}")
+        if pool is not None:
+            discard_process_pool(pool)
+        return [func(*args) for args in partitions]
+
+    results = []
+    failed = False
+    for args, future in zip(partitions, futures):
+        if not failed:
+            try:
+                results.append(future.result())
+                continue
+            except (BrokenProcessPool, CancelledError) as e:
+                logger.warning(f"Process pool failed, running serially: {e}")
+                discard_process_pool(pool)
+                failed = True
+        results.append(func(*args))
+    return results
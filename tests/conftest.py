@@ -13,6 +13,16 @@ import numpy as np
 from unittest.mock import MagicMock, patch
 
 
+@pytest.fixture(autouse=True)
+def clear_metadata_cache():
+    """Season metadata cached by one test must not leak into the next."""
+    from livef1.utils.cache import clear_metadata_cache
+
+    clear_metadata_cache()
+    yield
+    clear_metadata_cache()
+
+
 @pytest.fixture
 def session_path():
     """Minimal session path dict as returned by API."""
@@ -60,6 +70,7 @@ def season_data():
 def mock_season_jolpica_loaders():
     """No-op Season Jolpica loaders so generate tests stay offline."""
     with (
+        patch("livef1.models.season.Season._fetch_jolpica_data", return_value={}),
         patch("livef1.models.season.Season._load_drivers"),
         patch("livef1.models.season.Season._load_constructors"),
         patch("livef1.models.season.Season._load_driver_standings"),
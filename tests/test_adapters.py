@@ -1,8 +1,10 @@
 """Tests for livef1.adapters."""
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
 import livef1.adapters.functions as adapter_functions
-from livef1.adapters.livetimingf1_adapter import LivetimingF1adapters, livetimingF1_request, livetimingF1_getdata
+from livef1.adapters.livetimingf1_adapter import LivetimingF1adapters, livetimingF1_request, livetimingF1_getdata, livetimingF1_iterdata
 from livef1.adapters.other import get_table_from_wikipedia, parse_schedule_from_f1com
 from livef1.utils.exceptions import livef1Exception
 
@@ -36,8 +38,52 @@ def test_download_data_location_not_found():
                 adapter_functions.download_data(season_identifier=2024, location_identifier="Sakhir")
 
 
+def test_download_season_data_fetches_sources_concurrently():
+    """Livetiming, Jolpica races and the seasons list are requested at the same time."""
+    def slow(result):
+        def fetch(*args):
+            time.sleep(0.3)
+            return result
+        return fetch
+
+    season_row = MagicMock(season="2024", url="https://en.wikipedia.org/wiki/2024_Formula_One_World_Championship")
+    with (
+        patch("livef1.adapters.functions.fetch_livetiming_season_index", side_effect=slow(({"Meetings": []}, True))),
+        patch("livef1.adapters.functions.fetch_jolpica_season_races_list", side_effect=slow(([], True))),
+        patch("livef1.adapters.functions.fetch_jolpica_seasons", side_effect=slow([season_row])),
+    ):
+        start = time.perf_counter()
+        result = adapter_functions.download_season_data(2024)
+        elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6
+    assert result["is_livetiming_available"] is True
+    assert result["is_jolpica_available"] is True
+    assert result["wiki"] == season_row.url
+
+
+def test_fetch_jolpica_season_meetings_partial_failure():
+    with (
+        patch("livef1.adapters.functions.fetch_jolpica_season_races_list", return_value=(["race"], True)),
+        patch("livef1.adapters.functions.fetch_jolpica_seasons", side_effect=RuntimeError("down")),
+    ):
+        assert adapter_functions.fetch_jolpica_season_meetings(2024) == (["race"], False, None)
+    with (
+        patch("livef1.adapters.functions.fetch_jolpica_season_races_list", return_value=([], False)),
+        patch("livef1.adapters.functions.fetch_jolpica_seasons", return_value=[]),
+    ):
+        assert adapter_functions.fetch_jolpica_season_meetings(2024) == ([], False, None)
+
+
+def _response_with_content(content):
+    resp = MagicMock()
+    resp.content = content
+    resp.raise_for_status = MagicMock()
+    return resp
+
+
 def test_livetiming_adapter_get():
-    with patch("livef1.adapters.livetimingf1_adapter.requests.get") as mock_get:
+    with patch("livef1.adapters.livetimingf1_adapter.http_get") as mock_get:
         mock_resp = MagicMock()
         mock_resp.content = b'{"Feeds": {}}'
         mock_resp.raise_for_status = MagicMock()
@@ -67,8 +113,42 @@ def test_livetimingF1_getdata_stream():
     assert result[0][0] == "000000000001"
 
 
+
+def _stream_response(body, chunk_size):
+    resp = MagicMock()
+    resp.raise_for_status = MagicMock()
+    resp.iter_content.side_effect = lambda chunk_size=1: (
+        body[i:i + chunk_size] for i in range(0, len(body), chunk_size)
+    )
+    resp.__enter__.return_value = resp
+    return resp
+
+
+def test_livetimingF1_iterdata_matches_getdata():
+    body = b'\xef\xbb\xbf000000000001{"k":1}\r\n000000000002"eJzz"\r\n000000000003{"k":{"a":[1,2]}}\r\n'
+    with patch("livef1.adapters.livetimingf1_adapter.http_get") as mock_get:
+        mock_get.return_value = _response_with_content(body)
+        expected = livetimingF1_getdata("https://example.com/Stream.jsonStream", stream=True)
+    # Chunks of 5 bytes split records, the BOM and the CRLF terminators.
+    with patch("livef1.adapters.livetimingf1_adapter.http_get") as mock_get:
+        mock_get.return_value = _stream_response(body, 5)
+        records = livetimingF1_iterdata("https://example.com/Stream.jsonStream", chunk_size=5)
+        assert not isinstance(records, list)
+        result = list(records)
+    assert mock_get.call_args.kwargs["stream"] is True
+    assert result == expected
+
+
+def test_livetimingF1_getdata_incremental_returns_generator():
+    with patch("livef1.adapters.livetimingf1_adapter.http_get") as mock_get:
+        mock_get.return_value = _stream_response(b'000000000001{"k":1}\r\n', 4)
+        result = livetimingF1_getdata("https://example.com/Stream.jsonStream", stream=True, incremental=True)
+        mock_get.assert_not_called()
+        assert next(result) == ("000000000001", {"k": 1})
+
+
 def test_get_table_from_wikipedia():
-    with patch("livef1.adapters.other.requests.get") as mock_get:
+    with patch("livef1.adapters.other.http_get") as mock_get:
         mock_get.return_value.content = b"<html><table class='wikitable'><caption>Test</caption><tr><th>A</th></tr><tr><td>1</td></tr></table></html>"
         with patch("livef1.adapters.other._parse_tables_from_wikipedia") as mock_parse:
             import pandas as pd
@@ -79,7 +159,7 @@ def test_get_table_from_wikipedia():
 
 
 def test_parse_schedule_from_f1com_mocked():
-    with patch("livef1.adapters.other.requests.get") as mock_get:
+    with patch("livef1.adapters.other.http_get") as mock_get:
         mock_get.return_value.content = b"<html><body><a class='group' href='/race/1'><span class='typography-module_body-xs-semibold__Fyfwn'>Bahrain</span><span class='CountryFlag-module_flag__Y-X37'><title>Flag of Bahrain</title></span></a></body></html>"
         with patch("livef1.adapters.other.BeautifulSoup") as mock_bs:
             mock_soup = MagicMock()
@@ -259,7 +259,7 @@ def test_get_meeting_get_session_and_generate_explicit(season_data, mock_season_
 
     with patch("livef1.api.download_data", return_value=season_data):
         with patch("livef1.models.season.download_data", return_value=season_data):
-            with patch("livef1.models.circuit.requests.get", side_effect=mock_circuit_get):
+            with patch("livef1.models.circuit.http_get", side_effect=mock_circuit_get):
                 with patch("livef1.api.find_most_similar_vectorized", return_value={"row_index": 0}):
                     with patch("livef1.api.print_found_model"):
                         season = get_season(2024)
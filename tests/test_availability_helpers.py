@@ -3,6 +3,8 @@
 import pytest
 
 from livef1.adapters.functions import (
+    AvailabilityIndex,
+    jolpica_find_race_for_meeting,
     livetiming_meeting_in_season_index,
     livetiming_session_in_season_index,
     jolpica_meeting_in_races,
@@ -111,3 +113,41 @@ def test_jolpica_session_dict_race():
             return {"Qualifying": {}}
 
     assert jolpica_session_available_on_race(R(), "Qualifying", "Qualifying", None) is True
+
+
+@pytest.mark.parametrize(
+    "meeting,name,type_,num",
+    [
+        ("Bahrain", "Practice 1", None, None),
+        ("bahrain ", None, "Practice", 1),
+        ("Bahrain", None, "Practice", 2),
+        ("Bahrain", None, "Race", -1),
+        ("Bahrain", "Race", "Race", None),
+        ("Bahrain", "Sprint Qualifying", None, None),
+        ("Bahrain", None, "Qualifying", -1),
+        ("Bahrain", None, None, None),
+        ("Monaco", "Race", "Race", None),
+        (None, "Race", "Race", None),
+    ],
+)
+def test_availability_index_matches_predicates(meeting, name, type_, num):
+    payload = _livetiming_payload()
+    races = [_FakeRace("Bahrain", frozenset({"FirstPractice", "Sprint", "Qualifying"})), _FakeRace("Bahrain", frozenset())]
+    index = AvailabilityIndex(payload, races)
+
+    assert index.livetiming_meeting(meeting) is livetiming_meeting_in_season_index(payload, meeting)
+    assert index.livetiming_session(meeting, name, type_, num) is livetiming_session_in_season_index(
+        payload, meeting, name, type_, num
+    )
+    assert index.jolpica_meeting(meeting) is jolpica_meeting_in_races(races, meeting)
+    assert index.jolpica_race(meeting) is jolpica_find_race_for_meeting(races, meeting)
+    assert index.jolpica_session(meeting, name, type_, num) is jolpica_session_available_on_race(
+        jolpica_find_race_for_meeting(races, meeting), name, type_, num
+    )
+
+
+def test_availability_index_empty():
+    index = AvailabilityIndex(None, None)
+    assert index.livetiming_meeting("Bahrain") is False
+    assert index.livetiming_session("Bahrain", "Race", "Race", None) is False
+    assert index.jolpica_session("Bahrain", "Race", "Race", None) is False
@@ -0,0 +1,224 @@
+"""Tests for livef1.utils.cache and the cached Livetiming adapter."""
+import hashlib
+import os
+import pytest
+from unittest.mock import patch, MagicMock
+
+from livef1.config import configure, get_setting
+from livef1.utils.cache import DiskCache, get_cache
+from livef1.adapters.livetimingf1_adapter import LivetimingF1adapters, livetimingF1_source_digest
+from livef1.utils.exceptions import CacheMissError
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    configure(cache_dir=tmp_path / "cache")
+    yield tmp_path / "cache"
+    configure(cache_dir=None, cache_size_limit=5 * 1024 ** 3, offline=False)
+
+
+def _response(content):
+    resp = MagicMock()
+    resp.content = content
+    resp.raise_for_status = MagicMock()
+    return resp
+
+
+def test_cache_disabled_by_default():
+    assert get_setting("cache_dir") is None
+    assert get_cache() is None
+
+
+def test_disk_cache_put_get(tmp_path):
+    cache = DiskCache(tmp_path, size_limit=1024)
+    url = "https://livetiming.formula1.com/static/2024/Index.json"
+    assert cache.get(url) is None
+    cache.put(url, b'{"Feeds": {}}')
+    assert cache.contains(url)
+    assert cache.get(url) == b'{"Feeds": {}}'
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path, size_limit=25)
+    cache.put("https://a", b"a" * 10)
+    cache.put("https://b", b"b" * 10)
+    # Make "a" older than "b", then read it so it becomes the most recent.
+    os.utime(cache.path("https://a"), (1, 1))
+    os.utime(cache.path("https://b"), (2, 2))
+    cache.get("https://a")
+    cache.put("https://c", b"c" * 10)
+    assert cache.contains("https://a")
+    assert not cache.contains("https://b")
+    assert cache.contains("https://c")
+    assert cache.size() <= 25
+
+
+def test_adapter_reads_from_cache(cache_dir):
+    with patch("livef1.adapters.livetimingf1_adapter.http_get") as mock_get:
+        mock_get.return_value = _response(b'{"Feeds": {}}')
+        first = LivetimingF1adapters().get("2024/x/Index.json")
+        second = LivetimingF1adapters().get("2024/x/Index.json")
+    assert first == second == '{"Feeds": {}}'
+    assert mock_get.call_count == 1
+
+
+def test_adapter_skips_cache_when_disabled_for_request(cache_dir):
+    with patch("livef1.adapters.livetimingf1_adapter.http_get") as mock_get:
+        mock_get.return_value = _response(b'{"Meetings": []}')
+        LivetimingF1adapters().get("2024/Index.json", use_cache=False)
+        LivetimingF1adapters().get("2024/Index.json", use_cache=False)
+    assert mock_get.call_count == 2
+    assert get_cache().size() == 0
+
+
+def test_adapter_offline_cache_miss_raises(cache_dir):
+    configure(offline=True)
+    with patch("livef1.adapters.livetimingf1_adapter.http_get") as mock_get:
+        with pytest.raises(CacheMissError):
+            LivetimingF1adapters().get("2024/x/CarData.z.jsonStream")
+    mock_get.assert_not_called()
+
+
+def test_adapter_offline_without_cache_raises():
+    configure(offline=True)
+    try:
+        with patch("livef1.adapters.livetimingf1_adapter.http_get") as mock_get:
+            with pytest.raises(CacheMissError):
+                LivetimingF1adapters().get("2024/x/Index.json")
+            with pytest.raises(CacheMissError):
+                list(LivetimingF1adapters().iter_lines("2024/x/CarData.z.jsonStream"))
+        mock_get.assert_not_called()
+    finally:
+        configure(offline=False)
+
+
+def test_adapter_offline_uncached_request_raises(cache_dir):
+    configure(offline=True)
+    with patch("livef1.adapters.livetimingf1_adapter.http_get") as mock_get:
+        with pytest.raises(CacheMissError):
+            LivetimingF1adapters().get("2024/Index.json", use_cache=False)
+        with pytest.raises(CacheMissError):
+            list(LivetimingF1adapters().iter_lines("2024/x/CarData.z.jsonStream", use_cache=False))
+    mock_get.assert_not_called()
+
+
+def test_adapter_iter_lines_fills_and_reads_cache(cache_dir):
+    body = b"000000000001{}\r\n000000000002{}\r\n"
+    resp = MagicMock()
+    resp.raise_for_status = MagicMock()
+    resp.iter_content.return_value = iter([body[:7], body[7:]])
+    resp.__enter__.return_value = resp
+    with patch("livef1.adapters.livetimingf1_adapter.http_get", return_value=resp) as mock_get:
+        first = list(LivetimingF1adapters().iter_lines("2024/x/CarData.z.jsonStream"))
+        second = list(LivetimingF1adapters().iter_lines("2024/x/CarData.z.jsonStream", chunk_size=3))
+    assert first == second == [b"000000000001{}", b"000000000002{}"]
+    assert mock_get.call_count == 1
+    assert get_cache().get(LivetimingF1adapters().url + "2024/x/CarData.z.jsonStream") == body
+
+
+def test_adapter_iter_lines_drops_partial_download(cache_dir):
+    resp = MagicMock()
+    resp.raise_for_status = MagicMock()
+    resp.iter_content.return_value = iter([b"000000000001{}\r\n", b"0000"])
+    resp.__enter__.return_value = resp
+    with patch("livef1.adapters.livetimingf1_adapter.http_get", return_value=resp):
+        lines = LivetimingF1adapters().iter_lines("2024/x/Position.z.jsonStream")
+        next(lines)
+        lines.close()
+    assert get_cache().size() == 0
+
+
+def test_adapter_records_body_digest_from_network_and_cache(cache_dir):
+    body = b"\xef\xbb\xbf000000000001{}\r\n000000000002{}\r\n"
+    resp = MagicMock()
+    resp.raise_for_status = MagicMock()
+    resp.iter_content.return_value = iter([body[:7], body[7:]])
+    resp.__enter__.return_value = resp
+    with patch("livef1.adapters.livetimingf1_adapter.http_get", side_effect=[resp, _response(b'{"a": 1}')]):
+        lines = LivetimingF1adapters().iter_lines("2024/digest/TimingData.jsonStream")
+        next(lines)
+        assert livetimingF1_source_digest("2024/digest/TimingData.jsonStream") is None
+        list(lines)
+        LivetimingF1adapters().get("2024/digest/DriverList.json")
+    assert livetimingF1_source_digest("2024/digest/TimingData.jsonStream") == hashlib.sha256(body).hexdigest()
+    assert livetimingF1_source_digest(LivetimingF1adapters().url + "2024/digest/DriverList.json") == hashlib.sha256(b'{"a": 1}').hexdigest()
+
+    # Cache hits record the same digests.
+    from livef1.adapters import livetimingf1_adapter
+    livetimingf1_adapter._body_digests.clear()
+    with patch("livef1.adapters.livetimingf1_adapter.http_get") as mock_get:
+        list(LivetimingF1adapters().iter_lines("2024/digest/TimingData.jsonStream", chunk_size=4))
+        LivetimingF1adapters().get("2024/digest/DriverList.json")
+    mock_get.assert_not_called()
+    assert livetimingF1_source_digest("2024/digest/TimingData.jsonStream") == hashlib.sha256(body).hexdigest()
+    assert livetimingF1_source_digest("2024/digest/DriverList.json") == hashlib.sha256(b'{"a": 1}').hexdigest()
+
+
+def test_adapter_digest_changes_with_same_size_content():
+    with patch("livef1.adapters.livetimingf1_adapter.http_get", side_effect=[_response(b'{"a": 1}'), _response(b'{"a": 2}')]):
+        LivetimingF1adapters().get("2024/digest/SessionInfo.json", use_cache=False)
+        first = livetimingF1_source_digest("2024/digest/SessionInfo.json")
+        LivetimingF1adapters().get("2024/digest/SessionInfo.json", use_cache=False)
+    assert livetimingF1_source_digest("2024/digest/SessionInfo.json") != first
+
+
+def test_metadata_cache_ttl_and_invalidation():
+    from livef1.utils.cache import MetadataCache
+
+    cache = MetadataCache()
+    calls = []
+
+    def fetch(value):
+        def inner():
+            calls.append(value)
+            return value
+        return inner
+
+    assert cache.get_or_fetch(("index", 2024), fetch("a")) == "a"
+    assert cache.get_or_fetch(("index", 2024), fetch("b")) == "a"
+    assert cache.get_or_fetch(("index", 2025), fetch("c")) == "c"
+    # Rejected values are returned but fetched again next time.
+    assert cache.get_or_fetch(("races", 2024), fetch(None), cache_if=lambda value: value is not None) is None
+    assert cache.get_or_fetch(("races", 2024), fetch("d"), cache_if=lambda value: value is not None) == "d"
+    assert calls == ["a", "c", None, "d"]
+
+    cache.invalidate(2024)
+    assert cache.get_or_fetch(("index", 2024), fetch("e")) == "e"
+    assert cache.get_or_fetch(("index", 2025), fetch("f")) == "c"
+
+    configure(metadata_ttl=0)
+    try:
+        assert cache.get_or_fetch(("index", 2025), fetch("g")) == "g"
+    finally:
+        configure(metadata_ttl=600)
+
+
+def test_season_index_fetched_once_across_entry_points():
+    import livef1.adapters.functions as adapter_functions
+    from livef1 import clear_metadata_cache
+
+    index = {"Meetings": [{"Name": "Bahrain Grand Prix", "Location": "Sakhir", "Circuit": {}, "Sessions": [{"Name": "Race", "Type": "Race"}]}]}
+    with patch("livef1.adapters.functions.livetimingF1_request", return_value=index) as request:
+        with patch("livef1.adapters.functions.fetch_jolpica_season_meetings", return_value=([], False, None)):
+            for _ in range(3):
+                season = adapter_functions.download_data(season_identifier=2024)
+            meeting = adapter_functions.download_data(2024, "Sakhir")
+            assert adapter_functions.fetch_livetiming_season_index(2024) == (index, True)
+            assert request.call_count == 1
+            # Merging adds fields to the returned meetings, not to the cached index.
+            assert "round" in season["Meetings"][0] and "round" not in index["Meetings"][0]
+            assert meeting["Location"] == "Sakhir"
+
+            clear_metadata_cache(2024)
+            adapter_functions.download_data(season_identifier=2024)
+            assert request.call_count == 2
+
+
+def test_failed_season_index_is_not_cached():
+    import livef1.adapters.functions as adapter_functions
+
+    with patch("livef1.adapters.functions.livetimingF1_request", side_effect=[ConnectionError, {"Meetings": []}]) as request:
+        assert adapter_functions.fetch_livetiming_season_index(2024) == ({}, False)
+        assert adapter_functions.fetch_livetiming_season_index(2024) == ({"Meetings": []}, True)
+        assert adapter_functions.fetch_livetiming_season_index(2024) == ({"Meetings": []}, True)
+    assert request.call_count == 2
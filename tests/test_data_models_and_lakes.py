@@ -1,4 +1,5 @@
 """Tests for livef1.data_processing.data_models and lakes."""
+import threading
 import pytest
 import pandas as pd
 from unittest.mock import MagicMock
@@ -9,6 +10,7 @@ from livef1.data_processing.data_models import (
     SilverTable,
     GoldTable,
 )
+from livef1.data_processing.fingerprint import combine_fingerprints
 from livef1.data_processing.lakes import (
     SimpleLake,
     BronzeLake,
@@ -177,6 +179,23 @@ def test_data_lake_create_bronze_table():
     assert got.table_name == "b1"
 
 
+def test_data_lake_append_bronze_table_concatenates_on_read():
+    session = MagicMock()
+    dl = DataLake(session)
+    dl.create_bronze_table("b1", raw_data=None, parsed_data=[{"rpm": 100, "timestamp": "00:00:01"}])
+    table = dl.get("bronze", "b1")
+    rows = dl.append_bronze_table("b1", [{"rpm": 200, "timestamp": "00:00:02"}])
+    dl.append_bronze_table("b1", [{"rpm": 300, "timestamp": "00:00:03"}])
+    assert rows.columns.tolist() == ["RPM", "timestamp"]
+    assert len(table._appended) == 2
+    assert table.df["RPM"].tolist() == [100, 200, 300]
+    assert table.df["timestamp"].iloc[-1] == pd.Timedelta(seconds=3)
+    assert table._appended == []
+    assert dl.metadata["b1"]["fingerprint"] is None
+    dl.append_bronze_table("b2", [{"rpm": 1}])
+    assert dl.get("bronze", "b2").df["RPM"].tolist() == [1]
+
+
 def test_data_lake__identify_table_level_from_metadata():
     session = MagicMock()
     dl = DataLake(session)
@@ -269,3 +288,129 @@ def test_data_lake__topo_sort_tables_cycle_raises():
     table_b.dependency_tables = [table_a]
     with pytest.raises(ValueError, match="Circular dependency"):
         dl._topo_sort_tables([table_a, table_b])
+
+
+def _dag_lake():
+    """Lake with silver A and B (independent) and gold G depending on both."""
+    dl = DataLake(MagicMock())
+    table_a = SilverTable("A", sources=[], data_lake=dl)
+    table_b = SilverTable("B", sources=[], data_lake=dl)
+    table_g = GoldTable("G", sources=[], data_lake=dl)
+    table_g.dependency_tables = [table_a, table_b]
+    for level, table in (("silver", table_a), ("silver", table_b), ("gold", table_g)):
+        dl.put(level, table.table_name, table)
+    return dl, [table_a, table_b, table_g]
+
+
+def test_data_lake_generate_tables_runs_independent_tables_together():
+    dl, tables = _dag_lake()
+    both_started = threading.Barrier(2, timeout=5)
+    finished = []
+
+    def generate(table):
+        if table.table_name in ("A", "B"):
+            # Only passes if A and B run at the same time.
+            both_started.wait()
+        else:
+            assert set(finished) == {"A", "B"}
+        finished.append(table.table_name)
+
+    timings = dl.generate_tables(tables, generate, max_workers=4)
+    assert finished[-1] == "G"
+    assert set(timings) == {"A", "B", "G"}
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+def test_data_lake_generate_tables_serial_keeps_dependency_order():
+    dl, tables = _dag_lake()
+    finished = []
+    timings = dl.generate_tables(list(reversed(tables)), lambda table: finished.append(table.table_name), max_workers=1)
+    assert finished.index("G") == 2
+    assert list(timings) == finished
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_data_lake_generate_tables_skips_dependents_of_failed_table(max_workers):
+    dl, tables = _dag_lake()
+    finished = []
+
+    def generate(table):
+        if table.table_name == "A":
+            raise RuntimeError("boom")
+        finished.append(table.table_name)
+
+    timings = dl.generate_tables(tables, generate, max_workers=max_workers)
+    assert finished == ["B"]
+    assert set(timings) == {"B"}
+
+
+TIMING_SOURCE = combine_fingerprints("https://example.com/TimingData.jsonStream", "digest-1")
+
+
+def _fingerprint_lake():
+    """Lake with bronze 'TimingData', silver 'S' built from it and gold 'G' built from 'S'."""
+    session = MagicMock()
+    session.check_data_name.side_effect = lambda name: name
+    dl = DataLake(session)
+    dl.create_bronze_table("TimingData", raw_data={}, parsed_data=[{"DriverNo": "1", "Position": 1}], source=TIMING_SOURCE)
+
+    def build_silver(self):
+        return self.data_lake.get("bronze", "TimingData").df.assign(Silver=True)
+
+    def build_gold(self):
+        return self.data_lake.get("silver", "S").df.assign(Gold=True)
+
+    silver = SilverTable("S", sources=["TimingData"], data_lake=dl)
+    silver.callback = build_silver
+    gold = GoldTable("G", sources=["S"], data_lake=dl)
+    gold.callback = build_gold
+    dl.put("silver", "S", silver)
+    dl.put("gold", "G", gold)
+    for table in (silver, gold):
+        table.refine_sources()
+    return dl, silver, gold
+
+
+def test_data_lake_fresh_tables_after_generation():
+    dl, silver, gold = _fingerprint_lake()
+    assert dl.fresh_tables([silver, gold]) == set()
+    silver.generate_table()
+    gold.generate_table()
+    assert dl.fresh_tables([silver, gold]) == {"S", "G"}
+
+
+def test_data_lake_bronze_reload_invalidates_dependents():
+    dl, silver, gold = _fingerprint_lake()
+    silver.generate_table()
+    gold.generate_table()
+
+    # The same source keeps the tables fresh; rows are not hashed.
+    dl.create_bronze_table("TimingData", raw_data={}, parsed_data=[{"DriverNo": "1", "Position": 1}], source=TIMING_SOURCE)
+    assert dl.fresh_tables([silver, gold]) == {"S", "G"}
+
+    changed = combine_fingerprints("https://example.com/TimingData.jsonStream", "digest-2")
+    dl.create_bronze_table("TimingData", raw_data={}, parsed_data=[{"DriverNo": "1", "Position": 2}], source=changed)
+    assert dl.fresh_tables([silver, gold]) == set()
+
+
+def test_data_lake_bronze_without_source_is_never_fresh():
+    dl, silver, gold = _fingerprint_lake()
+    silver.generate_table()
+    gold.generate_table()
+
+    dl.create_bronze_table("TimingData", raw_data={}, parsed_data=[{"DriverNo": "1", "Position": 1}])
+    assert dl.fresh_tables([silver, gold]) == set()
+
+
+def test_data_lake_changed_callback_invalidates_only_its_subgraph():
+    dl, silver, gold = _fingerprint_lake()
+    silver.generate_table()
+    gold.generate_table()
+
+    new_gold = GoldTable("G", sources=["S"], data_lake=dl)
+    new_gold.callback = lambda self: self.data_lake.get("silver", "S").df.assign(Gold=False)
+    dl.put("gold", "G", new_gold)
+    new_gold.refine_sources()
+    # The re-registered table keeps the previous data until it is rebuilt.
+    assert new_gold.has_data()
+    assert dl.fresh_tables([silver, new_gold]) == {"S"}
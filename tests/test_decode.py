@@ -0,0 +1,82 @@
+"""Tests for livef1.utils.decode (batched decoding of compressed payloads)."""
+import base64
+import json
+import zlib
+
+import pytest
+
+from livef1.config import configure
+from livef1.data_processing.parse_functions import parse_car_data_z, parse_position_z
+from livef1.utils.decode import _decode_chunk, decode_zipped_records, shutdown_decode_pool
+from livef1.utils.pool import get_process_pool
+
+
+def _zip(obj):
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    raw = compressor.compress(json.dumps(obj).encode()) + compressor.flush()
+    return base64.b64encode(raw).decode()
+
+
+def _car_data_records(n):
+    return [
+        (
+            f"00:00:{i:06d}",
+            _zip({"Entries": [{"Utc": f"2024-03-02T15:00:{i % 60:02d}Z",
+                               "Cars": {"1": {"Channels": {"0": 11000 + i, "2": 300, "3": 7, "4": 100, "5": 0, "45": 8}}}}]}),
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def decode_settings():
+    yield
+    configure(parallel_decode=False, decode_workers=None, decode_chunk_size=512)
+    shutdown_decode_pool()
+
+
+def test_decode_serial_when_disabled(decode_settings):
+    configure(parallel_decode=False)
+    records = _car_data_records(3)
+    result = list(decode_zipped_records(records))
+    assert [ts for ts, _ in result] == [ts for ts, _ in records]
+    assert result[2][1]["Entries"][0]["Cars"]["1"]["Channels"]["0"] == 11002
+
+
+def test_decode_parallel_preserves_order(decode_settings):
+    configure(parallel_decode=True, decode_workers=2, decode_chunk_size=7)
+    records = _car_data_records(60)
+    parallel = list(decode_zipped_records(iter(records)))
+    configure(parallel_decode=False)
+    serial = list(decode_zipped_records(records))
+    assert parallel == serial
+
+
+def test_parse_car_data_z_parallel_matches_serial(decode_settings):
+    records = _car_data_records(30)
+    configure(parallel_decode=False)
+    serial = list(parse_car_data_z(records, 9465))
+    configure(parallel_decode=True, decode_workers=2, decode_chunk_size=4)
+    parallel = list(parse_car_data_z(records, 9465))
+    assert parallel == serial
+    assert parallel[0]["rpm"] == 11000
+
+
+def test_parse_position_z_small_input_stays_serial(decode_settings):
+    configure(parallel_decode=True, decode_workers=2, decode_chunk_size=512)
+    payload = _zip({"Position": [{"Timestamp": "2024-03-02T15:00:00Z",
+                                  "Entries": {"1": {"Status": "OnTrack", "X": 1, "Y": 2, "Z": 3}}}]})
+    result = list(parse_position_z([("00:00:01.000", payload)], 9465))
+    assert result[0]["DriverNo"] == "1"
+    assert result[0]["X"] == 1
+
+
+def test_process_pools_are_kept_per_worker_count(decode_settings):
+    payload = _zip({"Entries": []})
+    two = get_process_pool(2)
+    pending = two.submit(_decode_chunk, [payload])
+    # Asking for another worker count must not cancel work on the first pool.
+    three = get_process_pool(3)
+    assert three is not two
+    assert get_process_pool(2) is two
+    assert pending.result(timeout=120) == [{"Entries": []}]
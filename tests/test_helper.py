@@ -11,6 +11,7 @@ from livef1.utils.helper import (
     parse,
     parse_hash,
     parse_helper_for_nested_dict,
+    flatten_nested_dict,
     identifer_text_format,
     find_most_similar_vectorized,
     string_match_ratio,
@@ -96,6 +97,30 @@ def test_parse_helper_for_nested_dict_list():
     assert result["sectors_2_t"] == 2
 
 
+
+def test_parse_helper_for_nested_dict_does_not_modify_record():
+    record = {"SessionKey": 1}
+    result = parse_helper_for_nested_dict({"a": {"b": 2}}, record)
+    assert record == {"SessionKey": 1}
+    assert result == {"SessionKey": 1, "a_b": 2}
+
+
+def test_flatten_nested_dict_deleted_key_and_order():
+    info = {
+        "Sectors": [{"Value": "30.1", "Segments": [{"Status": 2048}]}, {"Value": "31.0"}],
+        "Speeds": {"I1": {"Value": "300"}, "ST": {"Value": "320"}},
+        "Line": 3,
+        "_deleted": ["Sectors"],
+    }
+    record = flatten_nested_dict(info, {"DriverNo": "1", "Line": 1}, deleted_key="_deleted")
+    assert list(record) == [
+        "DriverNo", "Line", "Sectors_1_Value", "Sectors_1_Segments", "Sectors_2_Value",
+        "Speeds_I1_Value", "Speeds_ST_Value", "_deleted",
+    ]
+    assert record["Line"] == 3
+    assert record["Sectors_1_Segments"] == [{"Status": 2048}]
+    assert record["_deleted"] == ["Sectors"]
+
 def test_identifer_text_format():
     result = identifer_text_format("Formula 1 Bahrain Grand Prix")
     assert "formula" not in result
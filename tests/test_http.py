@@ -0,0 +1,54 @@
+"""Tests for livef1.utils.http (shared pooled HTTP session)."""
+import pytest
+from unittest.mock import patch, MagicMock
+
+from livef1.config import configure
+from livef1.utils import http
+from livef1.utils.http import get_http_session, reset_http_session, RETRY_STATUS_CODES
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    reset_http_session()
+    yield
+    configure(http_pool_size=10, http_retries=3, http_backoff_factor=0.5, http_timeout=300)
+
+
+def test_session_is_shared():
+    assert get_http_session() is get_http_session()
+
+
+def test_session_mounts_pooled_adapter_with_retries():
+    adapter = get_http_session().get_adapter("https://livetiming.formula1.com")
+    assert adapter._pool_maxsize == 10
+    assert adapter.max_retries.total == 3
+    assert set(RETRY_STATUS_CODES) <= set(adapter.max_retries.status_forcelist)
+
+
+def test_configure_rebuilds_session():
+    first = get_http_session()
+    configure(http_pool_size=4, http_retries=1)
+    second = get_http_session()
+    assert first is not second
+    adapter = second.get_adapter("https://livetiming.formula1.com")
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 1
+
+
+def test_http_get_uses_default_timeout():
+    configure(http_timeout=12)
+    with patch.object(http, "get_http_session") as mock_session:
+        http.http_get("https://example.com")
+    mock_session.return_value.get.assert_called_once_with(
+        "https://example.com", headers=None, timeout=12
+    )
+
+
+def test_get_circuit_keys_downloads_once():
+    from livef1.utils.helper import get_circuit_keys
+
+    response = MagicMock(status_code=200, text="circuitKey,name\n3,Sakhir\n")
+    with patch("livef1.utils.helper.http_get", return_value=response) as mock_get:
+        keys = get_circuit_keys()
+    assert mock_get.call_count == 1
+    assert keys.loc[0, "name"] == "Sakhir"
@@ -134,7 +134,7 @@ def test_get_season_meeting_session_and_generate_with_dummy_data(
     """Use dummy inputs to get season, meeting, session and run generate(silver=True)."""
     with patch("livef1.api.download_data", return_value=season_data):
         with patch("livef1.models.season.download_data", return_value=season_data):
-            with patch("livef1.models.circuit.requests.get", side_effect=mock_circuit_requests):
+            with patch("livef1.models.circuit.http_get", side_effect=mock_circuit_requests):
                 with patch("livef1.api.find_most_similar_vectorized", return_value={"row_index": 0}):
                     with patch("livef1.api.print_found_model"):
                         season = get_season(2024)
@@ -0,0 +1,174 @@
+"""Tests for livef1.data_processing.live."""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from livef1.adapters.realtime_client import RealF1Client
+from livef1.data_processing.etl import function_map
+from livef1.data_processing.live import LiveSessionLake
+from livef1.models.session import Session
+from livef1.utils.constants import LIVE_TOPICS
+
+T0 = pd.Timestamp("2024-03-02 15:00:00")
+
+
+def _iso(seconds):
+    return (T0 + pd.to_timedelta(seconds, unit="s")).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _live_session():
+    with patch("livef1.models.session.helper.build_session_endpoint", return_value="https://example.com/session"):
+        session = Session(key=9465, name="Race", path="x")
+    session.topic_names_info = {}
+    session.meeting = SimpleNamespace(circuit=SimpleNamespace())
+
+    @session.create_silver_table("laps", ["TimingData"], include_session=True)
+    def laps(_session, TimingData):
+        ends = TimingData.dropna(subset=["NumberOfLaps"])
+        ends = pd.DataFrame({
+            "DriverNo": ends["DriverNo"].astype(str).to_numpy(),
+            "LapNo": ends["NumberOfLaps"].astype(int).to_numpy(),
+            "LapEndDate": (_session.first_datetime + ends["timestamp"]).to_numpy(),
+        })
+        starts = ends.groupby("DriverNo")["LapEndDate"].shift().fillna(_session.first_datetime)
+        return ends.assign(LapStartDate=starts, LapTime=ends["LapEndDate"] - starts).drop(columns="LapEndDate")
+
+    return session
+
+
+def _samples(start, stop, drivers=("1", "2"), hz=4):
+    rng = np.random.default_rng(int(start))
+    cars, positions = [], []
+    for t in np.arange(start, stop, 1 / hz):
+        for driver in drivers:
+            cars.append({
+                "SessionKey": None, "timestamp": _iso(t), "Utc": _iso(t), "DriverNo": driver,
+                "RPM": rng.uniform(9000, 12000), "Speed": rng.uniform(80, 330), "GearNo": 5,
+                "Throttle": 100.0, "Brake": 0, "DRS": 0,
+            })
+            positions.append({
+                "SessionKey": None, "timestamp": _iso(t), "Utc": _iso(t + 0.1), "DriverNo": driver,
+                "Status": "OnTrack", "X": np.cos(t), "Y": np.sin(t), "Z": 0.0,
+            })
+    return {"CarData.z": cars, "Position.z": positions}
+
+
+def _lap_completed(seconds, lap_no, drivers=("1", "2")):
+    return {"TimingData": [
+        {"SessionKey": None, "timestamp": _iso(seconds), "DriverNo": driver, "NumberOfLaps": lap_no, "Position": driver}
+        for driver in drivers
+    ]}
+
+
+def test_live_lake_extends_telemetry_with_new_laps_only():
+    session = _live_session()
+    live = LiveSessionLake(session, batch_size=10 ** 9, batch_interval=10 ** 9)
+
+    live.add_records({
+        "TrackStatus": [{"SessionKey": None, "timestamp": _iso(0), "Status": "1", "Message": "AllClear"}],
+        "TyreStintSeries": [{"session_key": None, "timestamp": _iso(0), "DriverNo": "1", "PitCount": "0", "Compound": "SOFT", "New": "true", "TotalLaps": 0}],
+        **_samples(0, 35),
+    })
+    live.add_records(_lap_completed(30, 1))
+    assert live.flush()["TimingData"] == 2
+
+    assert session.first_datetime == T0
+    assert session.laps["LapNo"].tolist() == [1, 1]
+    first = session.carTelemetry.copy()
+    assert set(first["LapNo"]) == {1}
+    assert first["Utc"].max() < T0 + pd.Timedelta(seconds=30)
+    assert (first["SessionKey"] == 9465).all()
+
+    live.add_records(_samples(35, 65))
+    live.add_records(_lap_completed(60, 2))
+    live.flush()
+
+    telemetry = session.carTelemetry
+    assert set(telemetry["LapNo"]) == {1, 2}
+    # Rows of the first lap are kept as they were, the second lap is appended.
+    pd.testing.assert_frame_equal(telemetry.iloc[:len(first)], first)
+    assert telemetry.iloc[len(first):]["Utc"].min() >= T0 + pd.Timedelta(seconds=30)
+    # Samples of processed laps are dropped from the live buffer.
+    assert live._samples["CarData.z"][0]["Utc"].min() >= T0 + pd.Timedelta(seconds=60)
+    # Bronze tables hold every record received.
+    assert len(session.get_data("CarData.z")) == 2 * 4 * 65
+    assert session.data_lake.metadata["CarData.z"]["fingerprint"] is None
+
+
+def test_live_lake_batches_by_size_and_attaches_to_client():
+    session = _live_session()
+    live = LiveSessionLake(session, batch_size=3, batch_interval=10 ** 9)
+    client = RealF1Client(topics=["SessionInfo"])
+    assert live.attach(client) is client
+    assert client.topics == ["SessionInfo"] + LIVE_TOPICS
+    assert "livef1 live lake" in client._handlers
+
+    async def feed():
+        await live.ingest(_lap_completed(30, 1))
+        assert live.batches == 0
+        await live.ingest(_lap_completed(31, 1, drivers=("3",)))
+
+    asyncio.run(feed())
+    assert live.batches == 1
+    assert session.get_data("TimingData")["DriverNo"].astype(str).tolist() == ["1", "2", "3"]
+
+
+def _parsed(topic, messages):
+    """Parse raw live messages like the realtime client does."""
+    return list(function_map[topic]([(_iso(seconds), data) for seconds, data in messages], None))
+
+
+def _live_lap(start, lap_no, drivers):
+    messages = []
+    for offset, driver in enumerate(drivers):
+        t = start + offset
+        for sector, seconds in enumerate((30.1, 31.2, 29.3)):
+            t += seconds
+            messages.append((t, {"Lines": {driver: {"Sectors": {str(sector): {"Value": f"{seconds:.3f}"}}}}}))
+        messages.append((t, {"Lines": {driver: {
+            "NumberOfLaps": lap_no, "LastLapTime": {"Value": "1:30.600"}, "Position": str(offset + 1),
+        }}}))
+    return messages
+
+
+def test_live_lake_builds_laps_with_the_real_builder():
+    with patch("livef1.models.session.helper.build_session_endpoint", return_value="https://example.com/session"):
+        session = Session(key=9465, name="Race", type="Race", path="x")
+    session.topic_names_info = {}
+    session.meeting = SimpleNamespace(circuit=SimpleNamespace())
+    session.drivers = {}
+    live = LiveSessionLake(session, batch_size=10 ** 9, batch_interval=10 ** 9)
+    drivers = ("1", "44")
+
+    live.add_records({
+        "TrackStatus": _parsed("TrackStatus", [(0, {"Status": "1", "Message": "AllClear"})]),
+        "TyreStintSeries": _parsed("TyreStintSeries", [(0, {"Stints": {
+            "1": {"0": {"Compound": "SOFT", "New": "true", "TotalLaps": 0}},
+            "44": {"0": {"Compound": "MEDIUM", "New": "true", "TotalLaps": 0}},
+        }})]),
+        "RaceControlMessages": _parsed("RaceControlMessages", [(0, {"Messages": [
+            {"Utc": _iso(0), "Category": "Flag", "Flag": "GREEN", "Message": "GREEN LIGHT - PIT EXIT OPEN"},
+        ]})]),
+        # Live TimingData only carries the fields that changed.
+        "TimingData": _parsed("TimingData", _live_lap(0, 1, drivers)),
+    })
+    live.flush()
+    assert session.laps["LapNo"].tolist() == [1, 1]
+
+    live.add_records({"TimingData": _parsed("TimingData", _live_lap(92, 2, drivers))})
+    with patch.object(session.data_lake, "persist_table") as persist:
+        live.flush()
+    persist.assert_not_called()
+
+    laps = session.laps.sort_values(["DriverNo", "LapNo"])
+    assert laps["DriverNo"].astype(str).tolist() == ["1", "1", "44", "44"]
+    assert laps["LapNo"].tolist() == [1, 2, 1, 2]
+    assert (laps["Sector2_Time"] == pd.Timedelta(seconds=31.2)).all()
+    assert laps["LapTime"].iloc[1] == pd.Timedelta(seconds=90.6)
+    assert laps["Compound"].tolist() == ["SOFT", "SOFT", "MEDIUM", "MEDIUM"]
+    assert laps["LapStartDate"].iloc[1] == T0 + pd.Timedelta(seconds=90.6)
+    # Live laps are kept in memory only, without a fingerprint.
+    assert session.data_lake.metadata["laps"]["fingerprint"] is None
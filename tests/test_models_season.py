@@ -1,5 +1,6 @@
 """Tests for livef1.models.season.Season."""
-from unittest.mock import patch
+import time
+from unittest.mock import MagicMock, patch
 
 from livef1.models.season import Season
 from livef1.utils.helper import json_parser_for_objects
@@ -7,8 +8,8 @@ from livef1.utils.helper import json_parser_for_objects
 
 def test_season_load_skips_jolpica_when_unavailable(season_data):
     """Livetiming-only seasons must not call Jolpica during load()."""
-    with patch("livef1.models.season.jolpica_client") as mock_client:
-        with patch("livef1.models.circuit.requests.get") as mock_get:
+    with patch("livef1.adapters.functions.jolpica_client") as mock_client:
+        with patch("livef1.models.circuit.http_get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {
                 "Sakhir": {"start_coordinates": [100.0, 50.0], "start_direction": [1.0, 1.0]}
@@ -21,3 +22,29 @@ def test_season_load_skips_jolpica_when_unavailable(season_data):
     assert season.constructors == {}
     assert season.is_jolpica_available is False
     assert season.is_livetiming_available is True
+
+
+def test_season_load_fetches_jolpica_queries_concurrently(season_data):
+    """The four Jolpica queries overlap and a failed one only skips its own loader."""
+    def fetch(year, query):
+        time.sleep(0.3)
+        if query == "get_driver_standings":
+            raise RuntimeError("down")
+        response = MagicMock(drivers=[], constructors=[])
+        response.standings_lists[0].to_dict.return_value = {"ConstructorStandings": []}
+        return response
+
+    season_data = {**season_data, "is_jolpica_available": True}
+    with patch("livef1.models.season.fetch_jolpica_season_data", side_effect=fetch) as mock_fetch:
+        with patch("livef1.models.circuit.http_get") as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.json.return_value = {}
+            start = time.perf_counter()
+            season = Season(**json_parser_for_objects(season_data))
+            elapsed = time.perf_counter() - start
+
+    assert mock_fetch.call_count == 4
+    assert elapsed < 0.9
+    assert season.drivers == {}
+    assert season.constructorStandings == []
+    assert not hasattr(season, "driverStandings")
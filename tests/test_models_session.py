@@ -93,3 +93,171 @@ def test_session_create_silver_table_decorator():
 
     assert "CustomLaps" in session.data_lake.metadata
     assert session.data_lake.get("silver", "CustomLaps") is not None
+
+
+def _slow_load_single_data(dataName, session, stream):
+    import time
+    time.sleep(0.2)
+    return dataName, {}, [{"SessionKey": 9465, "Topic": dataName}]
+
+
+def test_session_load_data_parallel_fetches_concurrently():
+    from time import time
+    with patch("livef1.models.session.helper.build_session_endpoint", return_value="https://example.com/session"):
+        session = Session(key=9465, name="Race", path="x")
+    session.topic_names_info = {
+        name: {"key": name, "default_is_stream": True}
+        for name in ("TimingData", "CarData.z", "Position.z", "SessionStatus")
+    }
+    names = [(name, True) for name in session.topic_names_info]
+    with patch("livef1.models.session.load_single_data", side_effect=_slow_load_single_data):
+        start = time()
+        result = session.load_data(names, parallel=True)
+        elapsed = time() - start
+    assert set(result) == set(session.topic_names_info)
+    assert all(name in session.data_lake.metadata for name in session.topic_names_info)
+    assert result["Position.z"].df["Topic"].iloc[0] == "Position.z"
+    assert elapsed < 0.6
+
+
+def test_session_load_data_parallel_inside_running_loop():
+    import asyncio
+    with patch("livef1.models.session.helper.build_session_endpoint", return_value="https://example.com/session"):
+        session = Session(key=9465, name="Race", path="x")
+    session.topic_names_info = {
+        name: {"key": name, "default_is_stream": True} for name in ("TimingData", "CarData.z")
+    }
+    names = [(name, True) for name in session.topic_names_info]
+
+    async def notebook_cell():
+        return session.load_data(names, parallel=True)
+
+    with patch("livef1.models.session.load_single_data", side_effect=_slow_load_single_data):
+        result = asyncio.run(notebook_cell())
+    assert set(result) == {"TimingData", "CarData.z"}
+
+
+def test_session_load_data_parallel_propagates_errors():
+    with patch("livef1.models.session.helper.build_session_endpoint", return_value="https://example.com/session"):
+        session = Session(key=9465, name="Race", path="x")
+    session.topic_names_info = {
+        name: {"key": name, "default_is_stream": True} for name in ("TimingData", "CarData.z")
+    }
+
+    def failing(dataName, session, stream):
+        if dataName == "CarData.z":
+            raise RuntimeError("download failed")
+        return _slow_load_single_data(dataName, session, stream)
+
+    with patch("livef1.models.session.load_single_data", side_effect=failing):
+        with pytest.raises(RuntimeError, match="download failed"):
+            session.load_data([("TimingData", True), ("CarData.z", True)], parallel=True)
+
+
+def test_load_single_data_incremental_does_not_keep_raw():
+    from livef1.config import configure
+    from livef1.models.session import load_single_data
+    with patch("livef1.models.session.helper.build_session_endpoint", return_value="https://example.com/session/"):
+        session = Session(key=9465, name="Race", path="x")
+    session.topic_names_info = {"Heartbeat": {"StreamPath": "Heartbeat.jsonStream", "KeyFramePath": "Heartbeat.json"}}
+    records = iter([("00:00:01.000", {"Utc": "2024-03-02T15:00:00Z"})])
+    configure(incremental_parse=True)
+    try:
+        with patch("livef1.models.session.livetimingF1_getdata", return_value=records) as mock_getdata:
+            name, data, parsed = load_single_data("Heartbeat", session, True)
+    finally:
+        configure(incremental_parse=False)
+    assert mock_getdata.call_args.kwargs["incremental"] is True
+    assert data is None
+    assert len(parsed) == 1
+
+
+def test_session_silver_table_generated_on_first_access():
+    with patch("livef1.models.session.helper.build_session_endpoint", return_value="https://example.com/session"):
+        session = Session(key=9465, name="Race", path="x")
+    session.is_livetiming_available = True
+    session.topic_names_info = {"RaceControlMessages": {"key": "Race_Control_Messages", "default_is_stream": True}}
+    rcm = [{
+        "SessionKey": 9465, "timestamp": "01:30:00", "Utc": "2024-03-02T16:30:00Z", "Category": "Flag",
+        "Scope": "Track", "Status": "1", "Flag": "YELLOW", "Message": "YELLOW FLAG", "Lap": 2,
+    }]
+    loaded = []
+
+    def load(name, session, stream):
+        loaded.append(name)
+        return name, {}, rcm
+
+    with patch("livef1.models.session.load_single_data", side_effect=load):
+        messages = session.raceControlMessages
+        assert session.raceControlMessages is messages
+    # Only the table's own topic is loaded; no telemetry.
+    assert loaded == ["RaceControlMessages"]
+    assert messages["Message"].tolist() == ["YELLOW FLAG"]
+    assert "laps" not in session.__dict__
+
+
+def test_session_failed_lazy_table_is_not_rebuilt_on_every_access():
+    with patch("livef1.models.session.helper.build_session_endpoint", return_value="https://example.com/session"):
+        session = Session(key=9465, name="Race", path="x")
+    session.is_livetiming_available = True
+
+    with patch.object(Session, "_generate") as mock_generate:
+        assert session.raceControlMessages is None
+        assert session.raceControlMessages is None
+        assert mock_generate.call_count == 1
+
+        # Errors such as a dropped connection are retried on the next access.
+        mock_generate.side_effect = ConnectionError("offline")
+        with pytest.raises(ConnectionError):
+            session.laps
+        with pytest.raises(ConnectionError):
+            session.laps
+        assert mock_generate.call_count == 3
+
+    # An explicit load forgets earlier failures.
+    session.topic_names_info = {}
+    with patch.object(Session, "_generate") as mock_generate, \
+            patch("livef1.models.session.load_single_data", return_value=("x", {}, [])):
+        session.load_data([])
+        assert session.raceControlMessages is None
+        assert mock_generate.call_count == 1
+
+
+def test_session_generate_skips_downloads_when_tables_are_fresh():
+    from livef1.data_processing.fingerprint import combine_fingerprints
+    with patch("livef1.models.session.helper.build_session_endpoint", return_value="https://example.com/session/"):
+        session = Session(key=9465, name="Race", path="x")
+    session.is_livetiming_available = True
+    session.topic_names_info = {"RaceControlMessages": {
+        "key": "Race_Control_Messages", "default_is_stream": True,
+        "StreamPath": "RaceControlMessages.jsonStream", "KeyFramePath": "RaceControlMessages.json",
+    }}
+    rcm = [{
+        "SessionKey": 9465, "timestamp": "01:30:00", "Utc": "2024-03-02T16:30:00Z", "Category": "Flag",
+        "Scope": "Track", "Status": "1", "Flag": "YELLOW", "Message": "YELLOW FLAG", "Lap": 2,
+    }]
+
+    def load_circuit():
+        session.data_lake.create_bronze_table("track_regions", raw_data={}, parsed_data=pd.DataFrame(), source="circuit")
+
+    with patch.object(Session, "_load_circuit_data", side_effect=load_circuit) as mock_circuit, \
+            patch.object(Session, "load_session_results"), \
+            patch("livef1.models.session.load_single_data", return_value=("RaceControlMessages", {}, rcm)) as mock_load, \
+            patch("livef1.models.session.livetimingF1_source_digest", return_value="abc123"):
+        session.generate(tables=["raceControlMessages"])
+        session.generate(tables=["raceControlMessages"])
+    assert mock_circuit.call_count == 1
+    assert mock_load.call_count == 1
+    # Topics are fingerprinted from their URL and body digest, not their rows.
+    url = "https://example.com/session/RaceControlMessages.jsonStream"
+    assert session.data_lake.metadata["RaceControlMessages"]["fingerprint"] == combine_fingerprints(url, "abc123")
+    assert session.raceControlMessages["Message"].tolist() == ["YELLOW FLAG"]
+
+
+def test_session_first_datetime_computed_once_on_access():
+    with patch("livef1.models.session.helper.build_session_endpoint", return_value="https://example.com/session"):
+        session = Session(key=9465, name="Race", path="x")
+    with patch.object(Session, "_get_first_datetime", return_value=pd.Timestamp("2024-03-02 15:00")) as compute:
+        assert session.first_datetime == pd.Timestamp("2024-03-02 15:00")
+        assert session.first_datetime == pd.Timestamp("2024-03-02 15:00")
+    compute.assert_called_once()
@@ -2,6 +2,7 @@
 import pytest
 import base64
 import zlib
+import pandas as pd
 from livef1.data_processing.parse_functions import (
     parse_tyre_stint_series,
     parse_driver_race_info,
@@ -21,6 +22,10 @@ from livef1.data_processing.parse_functions import (
     parse_pit_lane_time,
     parse_pit_stop_series,
     parse_basic,
+    parse_car_data_z,
+    parse_car_data_z_columnar,
+    parse_position_z,
+    parse_position_z_columnar,
 )
 
 
@@ -100,6 +105,18 @@ def test_parse_timing_data_withheld():
     assert records[0]["DriverNo"] == "2"
 
 
+
+def test_parse_timing_data_nested_fields():
+    data = [("0", {"Lines": {"1": {
+        "Sectors": {"0": {"Value": "30.1"}},
+        "BestLapTime": {"Value": "1:32.1", "Lap": 5},
+        "_deleted": ["Sectors"],
+    }}})]
+    record = list(parse_timing_data(data, SESSION_KEY))[0]
+    assert record["Sectors_0_Value"] == "30.1"
+    assert record["BestLapTime_Lap"] == 5
+    assert record["_deleted"] == ["Sectors"]
+
 def test_parse_lap_series_list():
     data = [("0", {"1": {"LapPosition": [1, 2, 3]}})]
     records = list(parse_lap_series(data, SESSION_KEY))
@@ -209,3 +226,85 @@ def test_parse_basic():
     assert len(records) == 1
     assert records[0]["timestamp"] == "0"
     assert records[0]["key"] == "value"
+
+
+def _zip(obj):
+    import json
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    raw = compressor.compress(json.dumps(obj).encode()) + compressor.flush()
+    return base64.b64encode(raw).decode()
+
+
+CAR_DATA_Z = [
+    ("00:00:01.000", _zip({"Entries": [
+        {"Utc": "2024-03-02T15:00:01.1234567Z", "Cars": {
+            "1": {"Channels": {"0": 11000, "2": 300, "3": 7, "4": 100, "5": 0, "45": 12}},
+            "44": {"Channels": {"0": 10500, "2": 295, "3": 6, "4": 98, "5": 0, "45": 8}},
+        }},
+        {"Utc": "2024-03-02T15:00:01.3Z", "Cars": {
+            "1": {"Channels": {"0": 11100, "2": 301, "3": 7, "4": 100, "5": 0, "45": 12}},
+        }},
+    ]})),
+    ("00:00:02.000", _zip({"Entries": [
+        {"Utc": "2024-03-02T15:00:02Z", "Cars": {
+            "44": {"Channels": {"0": 9000, "2": 250, "3": 5, "4": 0, "5": 1, "45": 0}},
+        }},
+    ]})),
+]
+
+POSITION_Z = [
+    ("00:00:01.000", _zip({"Position": [
+        {"Timestamp": "2024-03-02T15:00:01.5Z", "Entries": {
+            "1": {"Status": "OnTrack", "X": 100, "Y": -200, "Z": 3},
+            "44": {"Status": "OffTrack", "X": 110, "Y": -190, "Z": 4},
+        }},
+    ]})),
+]
+
+
+def test_parse_car_data_z_columnar_matches_records():
+    from livef1.data_processing.data_models import BronzeTable
+    from livef1.utils.helper import to_datetime
+    records = BronzeTable("CarData.z", data=None, parsed_data=list(parse_car_data_z(CAR_DATA_Z, SESSION_KEY))).df
+    columnar = parse_car_data_z_columnar(CAR_DATA_Z, SESSION_KEY)
+    assert columnar["speed"].dtype == "float32"
+    assert columnar["n_gear"].dtype == "uint8"
+    assert columnar["Utc"].dtype == "datetime64[ns]"
+    df = BronzeTable("CarData.z", data=None, parsed_data=columnar).df
+    assert list(df.columns) == list(records.columns)
+    assert str(df["DriverNo"].dtype) == "category"
+    pd.testing.assert_frame_equal(df.drop(columns="Utc"), records.drop(columns="Utc"), check_categorical=False)
+    assert (to_datetime(df["Utc"]).values == to_datetime(records["Utc"]).values).all()
+
+
+def test_parse_car_data_z_columnar_keeps_missing_channels_missing():
+    from livef1.data_processing.data_models import BronzeTable
+    data = [("00:00:01.000", _zip({"Entries": [
+        {"Utc": "2024-03-02T15:00:01Z", "Cars": {
+            "1": {"Channels": {"0": 11000, "2": 300, "3": 7, "4": 100, "5": 0, "45": 12}},
+            # No gear, DRS or throttle.
+            "44": {"Channels": {"0": 10500, "2": 295, "5": 1}},
+        }},
+    ]}))]
+    records = BronzeTable("CarData.z", data=None, parsed_data=list(parse_car_data_z(data, SESSION_KEY))).df
+    df = BronzeTable("CarData.z", data=None, parsed_data=parse_car_data_z_columnar(data, SESSION_KEY)).df
+    assert list(df.columns) == list(records.columns)
+    pd.testing.assert_frame_equal(df.drop(columns="Utc"), records.drop(columns="Utc"), check_categorical=False)
+    assert str(df["GearNo"].dtype) == "UInt8"
+    assert df["GearNo"].isna().tolist() == [False, True]
+    assert df["DRS"].isna().tolist() == [False, True]
+    assert df["Throttle"].isna().tolist() == [False, True]
+
+
+def test_parse_position_z_columnar_matches_records():
+    from livef1.data_processing.data_models import BronzeTable
+    records = BronzeTable("Position.z", data=None, parsed_data=list(parse_position_z(POSITION_Z, SESSION_KEY))).df
+    df = BronzeTable("Position.z", data=None, parsed_data=parse_position_z_columnar(POSITION_Z, SESSION_KEY)).df
+    assert list(df.columns) == list(records.columns)
+    pd.testing.assert_frame_equal(df.drop(columns="Utc"), records.drop(columns="Utc"), check_categorical=False)
+    assert df["Status"].tolist() == ["OnTrack", "OffTrack"]
+
+
+def test_parse_car_data_z_columnar_empty():
+    columns = parse_car_data_z_columnar([], SESSION_KEY)
+    assert len(pd.DataFrame(columns)) == 0
@@ -1,7 +1,12 @@
 """Tests for livef1.adapters.realtime_client.RealF1Client."""
+import asyncio
+import json
+import time
+
 import pytest
 from unittest.mock import MagicMock, patch
 from livef1.adapters.realtime_client import RealF1Client
+from livef1.adapters.realtime_queue import RealtimeQueue
 from livef1.utils.exceptions import ArgumentError
 
 
@@ -31,3 +36,306 @@ def test_real_f1_client_callback_registration():
 
     assert "process_telemetry" in client._handlers
     assert callable(client._handlers["process_telemetry"])
+
+
+def _rcm_frame(*texts):
+    return {"M": [
+        {"H": "Streaming", "M": "feed", "A": ["RaceControlMessages", {"Messages": [{"Message": text}]}, "2024-03-02T15:00:00.000Z"]}
+        for text in texts
+    ]}
+
+
+def test_real_f1_client_queues_frames_per_message():
+    client = RealF1Client(topics=["RaceControlMessages"], workers=2)
+    received = []
+
+    @client.callback("collect")
+    async def collect(records):
+        received.extend(record["Message"] for record in records["RaceControlMessages"])
+
+    async def run():
+        client.ingest_queue.start()
+        await client._receive(**_rcm_frame("A", "B"))
+        await client._receive(**_rcm_frame("C"))
+        await client._receive(**{"C": "heartbeat", "M": []})
+        await client.ingest_queue.close()
+
+    asyncio.run(run())
+    assert received == ["A", "B", "C"]
+    metrics = client.ingest_queue.metrics()
+    assert metrics["enqueued"] == metrics["processed"] == 3
+    assert metrics["depth"] == 0
+
+
+def test_real_f1_client_handles_snapshot_before_later_updates():
+    client = RealF1Client(topics=["RaceControlMessages", "SessionInfo"], workers=3)
+    received = []
+
+    @client.callback("collect")
+    async def collect(records):
+        for record in records.get("RaceControlMessages", []):
+            if record["Message"] == "snapshot":
+                # Give the other workers time to pick up the update.
+                await asyncio.sleep(0.05)
+            received.append(record["Message"])
+
+    async def run():
+        client.ingest_queue.start()
+        await client._receive(R={
+            "RaceControlMessages": {"Messages": [{"Message": "snapshot"}]},
+            "SessionInfo": {"Name": "Race"},
+        })
+        await client._receive(**_rcm_frame("update"))
+        await client.ingest_queue.close()
+
+    asyncio.run(run())
+    assert received == ["snapshot", "update"]
+    assert client.ingest_queue.metrics()["processed"] == 3
+
+
+def test_real_f1_client_invalid_overflow():
+    with pytest.raises(ArgumentError, match="overflow"):
+        RealF1Client(topics=["CarData.z"], overflow="grow")
+
+
+def _fill(queue, messages):
+    async def run():
+        for key, message in messages:
+            await queue.put(message, key)
+    return run()
+
+
+@pytest.mark.parametrize("overflow, expected", [
+    ("drop-oldest", ["car 2", "rcm 1", "car 3"]),
+    ("coalesce", ["car 1", "rcm 1", "car 3"]),
+])
+def test_realtime_queue_overflow_policies(overflow, expected):
+    handled = []
+
+    async def handle(message):
+        handled.append(message)
+
+    queue = RealtimeQueue(handle, maxsize=3, overflow=overflow, workers=1)
+
+    async def run():
+        # Workers are not started yet, so the queue fills up.
+        await _fill(queue, [("CarData.z", "car 1"), ("CarData.z", "car 2"), ("RCM", "rcm 1"), ("CarData.z", "car 3")])
+        assert queue.depth == 3
+        queue.start()
+        await queue.close()
+
+    asyncio.run(run())
+    assert sorted(handled) == sorted(expected)
+    assert queue.metrics()["max_depth"] == 3
+    assert queue.dropped + queue.coalesced == 1
+
+
+def test_realtime_queue_blocks_producer_and_keeps_topic_order():
+    handled = []
+    release = None
+
+    async def handle(message):
+        await release.wait()
+        handled.append(message)
+
+    queue = RealtimeQueue(handle, maxsize=2, overflow="block", workers=3)
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        queue.start()
+        producer = asyncio.create_task(_fill(queue, [("T", i) for i in range(6)]))
+        await asyncio.sleep(0.05)
+        # One message is being handled and two are queued; the producer waits.
+        assert not producer.done()
+        assert queue.depth == 2
+        release.set()
+        await producer
+        await queue.close()
+
+    asyncio.run(run())
+    assert handled == list(range(6))
+    assert queue.blocked_seconds > 0
+    assert queue.dropped == 0
+
+
+def test_realtime_queue_counts_callback_errors():
+    async def handle(message):
+        if message == "bad":
+            raise ValueError(message)
+
+    queue = RealtimeQueue(handle, maxsize=10, workers=1)
+
+    async def run():
+        queue.start()
+        await _fill(queue, [("T", "bad"), ("T", "good")])
+        await queue.close()
+
+    asyncio.run(run())
+    assert queue.metrics()["errors"] == 1
+    assert queue.metrics()["processed"] == 2
+
+
+def test_real_f1_client_batches_records_per_topic():
+    client = RealF1Client(topics=["RaceControlMessages"], workers=2)
+    calls = []
+
+    @client.callback("bulk", batch_size=3)
+    async def bulk(records):
+        calls.append({topic: [record["Message"] for record in rows] for topic, rows in records.items()})
+
+    async def run():
+        client.ingest_queue.start()
+        await client._receive(**_rcm_frame("A", "B"))
+        await client._receive(**_rcm_frame("C", "D"))
+        await client.ingest_queue.close()
+        assert client._templates["bulk"].pending == {"RaceControlMessages": 1}
+        # Records still pending are delivered when the client stops.
+        await client.flush_batches()
+
+    asyncio.run(run())
+    assert calls == [{"RaceControlMessages": ["A", "B", "C"]}, {"RaceControlMessages": ["D"]}]
+    assert client._templates["bulk"].pending == {}
+
+
+def test_real_f1_client_batches_by_time_window():
+    client = RealF1Client(topics=["RaceControlMessages"])
+    calls = []
+
+    @client.callback("windowed", batch_size=100, batch_interval=0.05)
+    async def windowed(records):
+        calls.append(len(records["RaceControlMessages"]))
+
+    async def run():
+        client.ingest_queue.start()
+        timer = asyncio.ensure_future(client._flush_batches())
+        await client._receive(**_rcm_frame("A", "B"))
+        await client.ingest_queue.close()
+        assert calls == []
+        await asyncio.sleep(0.2)
+        timer.cancel()
+
+    asyncio.run(run())
+    assert calls == [2]
+
+
+def test_real_f1_client_reconnects_and_resubscribes():
+    websockets = pytest.importorskip("websockets")
+    from livef1 import configure
+
+    subscriptions = []
+
+    async def server(ws):
+        message = json.loads(await ws.recv())
+        subscriptions.append(message["A"][0])
+        snapshot = {"RaceControlMessages": {"Messages": [{"Message": f"snapshot {len(subscriptions)}"}]}}
+        await ws.send(json.dumps({"R": snapshot, "I": message["I"]}))
+        if len(subscriptions) == 1:
+            await ws.close()  # The first connection drops after the snapshot.
+        else:
+            await ws.wait_closed()
+
+    client = RealF1Client(topics=["RaceControlMessages"], stale_timeout=None)
+    received = []
+
+    @client.callback("collect")
+    async def collect(records):
+        received.extend(record["Message"] for record in records["RaceControlMessages"])
+
+    async def run():
+        async with websockets.serve(server, "127.0.0.1", 0) as ws_server:
+            port = ws_server.sockets[0].getsockname()[1]
+            params = MagicMock(socket_url=f"ws://127.0.0.1:{port}", headers={})
+            with patch("livef1.adapters.signalr_aio.transports._transport.WebSocketParameters", return_value=params):
+                task = asyncio.ensure_future(client._async_run())
+                for _ in range(100):
+                    if len(received) == 2:
+                        break
+                    await asyncio.sleep(0.05)
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    configure(realtime_reconnect_backoff=0.01)
+    try:
+        asyncio.run(run())
+    finally:
+        configure(realtime_reconnect_backoff=1.0)
+    assert subscriptions == [["RaceControlMessages"], ["RaceControlMessages"]]
+    # The snapshot sent after the reconnection reaches the callbacks again.
+    assert received == ["snapshot 1", "snapshot 2"]
+    assert client.reconnects == 1
+
+
+def test_real_f1_client_dropped_socket_leaves_no_tasks_behind():
+    websockets = pytest.importorskip("websockets")
+    import gc
+    from livef1 import configure
+
+    subscriptions = []
+
+    async def server(ws):
+        message = json.loads(await ws.recv())
+        subscriptions.append(message["A"][0])
+        snapshot = {"RaceControlMessages": {"Messages": [{"Message": f"snapshot {len(subscriptions)}"}]}}
+        await ws.send(json.dumps({"R": snapshot, "I": message["I"]}))
+        await ws.wait_closed()
+
+    client = RealF1Client(topics=["RaceControlMessages"], stale_timeout=None)
+    received = []
+    errors = []
+
+    @client.callback("collect")
+    async def collect(records):
+        received.extend(record["Message"] for record in records["RaceControlMessages"])
+
+    async def wait_for(count):
+        for _ in range(100):
+            if len(received) == count:
+                return
+            await asyncio.sleep(0.05)
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+        async with websockets.serve(server, "127.0.0.1", 0) as ws_server:
+            port = ws_server.sockets[0].getsockname()[1]
+            params = MagicMock(socket_url=f"ws://127.0.0.1:{port}", headers={})
+            with patch("livef1.adapters.signalr_aio.transports._transport.WebSocketParameters", return_value=params):
+                task = asyncio.ensure_future(client._async_run())
+                await wait_for(1)
+                # Drop the open websocket, as a stale stream does.
+                client._connection.reconnect()
+                await wait_for(2)
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                await asyncio.sleep(0.2)
+                gc.collect()
+
+    configure(realtime_reconnect_backoff=0.01)
+    try:
+        asyncio.run(run())
+    finally:
+        configure(realtime_reconnect_backoff=1.0)
+    assert received == ["snapshot 1", "snapshot 2"]
+    # No reconnection once the client has stopped, and no orphaned handler task.
+    assert subscriptions == [["RaceControlMessages"], ["RaceControlMessages"]]
+    assert errors == []
+    assert client._connection.transport._closing
+
+
+def test_real_f1_client_detects_stale_stream():
+    client = RealF1Client(topics=["RaceControlMessages"], stale_timeout=5)
+    client._connection = MagicMock()
+    assert not client._stale()
+    client._t_last_message = time.time() - 1
+    assert not client._stale()
+    client._t_last_message = time.time() - 10
+    assert client._stale()
+
+    async def run():
+        task = asyncio.ensure_future(client._forever_check())
+        await asyncio.sleep(1.1)
+        task.cancel()
+
+    asyncio.run(run())
+    client._connection.reconnect.assert_called_once()
+    assert not client._stale()
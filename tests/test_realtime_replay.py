@@ -0,0 +1,121 @@
+"""Tests for livef1.adapters.realtime_replay."""
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from livef1.adapters.realtime_client import RealF1Client
+from livef1.adapters.realtime_replay import FrameRecorder, load_frames, read_recording
+from livef1.utils.exceptions import ArgumentError
+
+
+def _rcm_frame(text):
+    return {"M": [{"H": "Streaming", "M": "feed", "A": ["RaceControlMessages", {"Messages": [{"Message": text}]}, "2024-03-02T15:00:00.000Z"]}]}
+
+
+def _collecting_client(**kwargs):
+    client = RealF1Client(topics=["RaceControlMessages", "TrackStatus"], **kwargs)
+    received = []
+
+    @client.callback("collect")
+    async def collect(records):
+        for topic, rows in records.items():
+            received.extend((topic, row.get("Message") or row.get("Status")) for row in rows)
+
+    return client, received
+
+
+def test_recorded_frames_replay_through_callbacks(tmp_path):
+    path = tmp_path / "race.ndjson.gz"
+    recorder = FrameRecorder(path)
+    recorder.write({"R": {"RaceControlMessages": {"Messages": [{"Message": "snapshot"}]}}, "I": "0"}, 100.0)
+    recorder.write({"C": "d-1", "M": []}, 100.5)
+    for i in range(3):
+        recorder.write(_rcm_frame(f"update {i}"), 101.0 + i)
+    recorder.close()
+    assert recorder.frames == 5
+    assert [received for received, _ in read_recording(path)] == [100.0, 100.5, 101.0, 102.0, 103.0]
+
+    client, received = _collecting_client()
+    stats = client.replay(str(path), speed=None)
+
+    assert received == [("RaceControlMessages", "snapshot")] + [("RaceControlMessages", f"update {i}") for i in range(3)]
+    assert stats["frames"] == 5
+    assert stats["messages"] == 4
+    assert stats["messages_per_second"] > 0
+    assert 0 <= stats["latency_p50"] <= stats["latency_p99"] <= stats["latency_max"]
+    # The replay only sends the subscription, the recording holds the answers.
+    assert client._connection.transport.sent[0]["M"] == "Subscribe"
+
+
+def test_client_records_received_frames(tmp_path):
+    path = tmp_path / "frames.ndjson"
+    client, _ = _collecting_client(record_file=str(path))
+
+    async def run():
+        batch_timer = client._start_ingest()
+        await client._receive(**_rcm_frame("A"))
+        await client._stop_ingest(batch_timer)
+
+    asyncio.run(run())
+    ((received, frame),) = list(read_recording(path))
+    assert frame == _rcm_frame("A")
+    assert received == pytest.approx(client._t_last_message)
+
+
+def test_json_stream_archives_replay_in_time_order(tmp_path):
+    (tmp_path / "RaceControlMessages.jsonStream").write_text(
+        '﻿00:00:00.100{"Messages":[{"Message":"first"}]}\r\n'
+        '00:00:00.300{"Messages":[{"Message":"third"}]}\r\n',
+        encoding="utf-8",
+    )
+    (tmp_path / "TrackStatus.jsonStream").write_text('00:00:00.200{"Status":"2","Message":"Yellow"}\r\n', encoding="utf-8")
+    (tmp_path / "Heartbeat.jsonStream").write_text('00:00:00.000{"Utc":"2024-03-02T15:00:00Z"}\r\n', encoding="utf-8")
+
+    frames = list(load_frames(tmp_path, topics=["RaceControlMessages", "TrackStatus"], start=datetime(2024, 3, 2, 15)))
+    assert [frame["M"][0]["A"][0] for _, frame in frames] == ["RaceControlMessages", "TrackStatus", "RaceControlMessages"]
+    assert frames[0][1]["M"][0]["A"][2] == "2024-03-02T15:00:00.100000Z"
+
+    client, received = _collecting_client()
+    stats = client.replay(str(tmp_path), speed=2)
+    assert [text for _, text in received] == ["first", "Yellow", "third"]
+    # 0.2 seconds of session time at twice the speed.
+    assert stats["seconds"] >= 0.1
+
+    with pytest.raises(ArgumentError):
+        load_frames(tmp_path, topics=["CarData.z"])
+
+
+def test_client_replays_twice(tmp_path):
+    path = tmp_path / "race.ndjson"
+    recorder = FrameRecorder(path)
+    for i in range(5):
+        recorder.write(_rcm_frame(f"update {i}"), 100.0 + i)
+    recorder.close()
+
+    client, received = _collecting_client()
+    first = client.replay(str(path), speed=None)
+    second = client.replay(str(path), speed=None)
+
+    assert first["messages"] == second["messages"] == 5
+    assert len(received) == 10
+    assert client.ingest_queue.depth == 0
+    assert client.ingest_queue.errors == 0
+
+
+def test_client_files_reopen_for_each_run(tmp_path):
+    source = tmp_path / "race.ndjson"
+    recorder = FrameRecorder(source)
+    recorder.write(_rcm_frame("A"), 100.0)
+    recorder.close()
+
+    log_path, record_path = tmp_path / "log.ndjson", tmp_path / "frames.ndjson"
+    client, _ = _collecting_client(log_file_name=str(log_path), record_file=str(record_path))
+    client.replay(str(source), speed=None)
+    client.replay(str(source), speed=None)
+
+    assert len(list(read_recording(record_path))) == 2
+    lines = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert [line["record"]["Message"] for line in lines] == ["A", "A"]
+    assert client._log_sink.metrics()["errors"] == 0
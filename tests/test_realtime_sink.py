@@ -0,0 +1,73 @@
+"""Tests for livef1.adapters.realtime_sink."""
+import asyncio
+import gzip
+import json
+import time
+
+from livef1.adapters.realtime_client import RealF1Client
+from livef1.adapters.realtime_sink import FileSink
+
+
+def _lines(path, compressed=False):
+    opener = gzip.open if compressed else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle]
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_file_sink_writes_on_size_and_interval(tmp_path):
+    path = tmp_path / "records.ndjson"
+    sink = FileSink(path, flush_size=3, flush_interval=0.1)
+    sink.write_many([{"n": 1}, {"n": 2}])
+    assert sink.queue_size == 2
+    # Below flush_size, the records are written once the interval passed.
+    assert _wait_for(lambda: sink.written == 2)
+    sink.write_many([{"n": 3}, {"n": 4}, {"n": 5}])
+    assert _wait_for(lambda: sink.written == 5)
+    sink.write({"when": time})  # Not JSON serializable: written as a string.
+    sink.close()
+
+    assert [line.get("n") for line in _lines(path)] == [1, 2, 3, 4, 5, None]
+    metrics = sink.metrics()
+    assert metrics["queue_size"] == 0
+    assert metrics["written"] == 6
+    assert metrics["flushes"] == 3
+    assert 0 <= metrics["flush_lag"] <= metrics["max_flush_lag"]
+
+
+def test_file_sink_rotates_compressed_files(tmp_path):
+    path = tmp_path / "records.ndjson.gz"
+    sink = FileSink(path, flush_size=10, flush_interval=None, max_bytes=100, backup_count=2)
+    for batch in range(4):
+        sink.write_many({"batch": batch, "n": n} for n in range(10))
+        assert _wait_for(lambda: sink.written == 10 * (batch + 1))
+    sink.close()
+
+    # Every batch exceeds max_bytes, so each one ends in its own file and
+    # only the two most recent backups are kept.
+    assert {line["batch"] for line in _lines(f"{path}.1", compressed=True)} == {3}
+    assert {line["batch"] for line in _lines(f"{path}.2", compressed=True)} == {2}
+    assert not (tmp_path / "records.ndjson.gz.3").exists()
+    assert _lines(path, compressed=True) == []
+
+
+def test_real_f1_client_logs_records_as_json_lines(tmp_path):
+    path = tmp_path / "session.ndjson"
+    client = RealF1Client(topics=["RaceControlMessages"], log_file_name=str(path))
+    frame = {"M": [{"H": "Streaming", "M": "feed", "A": ["RaceControlMessages", {"Messages": [{"Message": "A"}]}, "2024-03-02T15:00:00.000Z"]}]}
+
+    async def run():
+        batch_timer = client._start_ingest()
+        await client._receive(**frame)
+        await client._stop_ingest(batch_timer)
+
+    asyncio.run(run())
+    (line,) = _lines(path)
+    assert line["topic"] == "RaceControlMessages"
+    assert line["record"]["Message"] == "A"
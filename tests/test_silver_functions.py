@@ -1,12 +1,18 @@
 """Tests for livef1.data_processing.silver_functions."""
 import pytest
+import numpy as np
 import pandas as pd
+from livef1.config import configure
 from livef1.data_processing.silver_functions import (
+    add_distance_by_lap,
     add_distance_to_lap,
+    add_asof_columns,
     add_track_status,
     add_track_status_telemetry,
     add_lineposition,
     assign_regions,
+    generate_car_telemetry_table,
+    generate_laps_table,
     generate_race_control_messages_table,
 )
 from unittest.mock import MagicMock
@@ -24,6 +30,29 @@ def test_add_distance_to_lap_empty():
     assert "Distance" not in result.columns or result.empty
 
 
+def test_add_distance_by_lap_matches_per_lap():
+    rng = np.random.default_rng(0)
+    n = 40
+    tel = pd.DataFrame({
+        "DriverNo": ["1"] * 20 + ["44"] * 20,
+        "LapNo": [1.0] * 8 + [2.0] * 12 + [np.nan] * 2 + [1.0] * 18,
+        "timestamp": pd.to_timedelta(np.tile(np.arange(20) * 0.27, 2), unit="s"),
+        "Speed": rng.uniform(80, 330, n),
+        "X": rng.uniform(-500, 500, n),
+        "Y": rng.uniform(-500, 500, n),
+    })
+    tel.loc[8, "X"] = np.nan  # first sample of lap 2 without a position
+    tel.loc[3, "Speed"] = np.nan
+
+    result = add_distance_by_lap(tel.copy(), 100.0, 50.0, 1.0, -1.0, by=["DriverNo", "LapNo"])
+
+    expected = pd.Series(np.nan, index=tel.index)
+    for _, lap_df in tel.dropna(subset="LapNo").groupby(["DriverNo", "LapNo"]):
+        expected[lap_df.index] = add_distance_to_lap(lap_df.copy(), 100.0, 50.0, 1.0, -1.0)["Distance"]
+    pd.testing.assert_series_equal(result["Distance"], expected, check_names=False)
+    assert result.loc[8:19, "Distance"].isna().all()
+
+
 def test_add_track_status(sample_laps_df, sample_track_status_df):
     laps = sample_laps_df.copy()
     laps["LapStartTime"] = pd.to_timedelta(laps["LapStartTime"])
@@ -43,6 +72,34 @@ def test_add_lineposition(sample_telemetry_df, sample_tmg_df):
     assert "Position" in result.columns
 
 
+def test_add_asof_columns():
+    tel = pd.DataFrame({
+        "timestamp": pd.to_timedelta(["00:00:01", "00:00:05", "00:00:10", None, "00:00:20"]),
+        "Speed": [100, 110, 120, 130, 140],
+    })
+    tyres = pd.DataFrame({
+        "timestamp": pd.to_timedelta(["00:00:10", "00:00:02", "00:00:15"]),
+        "Compound": ["HARD", "SOFT", None],
+        "TotalLaps": [0, 3, 1],
+    })
+    result = add_asof_columns(tel, tyres, {"Compound": "Compound", "TotalLaps": "TyreAge"})
+    assert result is tel
+    assert len(result) == 5
+    assert result["Compound"].tolist()[1:3] == ["SOFT", "HARD"]
+    assert result["Compound"].tolist()[4] == "HARD"  # missing values are carried forward
+    assert result["TyreAge"].tolist()[4] == 1
+    assert result[["Compound", "TyreAge"]].iloc[[0, 3]].isna().all().all()
+
+
+def test_add_track_status_telemetry_uses_status_in_effect(sample_track_status_df):
+    tel = pd.DataFrame({
+        "SessionKey": [9465] * 3,
+        "timestamp": pd.to_timedelta(["0 days 01:29:30", "0 days 01:30:30", "0 days 01:31:00"]),
+    })
+    result = add_track_status_telemetry(tel, sample_track_status_df)
+    assert result["TrackStatus"].tolist() == ["1", "2", "2"]
+
+
 def test_assign_regions():
     tel_cor = pd.DataFrame({"Distance": [0, 500, 1000, 2000, 5000]})
     df_corners = pd.DataFrame({
@@ -68,6 +125,26 @@ def test_assign_regions_wraparound():
     assert len(result) == 2
 
 
+def test_assign_regions_matches_per_region_masks():
+    rng = np.random.default_rng(1)
+    df_corners = pd.DataFrame({
+        "name": [f"R{i}" for i in range(12)],
+        "corner_start": rng.integers(0, 5000, 12).astype(float),
+        "corner_end": rng.integers(0, 5000, 12).astype(float),
+    })
+    distance = np.concatenate([rng.uniform(-100, 5100, 500), df_corners["corner_start"], df_corners["corner_end"], [np.nan]])
+    tel_cor = pd.DataFrame({"Distance": distance})
+
+    conditions = [
+        (tel_cor["Distance"] >= row["corner_start"]) & (tel_cor["Distance"] < row["corner_end"]) if row["corner_end"] >= row["corner_start"]
+        else (tel_cor["Distance"] >= row["corner_start"]) | (tel_cor["Distance"] < row["corner_end"])
+        for _, row in df_corners.iterrows()
+    ]
+    expected = np.select(conditions, df_corners["name"].tolist(), default=None)
+
+    assert assign_regions(tel_cor, df_corners).tolist() == expected.tolist()
+
+
 def test_generate_race_control_messages_table(mock_session):
     rcm_df = pd.DataFrame({
         "SessionKey": [9465, 9465],
@@ -87,3 +164,186 @@ def test_generate_race_control_messages_table(mock_session):
     assert "SessionKey" in result.columns
     assert "Message" in result.columns
     assert "Category" in result.columns
+
+
+_TIMING_COLS = [
+    "NumberOfLaps", "LastLapTime_Value", "InPit", "PitOut",
+    "Sectors_0_Value", "Sectors_1_Value", "Sectors_2_Value",
+    "Sectors_0_PreviousValue", "Sectors_1_PreviousValue", "Sectors_2_PreviousValue",
+    "Speeds_I1_Value", "Speeds_I2_Value", "Speeds_FL_Value", "Speeds_ST_Value",
+    "Position", "GapToLeader", "IntervalToPositionAhead_Value", "RacingNumber", "Stopped", "_deleted",
+]
+
+
+def _timing_frame(rows):
+    df = pd.DataFrame(rows)
+    df["timestamp"] = pd.to_timedelta(df.pop("t"), unit="s").astype(str).str.replace("0 days ", "")
+    df["SessionKey"] = 9465
+    for col in _TIMING_COLS:
+        if col not in df:
+            df[col] = np.nan
+    return df
+
+
+def _random_timing(seed, n_drivers=3, n_laps=8):
+    """Timing updates with duplicates, late corrections, previous values, pit stops and stops."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for driver in range(1, n_drivers + 1):
+        drv = str(driver)
+        t = 60 + rng.uniform(0, 5)
+        for _ in range(n_laps):
+            sectors = rng.uniform(25, 35, 3).round(3)
+            for k in range(3):
+                for _ in range(rng.integers(1, 4)):
+                    row = {"DriverNo": drv, "t": t + rng.uniform(0, sectors[k])}
+                    field = rng.integers(0, 5)
+                    if field == 0:
+                        row[f"Speeds_{rng.choice(['I1', 'I2', 'FL', 'ST'])}_Value"] = str(rng.integers(200, 330))
+                    elif field == 1:
+                        row["Position"] = str(rng.integers(1, 21))
+                    elif field == 2:
+                        row["GapToLeader"] = rng.choice([f"+{rng.uniform(0, 30):.3f}", "LAP 3", "1L", ""])
+                        row["IntervalToPositionAhead_Value"] = rng.choice([f"+{rng.uniform(0, 3):.3f}", "1L"])
+                    elif field == 3:
+                        row["InPit" if rng.random() < 0.5 else "PitOut"] = True
+                    else:
+                        row["RacingNumber"] = drv
+                    rows.append(row)
+                t += sectors[k]
+                row = {"DriverNo": drv, "t": t, f"Sectors_{k}_Value": f"{sectors[k]:.3f}"}
+                if k == 2 and rng.random() < 0.8:
+                    row["LastLapTime_Value"] = f"1:{sectors.sum() - 60:06.3f}"
+                rows.append(row)
+                p = rng.random()
+                if p < 0.15:
+                    rows.append({"DriverNo": drv, "t": t + 1, f"Sectors_{k}_Value": f"{sectors[k]:.3f}"})
+                elif p < 0.25:
+                    rows.append({"DriverNo": drv, "t": t + rng.uniform(5, 20), f"Sectors_{k}_Value": f"{sectors[k] + 0.1:.3f}"})
+                elif p < 0.35:
+                    rows.append({"DriverNo": drv, "t": t + 2, f"Sectors_{k}_PreviousValue": f"{sectors[k]:.3f}"})
+                elif p < 0.38:
+                    rows.append({"DriverNo": drv, "t": t + 0.5, "Stopped": True})
+    return _timing_frame(sorted(rows, key=lambda row: row["t"]))
+
+
+def _laps_inputs(session_type="Race"):
+    session = MagicMock()
+    session.type = session_type
+    session.first_datetime = pd.Timestamp("2024-03-02 15:00:00")
+    session.session_start_datetime = pd.Timestamp("2024-03-02 15:00:00")
+    session.drivers = {}
+    session.topic_names_info = {}
+    df_rcm = pd.DataFrame({"Category": ["Other"], "Message": ["CAR 1 (VER) LAP DELETED - TRACK LIMITS AT TURN 4 LAP 3 15:00:00"]})
+    df_tyre = pd.DataFrame({"timestamp": ["00:01:00"], "DriverNo": ["1"], "Compound": ["SOFT"], "New": [True], "TotalLaps": [0]})
+    df_track = pd.DataFrame({"timestamp": pd.to_timedelta(["00:00:10", "00:05:00"]), "Status": ["1", "2"], "Message": ["AllClear", "Yellow"]})
+    return session, df_rcm, df_tyre, df_track
+
+
+def _with_none(df):
+    # The row-by-row builder leaves None in columns that a driver never filled.
+    return df.astype(object).where(df.notna(), None)
+
+
+def _generate_laps(df_exp, session_type="Race", vectorized=True):
+    session, df_rcm, df_tyre, df_track = _laps_inputs(session_type)
+    if vectorized:
+        configure(vectorized_laps=True)
+    else:
+        with pytest.warns(FutureWarning, match="1.4.0"):
+            configure(vectorized_laps=False)
+    try:
+        return generate_laps_table(session, df_exp.copy(), df_rcm, df_tyre, df_track)
+    finally:
+        configure(vectorized_laps=True)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_generate_laps_table_vectorized_matches_row_by_row(seed):
+    df_exp = _random_timing(seed)
+    session_type = "Race" if seed % 2 == 0 else "Qualifying"
+    expected = _generate_laps(df_exp, session_type, vectorized=False)
+    result = _generate_laps(df_exp, session_type, vectorized=True)
+    pd.testing.assert_frame_equal(_with_none(result), _with_none(expected))
+
+
+def test_generate_laps_table_vectorized_laps():
+    df_exp = _timing_frame([
+        {"DriverNo": "1", "t": 100, "Position": "3", "GapToLeader": "+1.5"},
+        {"DriverNo": "1", "t": 130, "Sectors_0_Value": "30.000"},
+        {"DriverNo": "1", "t": 131, "Sectors_0_Value": "30.000"},
+        {"DriverNo": "1", "t": 160, "Sectors_1_Value": "30.000", "Speeds_ST_Value": "310"},
+        {"DriverNo": "1", "t": 190, "Sectors_2_Value": "30.000", "LastLapTime_Value": "1:30.000", "Position": "2"},
+        {"DriverNo": "1", "t": 200, "InPit": True, "GapToLeader": "1L"},
+        {"DriverNo": "1", "t": 220, "Sectors_0_Value": "30.000"},
+        {"DriverNo": "1", "t": 225, "PitOut": True},
+        {"DriverNo": "1", "t": 250, "Sectors_1_Value": "30.000"},
+        {"DriverNo": "1", "t": 280, "Sectors_2_Value": "30.500"},
+        {"DriverNo": "1", "t": 290, "Sectors_0_Value": "10.000"},
+        {"DriverNo": "44", "t": 150, "Position": "1"},
+    ])
+    laps = _generate_laps(df_exp)
+    pd.testing.assert_frame_equal(_with_none(laps), _with_none(_generate_laps(df_exp, vectorized=False)))
+    assert laps["DriverNo"].tolist() == ["1", "1"]
+    assert laps["LapNo"].tolist() == [1, 2]
+    assert laps["LapTime"].tolist() == [pd.Timedelta("90s"), pd.Timedelta("90.5s")]
+    assert laps["Sector3_Time"].tolist() == [pd.Timedelta("30s"), pd.Timedelta("30.5s")]
+    assert laps["Position"].tolist() == ["3", "2"]
+    assert laps["NoPits"].tolist() == [0, 1]
+    assert laps["PitIn"].tolist()[1] == pd.Timedelta("200s")
+    assert laps["Speed_ST"].tolist()[0] == 310.0
+    assert laps["GapToLeader"].isna().tolist() == [False, True]
+    assert laps["LapStartTime"].tolist()[1] == pd.Timedelta("190s")
+
+
+def _telemetry_inputs(n_drivers=3, n_laps=3, lap_s=30, hz=4):
+    t0 = pd.Timestamp("2024-03-02 15:00:00")
+    rng = np.random.default_rng(0)
+    cars, positions, laps, tmg = [], [], [], []
+    for driver in range(1, n_drivers + 1):
+        drv = str(driver)
+        start = 60 + driver / 10
+        t = start + np.arange(n_laps * lap_s * hz) / hz
+        n = len(t)
+        cars.append(pd.DataFrame({
+            "SessionKey": 9465, "timestamp": pd.to_timedelta(t, unit="s").astype(str),
+            "Utc": (t0 + pd.to_timedelta(t, unit="s")).strftime("%Y-%m-%dT%H:%M:%S.%fZ"), "DriverNo": drv,
+            "RPM": rng.uniform(9000, 12000, n), "Speed": rng.uniform(80, 330, n), "GearNo": rng.integers(1, 9, n),
+            "Throttle": rng.uniform(0, 100, n), "Brake": rng.integers(0, 2, n), "DRS": rng.integers(0, 14, n),
+        }))
+        angle = (t + 0.1) / lap_s * 2 * np.pi
+        positions.append(pd.DataFrame({
+            "SessionKey": 9465, "timestamp": pd.to_timedelta(t + 0.1, unit="s").astype(str),
+            "Utc": (t0 + pd.to_timedelta(t + 0.1, unit="s")).strftime("%Y-%m-%dT%H:%M:%S.%fZ"), "DriverNo": drv,
+            "Status": "OnTrack", "X": 1000 * np.cos(angle), "Y": 1000 * np.sin(angle), "Z": rng.uniform(0, 10, n),
+        }))
+        laps.append(pd.DataFrame({
+            "DriverNo": drv, "LapNo": np.arange(1, n_laps + 1),
+            "LapStartDate": t0 + pd.to_timedelta(start + np.arange(n_laps) * lap_s, unit="s"),
+            "LapTime": pd.to_timedelta(np.full(n_laps, lap_s), unit="s"),
+        }))
+        tmg.append(pd.DataFrame({"DriverNo": drv, "timestamp": pd.to_timedelta(start + np.arange(0, n_laps * lap_s, 7.3), unit="s"), "Position": drv}))
+    session = MagicMock()
+    session.first_datetime = t0
+    session.data_lake.silver.lake = {"laps": MagicMock(df=pd.concat(laps, ignore_index=True))}
+    session.meeting.circuit.start_coordinates = [1000.0, 5.0]
+    session.meeting.circuit.start_direction = [1.0, 1.0]
+    df_tyre = pd.DataFrame({"timestamp": ["00:01:00", "00:01:30"], "DriverNo": ["1", "2"], "Compound": ["SOFT", "HARD"], "New": [True, False], "TotalLaps": [0, 3]})
+    df_track = pd.DataFrame({"timestamp": pd.to_timedelta(["00:00:10", "00:01:40"]), "Status": ["1", "2"], "Message": ["AllClear", "Yellow"]})
+    df_circuits = pd.DataFrame({"name": ["T1", "T2"], "corner_start": [0, 300], "corner_end": [300, 100]})
+    return (
+        session, pd.concat(cars, ignore_index=True), pd.concat(positions, ignore_index=True), df_tyre, None,
+        df_track, pd.concat(tmg, ignore_index=True), df_circuits,
+    )
+
+
+def test_generate_car_telemetry_table_parallel_matches_serial():
+    expected = generate_car_telemetry_table(*_telemetry_inputs())
+    configure(parallel_telemetry=True, telemetry_workers=2)
+    try:
+        result = generate_car_telemetry_table(*_telemetry_inputs())
+    finally:
+        configure(parallel_telemetry=False, telemetry_workers=None)
+    pd.testing.assert_frame_equal(result, expected)
+    assert result["DriverNo"].unique().tolist() == ["1", "2", "3"]
+    assert result["Distance"].notna().any()
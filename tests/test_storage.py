@@ -0,0 +1,126 @@
+"""Tests for livef1.data_processing.storage and persistent DataLake tables."""
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+
+from livef1.config import configure
+from livef1.data_processing.data_models import SilverTable
+from livef1.data_processing.lakes import DataLake
+from livef1.data_processing.storage import PickleStorage, get_storage
+
+
+def _frame():
+    return pd.DataFrame(
+        {
+            "DriverNo": pd.Categorical(["1", "44"]),
+            "timestamp": pd.to_timedelta(["00:00:01", "00:00:02"]),
+            "Speed": pd.Series([100.0, 150.0], dtype="float32"),
+        }
+    )
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.path = "2024/2024-03-02_Bahrain/2024-03-02_Race/"
+    return session
+
+
+def test_pickle_storage_round_trip_keeps_dtypes(tmp_path):
+    storage = PickleStorage(tmp_path)
+    storage.write_table("bronze", "CarData.z", _frame())
+    assert storage.has_table("bronze", "CarData.z")
+    pd.testing.assert_frame_equal(storage.read_table("bronze", "CarData.z"), _frame())
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_pyarrow_storage_round_trip(tmp_path, format):
+    pytest.importorskip("pyarrow")
+    storage = get_storage(tmp_path, format)
+    storage.write_table("silver", "laps", _frame())
+    pd.testing.assert_frame_equal(storage.read_table("silver", "laps"), _frame())
+
+
+def test_get_storage_invalid_format(tmp_path):
+    with pytest.raises(ValueError, match="Invalid lake format"):
+        get_storage(tmp_path, "csv")
+    with pytest.raises(ValueError, match="Invalid lake_format"):
+        configure(lake_format="csv")
+
+
+def test_metadata_lists_only_stored_tables(tmp_path):
+    storage = PickleStorage(tmp_path)
+    storage.write_table("bronze", "CarData.z", _frame())
+    metadata = {
+        "CarData.z": {"table_type": "bronze", "created_at": pd.Timestamp("2024-03-02").to_pydatetime(), "generated": True},
+        "laps": {"table_type": "silver", "created_at": None, "generated": False},
+    }
+    storage.write_metadata(metadata)
+    assert storage.read_metadata() == {"CarData.z": metadata["CarData.z"]}
+
+
+def test_data_lake_reopens_stored_tables_lazily(tmp_path, session):
+    lake = DataLake(session, storage=PickleStorage(tmp_path))
+    lake.create_bronze_table("CarData.z", raw_data={}, parsed_data=[{"DriverNo": "1", "Speed": 100}])
+    silver = SilverTable("laps", sources=["CarData.z"], data_lake=lake)
+    silver.callback = lambda self: self.data_lake.get("bronze", "CarData.z").df.assign(Lap=1)
+    lake.put("silver", "laps", silver)
+    expected = silver.generate_table()
+
+    storage = PickleStorage(tmp_path)
+    storage.read_table = MagicMock(wraps=storage.read_table)
+    reopened = DataLake(session, storage=storage)
+    assert set(reopened.metadata) == {"CarData.z", "laps"}
+    assert reopened.is_stored("laps")
+
+    table = reopened.get("silver", "laps")
+    storage.read_table.assert_not_called()
+    pd.testing.assert_frame_equal(table.df, expected)
+    storage.read_table.assert_called_once_with("silver", "laps")
+
+
+def test_data_lake_put_reuses_stored_generated_table(tmp_path, session):
+    lake = DataLake(session, storage=PickleStorage(tmp_path))
+    silver = SilverTable("laps", sources=[], data_lake=lake)
+    silver.callback = lambda self: _frame()
+    lake.put("silver", "laps", silver)
+    silver.generate_table()
+
+    reopened = DataLake(session, storage=PickleStorage(tmp_path))
+    fresh = SilverTable("laps", sources=[], data_lake=reopened)
+    reopened.put("silver", "laps", fresh)
+    pd.testing.assert_frame_equal(fresh.df, _frame())
+
+
+def test_data_lake_default_storage_follows_settings(tmp_path, session):
+    configure(lake_dir=tmp_path, lake_format="pickle")
+    try:
+        lake = DataLake(session)
+    finally:
+        configure(lake_dir=None, lake_format="parquet")
+    assert isinstance(lake.storage, PickleStorage)
+    assert lake.storage.directory == tmp_path / "2024/2024-03-02_Bahrain/2024-03-02_Race"
+    assert DataLake(session).storage is None
+
+
+def test_data_lake_stored_table_stays_fresh_when_reopened(tmp_path, session):
+    session.check_data_name.side_effect = lambda name: name
+
+    def build(self):
+        return self.data_lake.get("bronze", "CarData.z").df.assign(Lap=1)
+
+    lake = DataLake(session, storage=PickleStorage(tmp_path))
+    lake.create_bronze_table("CarData.z", raw_data={}, parsed_data=[{"DriverNo": "1", "Speed": 100}], source="CarData.z:digest")
+    silver = SilverTable("laps", sources=["CarData.z"], data_lake=lake)
+    silver.callback = build
+    lake.put("silver", "laps", silver)
+    silver.generate_table()
+
+    storage = PickleStorage(tmp_path)
+    storage.read_table = MagicMock(wraps=storage.read_table)
+    reopened = DataLake(session, storage=storage)
+    registered = SilverTable("laps", sources=["CarData.z"], data_lake=reopened)
+    registered.callback = build
+    reopened.put("silver", "laps", registered)
+    assert reopened.fresh_tables([registered]) == {"laps"}
+    storage.read_table.assert_not_called()